@@ -160,29 +160,12 @@ def load_reference_data(file, force):
 
     logger.info(f"Loading reference tables: {csv_files}")
 
-    for csv_file in csv_files:
-        csv_path = data_dir / csv_file
-
-        if not csv_path.exists():
-            logger.warning(f"File {csv_path} not found.")
-            continue
-
-        try:
-            loader = ReferenceLoader(csv_path.name, batch_id)
-            if force:
-                # Temporarily override load strategy to full
-                loader.get_load_strategy = lambda: 'full'
-
-            success = loader.load_csv(csv_path)
-
-            if success:
-                click.echo(f"Successfully loaded {csv_path}")
-            else:
-                click.echo(f"Failed to load {csv_path}")
-
-        except Exception as e:
-            logger.error(f"Error loading {csv_path}: {e}")
-            click.echo(f"Error loading {csv_path}: {e}")
+    results = ReferenceLoader.load_all(data_dir, batch_id, db, force=force, csv_files=csv_files)
+    for csv_path, success in results.items():
+        if success:
+            click.echo(f"Successfully loaded {csv_path}")
+        else:
+            click.echo(f"Failed to load {csv_path}")
 
 
 @cli.command('load-stats')
@@ -195,32 +178,45 @@ def load_stats(force_all_constants):
   from src.transformers.league_constants_transformer import LeagueConstantsTransformer
   from sqlalchemy import text
 
+  from src.loaders.base_loader import BaseLoader
   batch_id = generate_batch_id()
 
+  # Start from fresh table layouts in case the schema was migrated since the last run
+  BaseLoader.clear_run_caches()
+
   # Phase 1 - Load raw data
   logger.info('Loading players...')
   players_loader = PlayersLoader(batch_id)
   players_loader.load_csv(Path("data/incoming/csv/players.csv"))
 
-  logger.info('Loading batting stats...')
-  batting_loader = BattingStatsLoader(batch_id=generate_batch_id())
-  batting_loader.load_csv(Path("data/incoming/csv/players_career_batting_stats.csv"))
-
-  logger.info('Loading pitching stats...')
-  pitching_loader = PitchingStatsLoader(batch_id=generate_batch_id())
-  pitching_loader.load_csv(Path("data/incoming/csv/players_career_pitching_stats.csv"))
-
-  # Load game-level stats for newspaper article generation
-  logger.info('Loading game batting stats...')
+  # Career and game stats only depend on players/reference data - load them in parallel
+  logger.info('Loading batting, pitching and game stats...')
   from src.loaders.game_stats_loader import GameBattingStatsLoader, GamePitchingStatsLoader
-  game_batting_loader = GameBattingStatsLoader(batch_id=generate_batch_id())
-  game_batting_loader.load_csv(Path("data/incoming/csv/players_game_batting.csv"))
-  click.echo("✓ Game batting stats loaded")
-
-  logger.info('Loading game pitching stats...')
-  game_pitching_loader = GamePitchingStatsLoader(batch_id=generate_batch_id())
-  game_pitching_loader.load_csv(Path("data/incoming/csv/players_game_pitching_stats.csv"))
-  click.echo("✓ Game pitching stats loaded")
+  from src.loaders.base_loader import load_files_concurrently
+  stats_results = load_files_concurrently([
+      (BattingStatsLoader(batch_id=generate_batch_id()), Path("data/incoming/csv/players_career_batting_stats.csv")),
+      (PitchingStatsLoader(batch_id=generate_batch_id()), Path("data/incoming/csv/players_career_pitching_stats.csv")),
+      # Load game-level stats for newspaper article generation
+      (GameBattingStatsLoader(batch_id=generate_batch_id()), Path("data/incoming/csv/players_game_batting.csv")),
+      (GamePitchingStatsLoader(batch_id=generate_batch_id()), Path("data/incoming/csv/players_game_pitching_stats.csv")),
+  ])
+  stats_labels = {
+      'players_career_batting_stats': 'Career batting stats',
+      'players_career_pitching_stats': 'Career pitching stats',
+      'players_game_batting_stats': 'Game batting stats',
+      'players_game_pitching_stats': 'Game pitching stats',
+  }
+  for target_table, label in stats_labels.items():
+      if stats_results.get(target_table):
+          click.echo(f"✓ {label} loaded")
+      else:
+          click.echo(f"✗ {label} failed to load")
+
+  # League constants are derived from these tables - never compute them from a partial load
+  failed_tables = [table for table in stats_labels if not stats_results.get(table)]
+  if failed_tables:
+      logger.error(f"Stats load failed for {', '.join(failed_tables)} - skipping league constants")
+      return
 
   # Phase 2 - Calculate league constants
   logger.info('Calculating league constants...')
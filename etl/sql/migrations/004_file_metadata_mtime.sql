@@ -0,0 +1,7 @@
+-- Migration: Track CSV mtime alongside the stored checksum
+-- Date: 2026-10-17
+-- Purpose: Let skip-strategy reference loads detect unchanged files with a stat() instead of hashing them
+
+ALTER TABLE etl_file_metadata ADD COLUMN IF NOT EXISTS last_mtime_ns BIGINT;
+
+COMMENT ON COLUMN etl_file_metadata.last_mtime_ns IS 'File mtime (st_mtime_ns) when checksum was stored';
@@ -54,6 +54,7 @@ CREATE TABLE IF NOT EXISTS etl_file_metadata (
     file_size BIGINT,
     row_count INTEGER,
     checksum VARCHAR(64),
+    last_mtime_ns BIGINT,  -- file mtime when checksum was stored; skip-strategy loads compare this before hashing
     load_strategy VARCHAR(20) NOT NULL DEFAULT 'full' CHECK (load_strategy IN ('full', 'incremental', 'skip', 'append')),
     last_processed TIMESTAMP,
     last_batch_id UUID REFERENCES etl_batch_runs(batch_id),
@@ -544,14 +544,8 @@
       PERFORM refresh_sub_league_pitching_environment(target_year);
 
       -- Phase C: Apply to Player Stats - BATTING (NEW)
-      RAISE NOTICE 'Calculating player wOBA...';
-      PERFORM refresh_player_woba(target_year);
-
-      RAISE NOTICE 'Calculating player wRAA...';
-      PERFORM refresh_player_wraa(target_year);
-
-      RAISE NOTICE 'Calculating player wRC...';
-      PERFORM refresh_player_wrc(target_year);
+      RAISE NOTICE 'Calculating player wOBA, wRAA and wRC...';
+      PERFORM refresh_player_batting_runs(target_year);
 
       RAISE NOTICE 'Calculating player wRC+...';
       PERFORM refresh_player_wrc_plus(target_year);
@@ -741,6 +735,72 @@
   END;
   $$ LANGUAGE plpgsql;
 
+  -- Function to calculate wOBA, wRAA and wRC in a single pass
+  -- Same results as refresh_player_woba -> refresh_player_wraa -> refresh_player_wrc,
+  -- but each row is rewritten once instead of three times. wRAA/wRC are derived from
+  -- the freshly rounded wOBA; rows where that is NULL (or with no league_runs_per_out
+  -- row, for wRC) keep their previous value, as they did with the separate functions.
+  CREATE OR REPLACE FUNCTION refresh_player_batting_runs(target_year INTEGER DEFAULT NULL)
+  RETURNS void AS $$
+  BEGIN
+      UPDATE players_career_batting_stats b
+      SET
+          woba = c.woba,
+          wraa = CASE
+              WHEN c.woba IS NULL THEN b.wraa
+              ELSE ROUND(
+                  ((c.woba - c.league_woba) / c.woba_scale) * b.pa,
+                  1
+              )
+          END,
+          wrc = CASE
+              WHEN c.woba IS NULL OR c.runs_per_pa_year IS NULL THEN b.wrc
+              ELSE ROUND(
+                  (((c.woba - c.league_woba) / c.woba_scale) + (c.runs_per_pa)) * b.pa,
+                  0
+              )::INTEGER
+          END,
+          last_updated = CURRENT_TIMESTAMP
+      FROM (
+          SELECT
+              b2.player_id, b2.year, b2.team_id, b2.split_id, b2.stint,
+              rv.woba AS league_woba,
+              rv.woba_scale,
+              lro.year AS runs_per_pa_year,
+              lro.runs_per_pa,
+              ROUND(
+                  (rv.woba_bb * (b2.bb - b2.ibb) +
+                   rv.woba_hbp * b2.hp +
+                   rv.woba_1b * (b2.h - b2.d - b2.t - b2.hr) +
+                   rv.woba_2b * b2.d +
+                   rv.woba_3b * b2.t +
+                   rv.woba_hr * b2.hr) /
+                  NULLIF(b2.ab + b2.bb - b2.ibb + b2.sf + b2.hp, 0),
+                  3
+              ) AS woba
+          FROM players_career_batting_stats b2
+          JOIN run_values rv
+              ON b2.year = rv.year
+              AND b2.league_id = rv.league_id
+              AND b2.sub_league_id = rv.sub_league_id
+          LEFT JOIN league_runs_per_out lro
+              ON rv.year = lro.year
+              AND rv.league_id = lro.league_id
+              AND rv.sub_league_id = lro.sub_league_id
+          WHERE b2.split_id = 1
+            AND b2.league_id <> 0  -- FILTER: Exclude league_id=0 (free agents/invalid records)
+            AND (target_year IS NULL OR b2.year = target_year)
+      ) c
+      WHERE b.player_id = c.player_id
+        AND b.year = c.year
+        AND b.team_id = c.team_id
+        AND b.split_id = c.split_id
+        AND b.stint = c.stint;
+
+      RAISE NOTICE 'wOBA/wRAA/wRC calculation complete for year %', COALESCE(target_year::text, 'ALL');
+  END;
+  $$ LANGUAGE plpgsql;
+
   -- Function to calculate wRC+ (park and league adjusted)
   -- Depends on wRAA being calculated first
   -- Uses old-style FROM clause syntax to avoid PostgreSQL UPDATE-FROM-JOIN reference issues
@@ -78,6 +78,33 @@ class DatabaseConnection:
             return result
 
 
+    def execute_raw(self, sql: str, params=None) -> int:
+        """Execute a fixed internal statement on a pooled psycopg2 connection
+
+        Skips SQLAlchemy's statement compilation and result wrapping for small
+        bookkeeping statements. Parameters use psycopg2 style (%(name)s).
+        Returns the affected row count.
+        """
+        raw_conn = self.engine.raw_connection()
+        try:
+            with raw_conn.cursor() as cursor:
+                cursor.execute(sql, params)
+                rowcount = cursor.rowcount
+            raw_conn.commit()
+            return rowcount
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+
+
+    def execute_autocommit(self, sql, params=None):
+        """Execute SQL outside a transaction block (e.g. CREATE/DROP INDEX CONCURRENTLY)"""
+        with self.engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+            return conn.execute(sql, params or {})
+
+
 # Global connection instance
 db = DatabaseConnection()
 
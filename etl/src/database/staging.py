@@ -3,9 +3,68 @@ from pandas.core.interchange.dataframe_protocol import DataFrame
 from sqlalchemy import text, inspect
 from loguru import logger
 from .connection import db
+from concurrent.futures import ThreadPoolExecutor
+import io
+import mmap
+import os
 import pandas as pd
 
+class DataFrameCSVStream:
+    """Read-only file-like CSV view of a DataFrame for COPY FROM STDIN
+
+    Rows are rendered to CSV one slice at a time as COPY reads, so the full
+    CSV text of a large frame never has to exist in memory at once.
+    """
+
+    def __init__(self, df: pd.DataFrame, chunk_rows: int = 50_000):
+        self._df = df
+        self._chunk_rows = chunk_rows
+        self._pos = 0
+        self._current = io.StringIO()
+
+    def _next_chunk(self) -> bool:
+        if self._pos >= len(self._df):
+            return False
+        chunk = self._df.iloc[self._pos:self._pos + self._chunk_rows]
+        self._pos += self._chunk_rows
+        self._current = io.StringIO(chunk.to_csv(index=False, header=False))
+        return True
+
+    def read(self, size: int = -1) -> str:
+        parts = []
+        remaining = size
+        while size < 0 or remaining > 0:
+            data = self._current.read(remaining if size >= 0 else -1)
+            if data:
+                parts.append(data)
+                remaining -= len(data)
+            elif not self._next_chunk():
+                break
+        return ''.join(parts)
+
+
+class FileSegmentStream:
+    """Read-only file-like view of bytes [start, end) of a file for COPY FROM STDIN"""
+
+    def __init__(self, f, start: int, end: int):
+        self._f = f
+        self._f.seek(start)
+        self._remaining = end - start
+
+    def read(self, size: int = -1) -> bytes:
+        if size < 0 or size > self._remaining:
+            size = self._remaining
+        data = self._f.read(size)
+        self._remaining -= len(data)
+        return data
+
+
 class StagingTableManager:
+    # Files at least this large are split at line boundaries and copied over several
+    # connections at once (see copy_csv_file_to_staging)
+    PARALLEL_COPY_MIN_BYTES = 256 * 1024 * 1024
+    PARALLEL_COPY_SEGMENTS = min(os.cpu_count() or 1, 8)
+
     def __init__(self, connection=None):
         self.db = connection or db
         self.inspector = inspect(self.db.engine)
@@ -32,8 +91,15 @@ class StagingTableManager:
             raise
 
 
-    def create_staging_from_csv_structure(self, table_name: str, columns: dict, staging_prefix: str = "staging_"):
-        """Create staging table from CSV column definitions"""
+    def create_staging_from_csv_structure(self, table_name: str, columns: dict, staging_prefix: str = "staging_",
+                                          extra_columns: dict = None, generated_columns: dict = None):
+        """Create an UNLOGGED staging table from CSV column definitions
+
+        extra_columns holds columns that are not in the CSV (e.g. calculated fields)
+        so they are part of the CREATE TABLE instead of ALTERed in afterwards.
+        generated_columns maps name -> (type, expression) for STORED generated
+        columns, which Postgres fills in while the rows are copied in.
+        """
         staging_table = f"{staging_prefix}{table_name}"
         logger.info(f"Creating staging table: {staging_table}")
         try:
@@ -44,10 +110,17 @@ class StagingTableManager:
             column_defs = []
             for col_name, col_type in columns.items():
                 column_defs.append(f"{col_name} {col_type}")
+            for col_name, col_type in (extra_columns or {}).items():
+                if col_name not in columns:
+                    column_defs.append(f"{col_name} {col_type}")
+            for col_name, (col_type, expression) in (generated_columns or {}).items():
+                if col_name not in columns:
+                    column_defs.append(f"{col_name} {col_type} GENERATED ALWAYS AS ({expression}) STORED")
 
-            # Create SQL
+            # Staging rows are rebuilt from the CSV on every load and dropped after
+            # the upsert, so skip WAL for them - nothing needs to survive a crash
             sql = text(f"""
-                CREATE TABLE {staging_table} (
+                CREATE UNLOGGED TABLE {staging_table} (
                     {', '.join(column_defs)}
                 )""")
             self.db.execute_sql(sql)
@@ -115,8 +188,7 @@ class StagingTableManager:
     def drop_staging_table(self, staging_table: str):
         """Drop staging table if exists"""
         try:
-            sql = text(f"DROP TABLE IF EXISTS {staging_table} CASCADE")
-            self.db.execute_sql(sql)
+            self.db.execute_raw(f"DROP TABLE IF EXISTS {staging_table} CASCADE")
             logger.debug(f"Dropped staging table: {staging_table}")
         except Exception as e:
             logger.warning(f"Error dropping staging table {staging_table}: {e}")
@@ -145,3 +217,156 @@ class StagingTableManager:
         except Exception as e:
             logger.error(f"Error loading CSV into {staging_table}: {e}")
             raise
+
+    def copy_csv_file_to_staging(self, csv_path, staging_table: str, columns: list, where: str = None,
+                                 freeze: bool = False, parallel: bool = False) -> int:
+        """COPY a CSV file from disk into an existing staging table, skipping its header
+
+        columns are the staging names of the file's fields in file order, so the
+        header can be renamed without rewriting the file. where is an optional
+        COPY ... WHERE row filter, evaluated by Postgres as the rows are read.
+        freeze works as in copy_df_chunk_to_staging.
+
+        parallel=True lets files of PARALLEL_COPY_MIN_BYTES or more be split into
+        segments copied concurrently. Segments end at newlines, so a file with any
+        quoted field (which could hold a line break) falls back to a single COPY.
+        Each segment commits on its own connection, so freeze is not applied to a
+        split file.
+        """
+        if (parallel and self.PARALLEL_COPY_SEGMENTS > 1
+                and os.path.getsize(csv_path) >= self.PARALLEL_COPY_MIN_BYTES
+                and not self._csv_has_quoted_fields(csv_path)):
+            return self._copy_csv_file_segments(csv_path, staging_table, columns, where)
+
+        copy_options = "FORMAT csv, FREEZE true" if freeze else "FORMAT csv"
+        copy_sql = f"COPY {staging_table} ({', '.join(columns)}) FROM STDIN WITH ({copy_options})"
+        if where:
+            copy_sql += f" WHERE {where}"
+
+        raw_conn = self.db.engine.raw_connection()
+        try:
+            with raw_conn.cursor() as cursor, open(csv_path, 'rb') as f:
+                # The header is replaced by the explicit column list
+                f.readline()
+                cursor.execute("SET LOCAL synchronous_commit = off")
+                if freeze:
+                    cursor.execute(f"TRUNCATE {staging_table}")
+                cursor.copy_expert(copy_sql, f)
+                row_count = cursor.rowcount
+            raw_conn.commit()
+        except Exception as e:
+            raw_conn.rollback()
+            logger.error(f"Error copying {csv_path} into {staging_table}: {e}")
+            raise
+        finally:
+            raw_conn.close()
+
+        logger.debug(f"Copied {row_count} rows into {staging_table}")
+        return row_count
+
+    @staticmethod
+    def _csv_has_quoted_fields(csv_path) -> bool:
+        """True if any data row contains a double quote
+
+        A newline is only a row boundary outside quotes, so a file that quotes
+        anything is not safe to split at newlines.
+        """
+        if os.path.getsize(csv_path) == 0:
+            return False
+        with open(csv_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return mm.find(b'"', mm.find(b'\n') + 1) != -1
+
+    @staticmethod
+    def _csv_segment_bounds(csv_path, segments: int) -> list:
+        """Split the file's data rows into up to `segments` (start, end) byte ranges
+
+        The header line is excluded and every boundary is moved forward to just
+        after the next newline, so each range holds whole lines.
+        """
+        if os.path.getsize(csv_path) == 0:
+            return []
+        with open(csv_path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            size = len(mm)
+            data_start = mm.find(b'\n') + 1
+            if data_start == 0:
+                return []
+            step = (size - data_start) // segments
+            offsets = [data_start]
+            for i in range(1, segments):
+                newline = mm.find(b'\n', max(data_start + i * step, offsets[-1]))
+                if newline == -1 or newline + 1 >= size:
+                    break
+                offsets.append(newline + 1)
+            offsets.append(size)
+        return [(start, end) for start, end in zip(offsets, offsets[1:]) if end > start]
+
+    def _copy_csv_segment(self, csv_path, start: int, end: int, copy_sql: str) -> int:
+        """COPY one byte range of a CSV file on its own pooled connection"""
+        raw_conn = self.db.engine.raw_connection()
+        try:
+            with raw_conn.cursor() as cursor, open(csv_path, 'rb') as f:
+                cursor.execute("SET LOCAL synchronous_commit = off")
+                cursor.copy_expert(copy_sql, FileSegmentStream(f, start, end))
+                row_count = cursor.rowcount
+            raw_conn.commit()
+            return row_count
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+
+    def _copy_csv_file_segments(self, csv_path, staging_table: str, columns: list, where: str = None) -> int:
+        """COPY a large CSV file as concurrent segments into the same staging table"""
+        copy_sql = f"COPY {staging_table} ({', '.join(columns)}) FROM STDIN WITH (FORMAT csv)"
+        if where:
+            copy_sql += f" WHERE {where}"
+
+        bounds = self._csv_segment_bounds(csv_path, self.PARALLEL_COPY_SEGMENTS)
+        logger.info(f"Copying {csv_path} into {staging_table} as {len(bounds)} parallel segments")
+        try:
+            with ThreadPoolExecutor(max_workers=len(bounds) or 1) as executor:
+                row_count = sum(executor.map(lambda b: self._copy_csv_segment(csv_path, *b, copy_sql), bounds))
+        except Exception as e:
+            # Segments that finished have already committed; clear them so a
+            # partial file can never be upserted from this staging table
+            logger.error(f"Error copying {csv_path} into {staging_table}: {e}")
+            self.db.execute_raw(f"TRUNCATE {staging_table}")
+            raise
+
+        logger.debug(f"Copied {row_count} rows into {staging_table}")
+        return row_count
+
+    def copy_df_chunk_to_staging(self, df: pd.DataFrame, staging_table: str, freeze: bool = False) -> int:
+        """Stream a DataFrame chunk into an existing staging table with COPY FROM STDIN
+
+        freeze=True is meant for the first chunk into a freshly created staging table:
+        the table is truncated in the COPY's own transaction, which is what Postgres
+        requires before it will write the rows pre-frozen (no hint-bit rewrite later).
+        """
+        if df.empty:
+            return 0
+
+        # Unquoted empty fields are read back as NULL by COPY ... CSV
+        buffer = DataFrameCSVStream(df)
+
+        copy_options = "FORMAT csv, FREEZE true" if freeze else "FORMAT csv"
+        copy_sql = f"COPY {staging_table} ({', '.join(df.columns)}) FROM STDIN WITH ({copy_options})"
+        raw_conn = self.db.engine.raw_connection()
+        try:
+            with raw_conn.cursor() as cursor:
+                # Staging is rebuilt from the CSV on every run - no need to wait on the WAL flush
+                cursor.execute("SET LOCAL synchronous_commit = off")
+                if freeze:
+                    cursor.execute(f"TRUNCATE {staging_table}")
+                cursor.copy_expert(copy_sql, buffer)
+            raw_conn.commit()
+        except Exception as e:
+            raw_conn.rollback()
+            logger.error(f"Error copying chunk into {staging_table}: {e}")
+            raise
+        finally:
+            raw_conn.close()
+
+        logger.debug(f"Copied {len(df)} rows into {staging_table}")
+        return len(df)
@@ -1,18 +1,65 @@
 """Base loader class for ETL process."""
+import importlib.util
+import re
+import threading
+import numpy as np
 import pandas as pd
 from pathlib import Path
 from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from loguru import logger
 from ..database.connection import db
 from ..database.staging import StagingTableManager
 from ..utils.csv_preprocessor import CSVPreprocessor
 from sqlalchemy import text
+from sqlalchemy.sql.elements import TextClause
+
+# pyarrow is optional - its multi-threaded CSV reader is used for large loads when installed
+HAS_PYARROW = importlib.util.find_spec('pyarrow') is not None
 
 class BaseLoader(ABC):
     """Base class for all data loaders"""
 
+    # pandas dtype -> PostgreSQL column type for staging tables
+    _PD_TO_PG = {
+        np.dtype('int64'): 'BIGINT',
+        np.dtype('float64'): 'DOUBLE PRECISION',
+        np.dtype('bool'): 'BOOLEAN',
+        np.dtype('datetime64[ns]'): 'TIMESTAMP',
+        np.dtype('O'): 'TEXT',
+        pd.Int64Dtype(): 'BIGINT',
+        pd.Int32Dtype(): 'INTEGER',
+        pd.Int16Dtype(): 'SMALLINT',
+    }
+
+    # Calculated-field shapes that can be applied to the frame before COPY instead of
+    # an UPDATE pass over staging: NULLIF(col, 0) and a blank-string default for col
+    _NULLIF_ZERO_RE = re.compile(r"^\s*NULLIF\(\s*(\w+)\s*,\s*0\s*\)\s*$", re.IGNORECASE)
+    _BLANK_DEFAULT_RE = re.compile(
+        r"^\s*CASE\s+WHEN\s+(\w+)\s*=\s*''\s+OR\s+\1\s+IS\s+NULL\s+THEN\s+'([^']*)'\s+ELSE\s+\1\s+END\s*$",
+        re.IGNORECASE
+    )
+
+    # Calculated fields that are already materialized in staging (e.g. generated
+    # columns) - the upsert selects them as-is instead of re-evaluating the expression
+    STAGED_CALCULATED_FIELDS = frozenset()
+
+    # information_schema data_type values of the integer column types
+    INTEGER_TYPES = frozenset({'smallint', 'integer', 'bigint'})
+
+    # TRUNCATE ... CASCADE locks every table that references the target; concurrent
+    # full loads take these one at a time so overlapping cascades cannot deadlock
+    _truncate_lock = threading.Lock()
+
+    # Caches shared by all loader instances for one run (see _upsert_from_staging).
+    # Loaders run on threads, so reads and writes go through _cache_lock, and each
+    # run starts from empty caches (clear_run_caches) so a migration is picked up
+    _upsert_sql_cache: Dict[tuple, TextClause] = {}
+    _target_column_types_cache: Dict[str, Dict[str, str]] = {}
+    _cache_lock = threading.Lock()
+
     def __init__(self, batch_id: str = None):
         self.db = db
         self.staging_mgr = StagingTableManager()
@@ -114,6 +161,31 @@ class BaseLoader(ABC):
             return False
 
 
+    def _get_dedup_subset(self) -> Optional[List[str]]:
+        """Primary keys as CSV column names, for de-duplication during preprocessing
+
+        None means de-duplicate on all columns.
+        """
+        primary_keys = self.get_primary_keys()
+        column_mapping = self.get_column_mapping()
+
+        # If there's a column mapping, we need to find the CSV column names for the PKs
+        # Otherwise the PKs won't exist yet (e.g., trade_id is auto-generated)
+        if primary_keys and column_mapping:
+            # Reverse map to find CSV columns that map to PK columns
+            reverse_mapping = {v: k for k, v in column_mapping.items()}
+            dedup_subset = [reverse_mapping.get(pk) for pk in primary_keys if reverse_mapping.get(pk)]
+            # Only use subset if all PKs are mapped (otherwise use all columns)
+            if not dedup_subset or len(dedup_subset) != len(primary_keys):
+                return None
+            return dedup_subset
+        # No mapping, use PKs directly
+        return primary_keys or None
+
+    def _csv_read_options(self) -> Dict:
+        """Extra pd.read_csv keyword arguments (usecols, dtype, ...) for this loader's CSVs"""
+        return {}
+
     def _handle_skip_strategy(self, csv_path: Path) -> bool:
         """Handle skip strategy - only load if checksum changed"""
         # TODO - implement checksum comparison
@@ -129,49 +201,37 @@ class BaseLoader(ABC):
 
         # Read CSV with error handling for malformed rows
         try:
-            df = pd.read_csv(csv_path)
+            df = pd.read_csv(csv_path, **self._csv_read_options())
         except pd.errors.ParserError as e:
             logger.warning(f"Malformed CSV detected, attempting to skip bad lines: {e}")
             try:
-                df = pd.read_csv(csv_path, on_bad_lines='skip', engine='python')
+                df = pd.read_csv(csv_path, on_bad_lines='skip', engine='python', **self._csv_read_options())
                 logger.info(f"Successfully loaded CSV with {len(df)} rows (skipped bad lines)")
             except Exception as e2:
                 logger.error(f"Could not parse CSV even with error handling: {e2}")
                 raise
 
         # Apply CSV preprocessing (clean quoted strings, deduplicate on PK, etc.)
-        primary_keys = self.get_primary_keys()
-
-        # If there's a column mapping, we need to find the CSV column names for the PKs
-        # Otherwise the PKs won't exist yet (e.g., trade_id is auto-generated)
-        dedup_subset = None
-        if primary_keys and column_mapping:
-            # Reverse map to find CSV columns that map to PK columns
-            reverse_mapping = {v: k for k, v in column_mapping.items()}
-            dedup_subset = [reverse_mapping.get(pk) for pk in primary_keys if reverse_mapping.get(pk)]
-            # Only use subset if all PKs are mapped (otherwise use all columns)
-            if not dedup_subset or len(dedup_subset) != len(primary_keys):
-                dedup_subset = None
-        elif primary_keys:
-            # No mapping, use PKs directly
-            dedup_subset = primary_keys
-
         df = CSVPreprocessor.preprocess(df, config={
             'clean_quoted_strings': True,
             'deduplicate': True,
-            'dedup_subset': dedup_subset
+            'dedup_subset': self._get_dedup_subset()
         })
 
         # Filter columns based on column mapping
         if column_mapping:
-            # Only keep columns that are in the mapping
+            # Only keep columns that are in the mapping - a usecols read already did.
+            # df is not touched again, so neither the selection nor the rename needs a copy
             csv_columns = list(column_mapping.keys())
-            df_to_load = df[csv_columns].copy()
+            df_to_load = df if set(df.columns) == set(csv_columns) else df[csv_columns]
             # Rename columns according to mapping
-            df_to_load = df_to_load.rename(columns=column_mapping)
+            df_to_load = df_to_load.rename(columns=column_mapping, copy=False)
         else:
             df_to_load = df
 
+        # Apply simple derived fields (NULLIF(col, 0) and friends) before the COPY
+        df_to_load, sql_calculated_fields = self._apply_frame_calculated_fields(df_to_load)
+
         # Create staging table based on filtered columns
         columns = self._infer_column_types(df_to_load)
         self.staging_mgr.create_staging_from_csv_structure(target_table, columns)
@@ -180,11 +240,11 @@ class BaseLoader(ABC):
         row_count = self.staging_mgr.copy_csv_to_staging(str(csv_path), staging_table, df=df_to_load)
         self.stats['rows_read'] = row_count
 
-        # Calculate derived fields (like current_date_year and parent_league_id transformations)
-        self._calculate_derived_fields(staging_table)
+        # Calculate derived fields (like current_date_year) that could not be applied to the frame
+        self._calculate_derived_fields(staging_table, sql_calculated_fields)
 
         # Truncate target and insert from staging
-        with self.db.get_session() as session:
+        with self._truncate_lock, self.db.get_session() as session:
             session.execute(text(f"TRUNCATE TABLE {target_table} CASCADE"))
 
             if column_mapping:
@@ -308,22 +368,139 @@ class BaseLoader(ABC):
 
     def _infer_column_types(self, df: pd.DataFrame) -> Dict[str, str]:
         """Infer PostgreSQL column types from DataFrame dtypes"""
-        type_mapping = {
-            'int64': 'BIGINT',
-            'float64': 'DOUBLE PRECISION',
-            'bool': 'BOOLEAN',
-            'datetime64[ns]': 'TIMESTAMP',
-            'object': 'TEXT'
+        # df.dtypes is already resolved by the CSV parser - map it in a single pass
+        # instead of re-materializing the dtypes Series for every column
+        return {col: self._PD_TO_PG.get(dtype, 'TEXT') for col, dtype in df.dtypes.items()}
+
+
+    def _align_chunk_dtypes(self, chunk: pd.DataFrame, columns: Dict[str, str]) -> pd.DataFrame:
+        """Keep integer staging columns integral when a later chunk parses them as float (NaN present)"""
+        drifted = {
+            col: 'Int64' for col, pg_type in columns.items()
+            if pg_type == 'BIGINT' and col in chunk.columns and chunk[col].dtype.kind == 'f'
         }
+        return chunk.astype(drifted) if drifted else chunk
+
+
+    def _upsert_source_joins(self, staging_column_types: Dict[str, str]) -> Tuple[str, Dict[str, str]]:
+        """Extra joins for the upsert's SELECT, and the target columns they supply
+
+        Returns (join SQL appended after 'FROM staging s', {column: expression}).
+        A joined column is only used when staging does not carry it already.
+        """
+        return '', {}
+
+    def _build_upsert_sql(self, staging_table: str, target_table: str, staging_column_types: Dict[str, str]) -> str:
+        """Build the INSERT ... SELECT ... ON CONFLICT statement for a staging layout"""
+        upsert_keys = self.get_upsert_keys()
+        update_columns = self.get_update_columns()
+        calculated_fields = self.get_calculated_fields()
+
+        target_column_types = self._get_target_column_types(target_table)
+        target_columns = list(target_column_types.keys())
+
+        # Handle '*' wildcard in update_columns (means all non-key columns)
+        if update_columns == ['*']:
+            update_columns = [col for col in target_columns if col not in upsert_keys]
+
+        # Build SELECT clause with calculated expressions where needed
+        select_clauses = []
+        insert_columns = []  # Only columns that exist in staging or are calculated
+        column_mapping = self.get_column_mapping() or {}
+        reverse_mapping = {v: k for k, v in column_mapping.items()}
+        source_joins, joined_columns = self._upsert_source_joins(staging_column_types)
+        uses_join = False
+
+        for col in target_columns:
+            # Determine the staging column name
+            staging_col = reverse_mapping.get(col, col)
+
+            # Check if column exists in staging or is calculated
+            if col in self.STAGED_CALCULATED_FIELDS and col in staging_column_types:
+                select_clauses.append(f"s.{col} AS {col}")
+                insert_columns.append(col)
+            elif col in calculated_fields:
+                # Use the calculated expression
+                select_clauses.append(f"({calculated_fields[col]}) AS {col}")
+                insert_columns.append(col)
+            elif col in joined_columns and staging_col not in staging_column_types:
+                # Looked up from a table joined by _upsert_source_joins()
+                select_clauses.append(f"{joined_columns[col]} AS {col}")
+                insert_columns.append(col)
+                uses_join = True
+            elif staging_col in staging_column_types:
+                # Column exists in staging - add with type casting if needed
+                staging_type = staging_column_types[staging_col]
+                target_type = target_column_types[col]
+
+                # Apply type casting when staging is TEXT and target needs conversion
+                if staging_type == 'text' and target_type != 'text':
+                    if target_type in ('date', 'timestamp without time zone', 'timestamp with time zone'):
+                        cast_expr = f"NULLIF(s.{staging_col}, '')::DATE" if target_type == 'date' else f"NULLIF(s.{staging_col}, '')::TIMESTAMP"
+                        select_clauses.append(f"{cast_expr} AS {col}")
+                    elif target_type == 'numeric':
+                        select_clauses.append(f"NULLIF(s.{staging_col}, '')::NUMERIC AS {col}")
+                    elif target_type in ('integer', 'bigint', 'smallint'):
+                        select_clauses.append(f"NULLIF(s.{staging_col}, '')::INTEGER AS {col}")
+                    else:
+                        select_clauses.append(f"s.{staging_col} AS {col}")
+                elif staging_type == 'numeric' and target_type in self.INTEGER_TYPES:
+                    # Integers staged as NUMERIC so float-formatted values copy
+                    select_clauses.append(f"s.{staging_col}::{target_type.upper()} AS {col}")
+                else:
+                    # No casting needed
+                    select_clauses.append(f"s.{staging_col} AS {col}")
+                insert_columns.append(col)
+            # else: Skip columns that don't exist in staging (e.g., auto-generated SERIAL columns)
 
-        columns = {}
-        for col in df.columns:
-            # Get dtype using dtypes Series (guaranteed to return scalar dtype)
-            dtype_str = str(df.dtypes[col])
-            pg_type = type_mapping.get(dtype_str, 'TEXT')
-            columns[col] = pg_type
-        return columns
+        # Build INSERT statement
+        insert_cols = ', '.join(insert_columns)
+        select_cols = ', '.join(select_clauses)
+        conflict_keys = ', '.join(upsert_keys)
+        if not uses_join:
+            source_joins = ""
+
+        # Feed rows in key order so conflict checks walk the target's unique index
+        # sequentially instead of probing random pages
+        order_keys = [reverse_mapping.get(key, key) for key in upsert_keys]
+        if order_keys and all(key in staging_column_types for key in order_keys):
+            order_by = f"ORDER BY {', '.join(f's.{key}' for key in order_keys)}"
+        else:
+            order_by = ""
 
+        # Build UPDATE SET clause for conflicts (only for columns in staging)
+        update_set_clauses = []
+        changed_columns = []
+        for col in update_columns:
+            if col in insert_columns and col not in upsert_keys:
+                update_set_clauses.append(f"{col} = EXCLUDED.{col}")
+                changed_columns.append(col)
+
+        if update_set_clauses:
+            # Skip conflicting rows whose values are unchanged - a no-op UPDATE still
+            # writes a new tuple version and WAL on every re-load
+            upsert_sql = f"""
+                INSERT INTO {target_table} AS t ({insert_cols})
+                SELECT {select_cols}
+                FROM {staging_table} s
+                {source_joins}
+                {order_by}
+                ON CONFLICT ({conflict_keys}) DO UPDATE SET
+                {', '.join(update_set_clauses)}
+                WHERE ROW({', '.join(f't.{c}' for c in changed_columns)})
+                    IS DISTINCT FROM ROW({', '.join(f'EXCLUDED.{c}' for c in changed_columns)})
+            """
+        else:
+            upsert_sql = f"""
+                INSERT INTO {target_table} ({insert_cols})
+                SELECT {select_cols}
+                FROM {staging_table} s
+                {source_joins}
+                {order_by}
+                ON CONFLICT ({conflict_keys}) DO NOTHING
+            """
+
+        return upsert_sql
 
     def _record_file_start(self, csv_path: Path):
         """Record file processing start in metadata"""
@@ -382,16 +559,47 @@ class BaseLoader(ABC):
             'triggered_by': 'etl_pipeline'
         })
 
-    def _calculate_derived_fields(self, staging_table: str):
-        """Calculate derived fields based on loader's get_calculated_fields"""
-        calculated_fields = self.get_calculated_fields()
+    def _apply_frame_calculated_fields(self, df: pd.DataFrame) -> Tuple[pd.DataFrame, Dict[str, str]]:
+        """Apply calculated fields that only rewrite their own column to the frame
+
+        Returns the frame and the calculated fields that still need the SQL pass.
+        """
+        remaining = {}
+        for field, expression in self.get_calculated_fields().items():
+            if field not in df.columns:
+                remaining[field] = expression
+                continue
+
+            column = df[field]
+            nullif_zero = self._NULLIF_ZERO_RE.match(expression)
+            blank_default = self._BLANK_DEFAULT_RE.match(expression)
+            if nullif_zero and nullif_zero.group(1) == field:
+                if column.dtype.kind in 'iu':
+                    column = column.astype('Int64')  # keep it integral once NULLs appear
+                df = df.assign(**{field: column.mask(column == 0)})
+            elif blank_default and blank_default.group(1) == field:
+                df = df.assign(**{field: column.mask(column.isna() | (column == ''), blank_default.group(2))})
+            else:
+                remaining[field] = expression
+        return df, remaining
+
+    def _calculate_derived_fields(self, staging_table: str, calculated_fields: Optional[Dict[str, str]] = None):
+        """Calculate derived fields based on loader's get_calculated_fields
+
+        calculated_fields overrides the loader's fields, e.g. with the ones left over
+        by _apply_frame_calculated_fields.
+        """
+        if calculated_fields is None:
+            calculated_fields = self.get_calculated_fields()
 
         if not calculated_fields:
             return
 
         logger.info(f"Calculating derived fields for {staging_table}")
 
-        # First, add columns if they don't exist
+        # Add columns if they don't exist, then fill them - both statements go to the
+        # server in a single round trip (psycopg2 accepts multi-statement strings)
+        add_clauses = []
         for field, expression in calculated_fields.items():
             # Determine column type based on expression
             if 'CURRENT_TIMESTAMP' in expression:
@@ -405,11 +613,7 @@ class BaseLoader(ABC):
             else:
                 col_type = 'DECIMAL(8,3)'
 
-            add_col_sql = text(f"""
-                ALTER TABLE {staging_table}
-                ADD COLUMN IF NOT EXISTS {field} {col_type}
-            """)
-            self.db.execute_sql(add_col_sql)
+            add_clauses.append(f"ADD COLUMN IF NOT EXISTS {field} {col_type}")
 
         # Build UPDATE statement for calculated fields
         set_clauses = []
@@ -417,106 +621,135 @@ class BaseLoader(ABC):
             set_clauses.append(f"{field} = {expression}")
 
         if set_clauses:
-            update_sql = text(f"""
+            derived_sql = text(f"""
+                ALTER TABLE {staging_table}
+                {', '.join(add_clauses)};
+
                 UPDATE {staging_table}
                 SET {', '.join(set_clauses)}
             """)
 
-            self.db.execute_sql(update_sql)
+            self.db.execute_sql(derived_sql)
             logger.info(f"Calculated fields updated in {staging_table}")
 
-    def _upsert_from_staging(self, staging_table: str, target_table: str):
-        """Perform UPSERT from staging to target table"""
-        upsert_keys = self.get_upsert_keys()
-        update_columns = self.get_update_columns()
-        calculated_fields = self.get_calculated_fields()
-
-        # Get columns from both staging and target tables with types
+    @classmethod
+    def clear_run_caches(cls):
+        """Forget cached table layouts and upsert SQL - call at the start of each run"""
+        with BaseLoader._cache_lock:
+            BaseLoader._upsert_sql_cache.clear()
+            BaseLoader._target_column_types_cache.clear()
+
+    def _get_target_column_types(self, target_table: str) -> Dict[str, str]:
+        """_get_column_types() for a target table, looked up once per run"""
+        with BaseLoader._cache_lock:
+            target_column_types = BaseLoader._target_column_types_cache.get(target_table)
+        if target_column_types is None:
+            target_column_types = self._get_column_types(target_table)
+            with BaseLoader._cache_lock:
+                target_column_types = BaseLoader._target_column_types_cache.setdefault(
+                    target_table, target_column_types
+                )
+        return target_column_types
+
+    def _get_column_types(self, table_name: str) -> Dict[str, str]:
+        """Return {column: data_type} for a table in ordinal order"""
         cols_with_types_sql = text("""
             SELECT column_name, data_type
             FROM information_schema.columns
             WHERE table_name = :table_name
             ORDER BY ordinal_position
         """)
+        result = self.db.execute_sql(cols_with_types_sql, {'table_name': table_name})
+        return {row[0]: row[1] for row in result}
+
+    def _drop_secondary_indexes(self, target_table: str) -> List[Tuple[str, str]]:
+        """Drop non-unique indexes on target_table before a bulk load
+
+        Returns (index name, definition) pairs for _recreate_indexes(). If a drop
+        fails part way, the indexes already dropped are rebuilt before re-raising.
+        """
+        index_sql = text("""
+            SELECT c.relname, pg_get_indexdef(i.indexrelid)
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE i.indrelid = CAST(:table_name AS regclass)
+              AND NOT i.indisunique
+              AND NOT i.indisprimary
+        """)
+        indexes = self.db.execute_sql(index_sql, {'table_name': target_table}).fetchall()
 
-        # Get target columns and types
-        result = self.db.execute_sql(cols_with_types_sql, {'table_name': target_table})
-        target_column_types = {row[0]: row[1] for row in result}
-        target_columns = list(target_column_types.keys())
-
-        # Get staging columns and types
-        result = self.db.execute_sql(cols_with_types_sql, {'table_name': staging_table})
-        staging_column_types = {row[0]: row[1] for row in result}
-
-        # Handle '*' wildcard in update_columns (means all non-key columns)
-        if update_columns == ['*']:
-            update_columns = [col for col in target_columns if col not in upsert_keys]
-
-        # Build SELECT clause with calculated expressions where needed
-        select_clauses = []
-        insert_columns = []  # Only columns that exist in staging or are calculated
-        column_mapping = self.get_column_mapping() or {}
-        reverse_mapping = {v: k for k, v in column_mapping.items()}
-
-        for col in target_columns:
-            # Determine the staging column name
-            staging_col = reverse_mapping.get(col, col)
-
-            # Check if column exists in staging or is calculated
-            if col in calculated_fields:
-                # Use the calculated expression
-                select_clauses.append(f"({calculated_fields[col]}) AS {col}")
-                insert_columns.append(col)
-            elif staging_col in staging_column_types:
-                # Column exists in staging - add with type casting if needed
-                staging_type = staging_column_types[staging_col]
-                target_type = target_column_types[col]
-
-                # Apply type casting when staging is TEXT and target needs conversion
-                if staging_type == 'text' and target_type != 'text':
-                    if target_type in ('date', 'timestamp without time zone', 'timestamp with time zone'):
-                        cast_expr = f"NULLIF(s.{staging_col}, '')::DATE" if target_type == 'date' else f"NULLIF(s.{staging_col}, '')::TIMESTAMP"
-                        select_clauses.append(f"{cast_expr} AS {col}")
-                    elif target_type == 'numeric':
-                        select_clauses.append(f"NULLIF(s.{staging_col}, '')::NUMERIC AS {col}")
-                    elif target_type in ('integer', 'bigint', 'smallint'):
-                        select_clauses.append(f"NULLIF(s.{staging_col}, '')::INTEGER AS {col}")
-                    else:
-                        select_clauses.append(f"s.{staging_col} AS {col}")
-                else:
-                    # No casting needed
-                    select_clauses.append(f"s.{staging_col} AS {col}")
-                insert_columns.append(col)
-            # else: Skip columns that don't exist in staging (e.g., auto-generated SERIAL columns)
-
-        # Build INSERT statement
-        insert_cols = ', '.join(insert_columns)
-        select_cols = ', '.join(select_clauses)
-        conflict_keys = ', '.join(upsert_keys)
+        dropped = []
+        try:
+            for index_name, index_def in indexes:
+                self.db.execute_autocommit(text(f"DROP INDEX CONCURRENTLY IF EXISTS {index_name}"))
+                dropped.append((index_name, index_def))
+        except Exception:
+            self._recreate_indexes(dropped)
+            raise
+        if dropped:
+            logger.info(f"Dropped {len(dropped)} secondary indexes on {target_table} for bulk load")
+        return dropped
+
+    def _index_validity(self, index_names: List[str]) -> Dict[str, bool]:
+        """{index name: pg_index.indisvalid} for those of index_names that exist"""
+        if not index_names:
+            return {}
+        result = self.db.execute_sql(text("""
+            SELECT c.relname, i.indisvalid
+            FROM pg_index i
+            JOIN pg_class c ON c.oid = i.indexrelid
+            WHERE c.relname = ANY(:names)
+        """), {'names': list(index_names)}).fetchall()
+        return {row[0]: row[1] for row in result}
+
+    def _recreate_indexes(self, index_defs: List[Tuple[str, str]]):
+        """Rebuild indexes captured by _drop_secondary_indexes
+
+        Each definition is run exactly as pg_get_indexdef() returned it. A plain
+        CREATE INDEX blocks writes (only the loaders write) but not reads, and a
+        failed build leaves nothing behind - CONCURRENTLY would leave an INVALID
+        index under the same name. Indexes already present and valid are kept,
+        invalid ones are dropped and rebuilt. Raises if any index is still missing
+        or invalid afterwards.
+        """
+        if not index_defs:
+            return
 
-        # Build UPDATE SET clause for conflicts (only for columns in staging)
-        update_set_clauses = []
-        for col in update_columns:
-            if col in insert_columns and col not in upsert_keys:
-                update_set_clauses.append(f"{col} = EXCLUDED.{col}")
+        validity = self._index_validity([name for name, _ in index_defs])
+        for index_name, index_def in index_defs:
+            if validity.get(index_name):
+                continue
+            try:
+                if index_name in validity:
+                    logger.warning(f"Index {index_name} is invalid - dropping it before the rebuild")
+                    self.db.execute_raw(f"DROP INDEX IF EXISTS {index_name}")
+                self.db.execute_raw(index_def)
+            except Exception as e:
+                logger.error(f"Could not rebuild index {index_name}: {e}")
+
+        validity = self._index_validity([name for name, _ in index_defs])
+        broken = [name for name, _ in index_defs if not validity.get(name)]
+        if broken:
+            raise RuntimeError(f"Secondary indexes missing or invalid after rebuild: {', '.join(broken)}")
+        logger.info(f"Recreated {len(index_defs)} secondary indexes")
 
-        if update_set_clauses:
-            upsert_sql = text(f"""
-                INSERT INTO {target_table} ({insert_cols})
-                SELECT {select_cols}
-                FROM {staging_table} s
-                ON CONFLICT ({conflict_keys}) DO UPDATE SET
-                {', '.join(update_set_clauses)}
-            """)
-        else:
-            upsert_sql = text(f"""
-                INSERT INTO {target_table} ({insert_cols})
-                SELECT {select_cols}
-                FROM {staging_table} s
-                ON CONFLICT ({conflict_keys}) DO NOTHING
-            """)
+    def _upsert_from_staging(self, staging_table: str, target_table: str):
+        """Perform UPSERT from staging to target table"""
+        # The statement only depends on the loader's class-level config and the two
+        # table layouts, so build it once per staging layout and reuse it
+        staging_column_types = self._get_column_types(staging_table)
+        cache_key = (type(self), target_table, staging_table, tuple(staging_column_types.items()))
+        with BaseLoader._cache_lock:
+            upsert_sql = BaseLoader._upsert_sql_cache.get(cache_key)
+        if upsert_sql is None:
+            upsert_sql = text(self._build_upsert_sql(staging_table, target_table, staging_column_types))
+            with BaseLoader._cache_lock:
+                upsert_sql = BaseLoader._upsert_sql_cache.setdefault(cache_key, upsert_sql)
 
         with self.db.get_session() as session:
+            # The upsert is replayable from the source CSV, so skip the WAL flush wait;
+            # the next synchronous commit (file metadata) flushes it anyway
+            session.execute(text("SET LOCAL synchronous_commit = off"))
             result = session.execute(upsert_sql)
             row_count = result.rowcount
             session.commit()
@@ -525,3 +758,21 @@ class BaseLoader(ABC):
         return row_count
 
 
+def load_files_concurrently(jobs: List[Tuple[BaseLoader, Path]], max_workers: int = 4) -> Dict[str, bool]:
+    """Run independent loaders in parallel, returning {target_table: success}
+
+    Each loader works on its own staging table and its own pooled connection, so
+    CSV parsing and COPY for different files overlap instead of running back to back.
+    Loaders must not depend on each other's target tables.
+    """
+    results = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {executor.submit(loader.load_csv, csv_path): loader for loader, csv_path in jobs}
+        for future in as_completed(futures):
+            target_table = futures[future].get_target_table()
+            try:
+                results[target_table] = future.result()
+            except Exception as e:
+                logger.error(f"Concurrent load of {target_table} failed: {e}")
+                results[target_table] = False
+    return results
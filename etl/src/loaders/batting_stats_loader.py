@@ -1,10 +1,5 @@
 from typing import List, Dict, Optional
-from pathlib import Path
-from loguru import logger
-import pandas as pd
-from sqlalchemy import text
 from .stats_loader import StatsLoader
-from ..utils.batch import generate_batch_id
 
 class BattingStatsLoader(StatsLoader):
     """Loader for batting statistics"""
@@ -22,14 +17,18 @@ class BattingStatsLoader(StatsLoader):
         return None
 
     def get_calculated_fields(self) -> Dict[str, str]:
-        # Basic rate stats - always recalculated
+        # Basic rate stats - always recalculated. ops and iso are built from the other
+        # expressions so every field reads only staged counting stats (one pass in the upsert)
+        batting_average = 'CASE WHEN ab > 0 THEN ROUND(h::numeric / ab, 3) ELSE 0 END'
+        on_base_percentage = 'CASE WHEN (ab + bb + hp + sf) > 0 THEN ROUND((h + bb + hp)::numeric / (ab + bb + hp + sf), 3) ELSE 0 END'
+        slugging_percentage = 'CASE WHEN ab > 0 THEN ROUND(((h - d - t - hr) + (2 * d) + (3 * t) + (4 * hr))::numeric / ab, 3) ELSE 0 END'
         return {
             # Traditional stats
-            'batting_average': 'CASE WHEN ab > 0 THEN ROUND(h::numeric / ab, 3) ELSE 0 END',
-            'on_base_percentage': 'CASE WHEN (ab + bb + hp + sf) > 0 THEN ROUND((h + bb + hp)::numeric / (ab + bb + hp + sf), 3) ELSE 0 END',
-            'slugging_percentage': 'CASE WHEN ab > 0 THEN ROUND(((h - d - t - hr) + (2 * d) + (3 * t) + (4 * hr))::numeric / ab, 3) ELSE 0 END',
-            'ops': 'ROUND(on_base_percentage + slugging_percentage, 3)',
-            'iso': 'ROUND(slugging_percentage - batting_average, 3)',
+            'batting_average': batting_average,
+            'on_base_percentage': on_base_percentage,
+            'slugging_percentage': slugging_percentage,
+            'ops': f'ROUND(({on_base_percentage}) + ({slugging_percentage}), 3)',
+            'iso': f'ROUND(({slugging_percentage}) - ({batting_average}), 3)',
             'babip': 'CASE WHEN (ab - k - hr + sf) > 0 THEN ROUND((h - hr)::numeric / (ab - k - hr + sf), 3 ) ELSE 0 END',
             # Advanced stats placeholders - these are calculated post-load
             'woba': 'NULL::DECIMAL(4,3)',
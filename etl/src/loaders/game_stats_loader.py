@@ -8,8 +8,6 @@ game-by-game player performance context.
 from typing import List, Dict, Optional
 from pathlib import Path
 from loguru import logger
-import pandas as pd
-from sqlalchemy import text
 from .stats_loader import StatsLoader
 from ..utils.csv_preprocessor import CSVPreprocessor
 
@@ -53,14 +51,14 @@ class GameBattingStatsLoader(StatsLoader):
         """
         logger.info(f"Loading game batting stats from: {csv_path}")
 
-        # Read full CSV and deduplicate based on upsert keys
-        df = pd.read_csv(csv_path, low_memory=False)
+        # Read the target's columns only and deduplicate based on upsert keys
+        df = self._read_stats_csv(csv_path)
 
         # Deduplicate using upsert keys (player_id, year, game_id)
         df = CSVPreprocessor.deduplicate_rows(df, subset=['player_id', 'year', 'game_id'])
 
-        # Infer column types from deduplicated data
-        columns = self._infer_column_types(df.head(1))
+        # Map staging column types straight from the parsed dtypes
+        columns = self._infer_column_types(df)
 
         # Create staging table from CSV structure
         staging_table = f"staging_{self.get_target_table()}"
@@ -73,16 +71,17 @@ class GameBattingStatsLoader(StatsLoader):
             logger.error(f"Failed to create staging table: {staging_table}")
             return False
 
-        # Load deduplicated CSV into staging
-        if not self.staging_mgr.copy_csv_to_staging(csv_path, staging_table, df=df):
+        # Load deduplicated CSV into the fresh staging table (COPY ... FREEZE)
+        row_count = self.staging_mgr.copy_df_chunk_to_staging(df, staging_table, freeze=True)
+        if not row_count:
             logger.error(f"Failed to load CSV into staging: {staging_table}")
             return False
 
         # Populate calculated fields (if any)
         self._calculate_derived_fields(staging_table)
 
-        # Upsert from staging to target
-        upserted = self._upsert_from_staging(staging_table, self.get_target_table())
+        # Upsert from staging to target (large loads rebuild secondary indexes afterwards)
+        upserted = self._upsert_with_deferred_indexes(staging_table, self.get_target_table(), row_count)
         logger.info(f"Upserted {upserted} rows from {staging_table} to {self.get_target_table()}")
 
         return True
@@ -135,14 +134,14 @@ class GamePitchingStatsLoader(StatsLoader):
         """
         logger.info(f"Loading game pitching stats from: {csv_path}")
 
-        # Read full CSV and deduplicate based on upsert keys
-        df = pd.read_csv(csv_path, low_memory=False)
+        # Read the target's columns only and deduplicate based on upsert keys
+        df = self._read_stats_csv(csv_path)
 
         # Deduplicate using upsert keys (player_id, year, game_id)
         df = CSVPreprocessor.deduplicate_rows(df, subset=['player_id', 'year', 'game_id'])
 
-        # Infer column types from deduplicated data
-        columns = self._infer_column_types(df.head(1))
+        # Map staging column types straight from the parsed dtypes
+        columns = self._infer_column_types(df)
 
         # Create staging table from CSV structure
         staging_table = f"staging_{self.get_target_table()}"
@@ -155,16 +154,17 @@ class GamePitchingStatsLoader(StatsLoader):
             logger.error(f"Failed to create staging table: {staging_table}")
             return False
 
-        # Load deduplicated CSV into staging
-        if not self.staging_mgr.copy_csv_to_staging(csv_path, staging_table, df=df):
+        # Load deduplicated CSV into the fresh staging table (COPY ... FREEZE)
+        row_count = self.staging_mgr.copy_df_chunk_to_staging(df, staging_table, freeze=True)
+        if not row_count:
             logger.error(f"Failed to load CSV into staging: {staging_table}")
             return False
 
         # Populate calculated fields (if any)
         self._calculate_derived_fields(staging_table)
 
-        # Upsert from staging to target
-        upserted = self._upsert_from_staging(staging_table, self.get_target_table())
+        # Upsert from staging to target (large loads rebuild secondary indexes afterwards)
+        upserted = self._upsert_with_deferred_indexes(staging_table, self.get_target_table(), row_count)
         logger.info(f"Upserted {upserted} rows from {staging_table} to {self.get_target_table()}")
 
         return True
\ No newline at end of file
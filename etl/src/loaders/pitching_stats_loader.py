@@ -2,11 +2,36 @@ from typing import List, Dict, Optional
 from pathlib import Path
 from loguru import logger
 import pandas as pd
-from sqlalchemy import text
 from .stats_loader import StatsLoader
 
 class PitchingStatsLoader(StatsLoader):
     """Loader for pitching statistics"""
+
+    # Rows per CSV chunk streamed into staging
+    CHUNK_SIZE = 100_000
+
+    # Calculated columns with their target types, created with the staging table
+    CALCULATED_COLUMN_TYPES = {
+        'era': 'DECIMAL(5,2)',
+        'whip': 'DECIMAL(4,2)',
+        'k9': 'DECIMAL(4,1)',
+        'bb9': 'DECIMAL(4,1)',
+        'hr9': 'DECIMAL(4,1)',
+        'h9': 'DECIMAL(4,1)',
+        'babip': 'DECIMAL(4,3)',
+        'fip': 'DECIMAL(4,2)',
+        'xfip': 'DECIMAL(4,2)',
+        'era_plus': 'INTEGER',
+        'era_minus': 'INTEGER',
+        'fip_plus': 'INTEGER',
+        'fip_minus': 'INTEGER',
+        'constants_version': 'INTEGER',
+        'last_updated': 'TIMESTAMP',
+    }
+
+    # Rate stats computed by Postgres as GENERATED columns while the CSV is copied in
+    STAGED_CALCULATED_FIELDS = frozenset({'era', 'whip', 'k9', 'bb9', 'hr9', 'h9', 'babip'})
+
     def get_target_table(self) -> str:
         return "players_career_pitching_stats"
 
@@ -44,32 +69,6 @@ class PitchingStatsLoader(StatsLoader):
             'last_updated': 'CURRENT_TIMESTAMP'
         }
 
-    def _add_calculated_columns(self, staging_table: str):
-        """Add calculated columns to staging table with proper types"""
-        from sqlalchemy import text
-
-        # ADD columns first (they don't exist in CSV)
-        alter_sql = text(f"""
-            ALTER TABLE {staging_table}
-            ADD COLUMN IF NOT EXISTS era DECIMAL(5,2),
-            ADD COLUMN IF NOT EXISTS whip DECIMAL(4,2),
-            ADD COLUMN IF NOT EXISTS k9 DECIMAL(4,1),
-            ADD COLUMN IF NOT EXISTS bb9 DECIMAL(4,1), 
-            ADD COLUMN IF NOT EXISTS hr9 DECIMAL(4,1),
-            ADD COLUMN IF NOT EXISTS h9 DECIMAL(4,1),
-            ADD COLUMN IF NOT EXISTS babip DECIMAL(4,3),
-            ADD COLUMN IF NOT EXISTS fip DECIMAL(4,2),
-            ADD COLUMN IF NOT EXISTS xfip DECIMAL(4,2),
-            ADD COLUMN IF NOT EXISTS era_plus INTEGER,
-            ADD COLUMN IF NOT EXISTS era_minus INTEGER,
-            ADD COLUMN IF NOT EXISTS fip_plus INTEGER,
-            ADD COLUMN IF NOT EXISTS fip_minus INTEGER,
-            ADD COLUMN IF NOT EXISTS constants_version INTEGER,
-            ADD COLUMN IF NOT EXISTS last_updated TIMESTAMP;
-        """)
-
-        self.db.execute_sql(alter_sql)
-
     def get_update_columns(self) -> List[str]:
         """What to update on UPSERT - counting stats only"""
         # Calculated fields are managed by Phase C (refresh_player_* functions)
@@ -87,29 +86,48 @@ class PitchingStatsLoader(StatsLoader):
 
     def _handle_incremental_load(self, csv_path: Path) -> bool:
         """Handle incremental load with staging table column fix"""
-        staging_table = f"staging_{self.get_target_table()}"
-
-        # Create staging and load data
-        df = pd.read_csv(csv_path)
-
-        # FILTER TO ONLY SPLIT_ID=1
-        df = df[df['split_id'] == 1]
-        logger.info(f"Filtered to split_id=1: {len(df)} rows remaining from {len(pd.read_csv(csv_path))} total")
-        # CREATE FRESH STAGING TABLE - This was missing!
         target_table = self.get_target_table()
-        columns = self._infer_column_types(df)
-        self.staging_mgr.create_staging_from_csv_structure(target_table, columns)
-
-        row_count = self.staging_mgr.copy_csv_to_staging(str(csv_path), staging_table, df=df)
-
-        # Populate sub_league_id
-        self._populate_subleague_id(staging_table)
-
-        # Fix column types BEFORE calculating derived fields
-        self._add_calculated_columns(staging_table)
+        staging_table = f"staging_{target_table}"
+
+        # Rate stats become generated columns; the NULL placeholders and last_updated
+        # are plain columns (CURRENT_TIMESTAMP is not allowed in a generated column)
+        calculated_fields = self.get_calculated_fields()
+        generated_columns = {
+            col: (self.CALCULATED_COLUMN_TYPES[col], calculated_fields[col])
+            for col in self.STAGED_CALCULATED_FIELDS
+        }
+        extra_columns = {
+            col: col_type for col, col_type in self.CALCULATED_COLUMN_TYPES.items()
+            if col not in self.STAGED_CALCULATED_FIELDS
+        }
 
-        # Now calculate derived fields with proper column types
-        self._calculate_derived_fields(staging_table)
+        # Stream the CSV into staging in chunks instead of materializing the whole file
+        columns = None
+        total_rows = 0
+        row_count = 0
+        for chunk in pd.read_csv(csv_path, chunksize=self.CHUNK_SIZE, low_memory=False):
+            total_rows += len(chunk)
+
+            # CREATE FRESH STAGING TABLE from the first chunk's dtypes
+            if columns is None:
+                columns = self._infer_column_types(chunk)
+                self.staging_mgr.create_staging_from_csv_structure(
+                    target_table, columns, extra_columns=extra_columns, generated_columns=generated_columns
+                )
+
+            # FILTER TO ONLY SPLIT_ID=1
+            chunk = chunk[chunk['split_id'] == 1]
+            # The first rows into the new staging table can be written frozen
+            row_count += self.staging_mgr.copy_df_chunk_to_staging(
+                self._align_chunk_dtypes(chunk, columns), staging_table, freeze=(row_count == 0)
+            )
+
+        logger.info(f"Filtered to split_id=1: {row_count} rows remaining from {total_rows} total")
+        self.stats['rows_read'] = row_count
+
+        # No derived-field UPDATE pass: rate stats were generated during the COPY, and
+        # the upsert evaluates the remaining placeholders and joins team_relations
+        # for sub_league_id itself
 
         # Complete the UPSERT
         upserted = self._upsert_from_staging(staging_table, target_table)
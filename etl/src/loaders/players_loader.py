@@ -1,16 +1,170 @@
 """Multi-target loader for normalized players tables"""
-from typing import List, Dict, Optional
+from typing import Callable, List, Dict, Optional, Tuple
+from concurrent.futures import ThreadPoolExecutor
+import importlib.util
 from pathlib import Path
 from loguru import logger
+import numpy as np
 import pandas as pd
-import json
 from sqlalchemy import text
 from .base_loader import BaseLoader
+from ..database.staging import DataFrameCSVStream
 from ..utils.batch import generate_batch_id
 
+# pyarrow is optional - its multi-threaded CSV reader is used when installed
+CSV_ENGINE = 'pyarrow' if importlib.util.find_spec('pyarrow') else 'c'
+
+# players_ratings JSONB documents: rating_type -> {json key: players.csv column}
+RATING_GROUPS = {
+    'personality': {
+        'greed': 'personality_greed',
+        'loyalty': 'personality_loyalty',
+        'play_for_winner': 'personality_play_for_winner',
+        'work_ethic': 'personality_work_ethic',
+        'intelligence': 'personality_intelligence',
+        'leader': 'personality_leader',
+    },
+    'injury': {
+        'is_injured': 'injury_is_injured',
+        'dtd_injury': 'injury_dtd_injury',
+        'career_ending': 'injury_career_ending',
+        'dl_left': 'injury_dl_left',
+        'dl_playoff_round': 'injury_dl_playoff_round',
+        'injury_left': 'injury_left',
+        'dtd_injury_effect': 'dtd_injury_effect',
+        'dtd_injury_effect_hit': 'dtd_injury_effect_hit',
+        'dtd_injury_effect_throw': 'dtd_injury_effect_throw',
+        'dtd_injury_effect_run': 'dtd_injury_effect_run',
+        'injury_id': 'injury_id',
+        'injury_id2': 'injury_id2',
+        'injury_dtd_injury2': 'injury_dtd_injury2',
+        'injury_left2': 'injury_left2',
+        'dtd_injury_effect2': 'dtd_injury_effect2',
+        'dtd_injury_effect_hit2': 'dtd_injury_effect_hit2',
+        'dtd_injury_effect_throw2': 'dtd_injury_effect_throw2',
+        'dtd_injury_effect_run2': 'dtd_injury_effect_run2',
+        'prone_overall': 'prone_overall',
+        'prone_leg': 'prone_leg',
+        'prone_back': 'prone_back',
+        'prone_arm': 'prone_arm',
+    },
+    'fatigue': {
+        'pitches0': 'fatigue_pitches0',
+        'pitches1': 'fatigue_pitches1',
+        'pitches2': 'fatigue_pitches2',
+        'pitches3': 'fatigue_pitches3',
+        'pitches4': 'fatigue_pitches4',
+        'pitches5': 'fatigue_pitches5',
+        'fatigue_points': 'fatigue_points',
+        'played_today': 'fatigue_played_today',
+    },
+    'strategy': {
+        'override_team': 'strategy_override_team',
+        'stealing': 'strategy_stealing',
+        'running': 'strategy_running',
+        'bunt_for_hit': 'strategy_bunt_for_hit',
+        'sac_bunt': 'strategy_sac_bunt',
+        'hit_run': 'strategy_hit_run',
+        'hook_start': 'strategy_hook_start',
+        'hook_relief': 'strategy_hook_relief',
+        'pitch_count': 'strategy_pitch_count',
+        'pitch_around': 'strategy_pitch_around',
+        'never_pinch_hit': 'strategy_never_pinch_hit',
+        'defensive_sub': 'strategy_defensive_sub',
+        'dtd_sit_min': 'strategy_dtd_sit_min',
+        'dtd_allow_ph': 'strategy_dtd_allow_ph',
+    },
+}
+
+# Every rating source column, in first-seen order - the wide ratings staging layout
+RATING_SOURCE_COLUMNS = tuple(dict.fromkeys(
+    col for key_map in RATING_GROUPS.values() for col in key_map.values()
+))
+
+RATINGS_STAGING_TABLE = 'staging_players_ratings_wide'
+
+# The ratings upsert only depends on RATING_GROUPS, so it is rendered once at import
+RATINGS_UPSERT_SQL = text(
+    "INSERT INTO players_ratings (player_id, season_year, rating_type, ratings)\n"
+    + "\nUNION ALL\n".join(
+        f"SELECT player_id, :season_year, '{rating_type}', jsonb_build_object("
+        + ', '.join(f"'{key}', {col}" for key, col in key_map.items())
+        + f") FROM {RATINGS_STAGING_TABLE}"
+        for rating_type, key_map in RATING_GROUPS.items()
+    )
+    + "\nON CONFLICT (player_id, season_year, rating_type) DO UPDATE SET ratings = EXCLUDED.ratings"
+)
+
 class PlayersLoader(BaseLoader):
     """Loader for normalized players tables"""
 
+    # players.csv columns for each target table
+    CORE_COLUMNS = (
+        'player_id', 'first_name', 'last_name', 'nick_name', 'date_of_birth',
+        'city_of_birth_id', 'nation_id', 'second_nation_id', 'height', 'weight',
+        'bats', 'throws', 'person_type', 'language_ids0', 'language_ids1',
+        'historical_id', 'historical_team_id', 'college', 'acquired', 'acquired_date',
+        'draft_year', 'draft_round', 'draft_supplemental', 'draft_pick', 'draft_overall_pick',
+        'draft_eligible', 'hsc_status', 'redshirt', 'picked_in_draft', 'school',
+        'commit_school', 'draft_league_id', 'draft_team_id'
+    )
+    STATUS_COLUMNS = (
+        'player_id', 'team_id', 'league_id', 'position', 'role', 'uniform_number',
+        'age', 'retired', 'free_agent', 'hall_of_fame', 'inducted', 'turned_coach',
+        'last_league_id', 'last_team_id', 'organization_id', 'last_organization_id',
+        'experience', 'hidden', 'rust', 'local_pop', 'national_pop', 'draft_protected',
+        'on_loan', 'loan_league_id', 'loan_team_id'
+    )
+    CONTRACTS_COLUMNS = (
+        'player_id', 'team_id', 'best_contract_offer_id', 'morale', 'morale_mod',
+        'morale_player_performance', 'morale_team_performance', 'morale_team_transactions',
+        'morale_team_chemistry', 'morale_player_role', 'expectation'
+    )
+
+    # Only parse what the four target tables need
+    CSV_COLUMNS = tuple(dict.fromkeys(
+        CORE_COLUMNS + STATUS_COLUMNS + CONTRACTS_COLUMNS
+        + tuple(col for key_map in RATING_GROUPS.values() for col in key_map.values())
+    ))
+
+    # Explicit dtypes mirroring the target DDL so read_csv never infers types
+    # (nullable integers - OOTP leaves some blank)
+    INT32_COLUMNS = (
+        'player_id', 'city_of_birth_id', 'nation_id', 'second_nation_id',
+        'language_ids0', 'language_ids1', 'draft_league_id', 'draft_team_id',
+        'team_id', 'league_id', 'last_league_id', 'last_team_id', 'organization_id',
+        'last_organization_id', 'loan_league_id', 'loan_team_id', 'best_contract_offer_id'
+    )
+    INT16_COLUMNS = (
+        'height', 'weight', 'bats', 'throws', 'person_type', 'college', 'draft_year',
+        'draft_round', 'draft_supplemental', 'draft_pick', 'draft_overall_pick',
+        'draft_eligible', 'hsc_status', 'redshirt', 'picked_in_draft',
+        'position', 'role', 'uniform_number', 'age', 'retired', 'free_agent',
+        'hall_of_fame', 'inducted', 'turned_coach', 'experience', 'hidden', 'rust',
+        'local_pop', 'national_pop', 'draft_protected', 'on_loan',
+        'morale', 'morale_mod', 'morale_player_performance', 'morale_team_performance',
+        'morale_team_transactions', 'morale_team_chemistry', 'morale_player_role', 'expectation'
+    )
+    # Kept as text so IDs like historical_id keep any leading zeros
+    TEXT_COLUMNS = (
+        'first_name', 'last_name', 'nick_name', 'historical_id', 'historical_team_id',
+        'acquired', 'school', 'commit_school'
+    )
+    # Personality, fatigue and strategy ratings are small integer codes; the injury
+    # group keeps inferred dtypes since its effect columns are not guaranteed integral
+    RATING_INT16_COLUMNS = tuple(
+        col for rating_type in ('personality', 'fatigue', 'strategy')
+        for col in RATING_GROUPS[rating_type].values()
+    )
+    CSV_DTYPES = {
+        **dict.fromkeys(INT32_COLUMNS, 'Int32'),
+        **dict.fromkeys(INT16_COLUMNS, 'Int16'),
+        **dict.fromkeys(RATING_INT16_COLUMNS, 'Int16'),
+        **dict.fromkeys(TEXT_COLUMNS, str),
+    }
+
+    CSV_DATE_COLUMNS = ['date_of_birth', 'acquired_date']
+
     def __init__(self, batch_id: str = None):
         super().__init__(batch_id)
         self.current_season = 2024
@@ -40,40 +194,70 @@ class PlayersLoader(BaseLoader):
         return True
 
     def _handle_incremental_load(self, csv_path: Path) -> bool:
-        """Handle  multi-table incremental load"""
-        logger.info(f"Loading players CSV into normalized tables: {csv_path}")
+        """Handle multi-table incremental load
 
-        # Pre-load operations: Create stub records for missing references
-        self._create_missing_nations(csv_path)
-        self._create_missing_leagues(csv_path)
-        self._create_missing_teams(csv_path)
+        Runs on Core connections throughout. players_core and the stub reference
+        rows commit in one transaction; the dependent tables then load concurrently
+        in a transaction each (see _load_in_own_transaction).
+        """
+        logger.info(f"Loading players CSV into normalized tables: {csv_path}")
 
         try:
-            # Read and prepare data
-            df = pd.read_csv(csv_path)
+            # Read the CSV once - the preflight checks and every target table share it
+            df = pd.read_csv(
+                csv_path,
+                usecols=list(self.CSV_COLUMNS),
+                dtype=self.CSV_DTYPES,
+                engine=CSV_ENGINE
+            )
             self.stats["rows_read"] = len(df)
 
-            # Split data for each target table
-            core_data = self._prepare_core_data(df)
-            status_data = self._prepare_status_data(df)
-            contracts_data = self._prepare_contracts_data(df)
-            ratings_data = self._prepare_ratings_data(df)
-
-            # Laod each table in dependency order
-            with self.db.get_session() as session:
-                # 1. Load core data first
-                core_count = self._load_core_table(core_data, session)
-
-                # 2. Load dependent tables
-                status_count = self._load_status_table(status_data, session)
-                contracts_count = self._load_contracts_table(contracts_data, session)
-                ratings_count = self._load_ratings_table(ratings_data, session)
-
-                session.commit()
-
-                total_rows = core_count + status_count + contracts_count + ratings_count
-                self.stats["rows_inserted"] = total_rows
-                logger.info(f"Successfully loaded players data: core={core_count}, status={status_count}, contracts={contracts_count}, ratings={ratings_count}")
+            # Coerce after the read: parse_dates leaves a column with any unparseable
+            # value (e.g. 0000-00-00) as strings, which the DATE COPY would reject
+            for col in self.CSV_DATE_COLUMNS:
+                df[col] = pd.to_datetime(df[col], errors='coerce')
+
+            # Every target table is keyed by player_id (plus the constant season), so keep
+            # one row per player - a repeated key would also make ON CONFLICT DO UPDATE fail
+            df = df.drop_duplicates(subset=['player_id'], keep='last')
+
+            # Every frame below is sliced from df, so sorting once makes each COPY arrive
+            # in conflict-key order and the upserts walk the player_id indexes sequentially
+            df = df.sort_values('player_id', kind='stable', ignore_index=True)
+
+            with self.db.engine.begin() as conn:
+                # The load is idempotent and re-run on failure, so skip the commit fsync
+                conn.execute(text("SET LOCAL synchronous_commit = off"))
+
+                # Pre-load operations: Create stub records for missing references
+                # in the same transaction as the core load
+                self._create_missing_nations(df, conn)
+                self._create_missing_leagues(df, conn)
+                self._create_missing_teams(df, conn)
+
+                # 1. Load core data first - the other tables reference players_core
+                core_count = self._load_core_table(self._prepare_core_data(df), conn)
+
+            # 2. With core committed, load the dependent tables concurrently, each in
+            #    its own transaction on its own connection (the TEMP staging tables are
+            #    per-connection, so they never collide). If one fails, the others and
+            #    core stay committed and the file is recorded as failed; every load is
+            #    an idempotent upsert, so the next run retries the whole file
+            dependent_loads = {
+                'status': (self._load_status_table, self._prepare_status_data(df)),
+                'contracts': (self._load_contracts_table, self._prepare_contracts_data(df)),
+                'ratings': (self._load_ratings_table, self._prepare_ratings_staging(df)),
+            }
+            with ThreadPoolExecutor(max_workers=len(dependent_loads)) as executor:
+                futures = {
+                    name: executor.submit(self._load_in_own_transaction, load_table, frame)
+                    for name, (load_table, frame) in dependent_loads.items()
+                }
+            counts = {name: future.result() for name, future in futures.items()}
+
+            total_rows = core_count + sum(counts.values())
+            self.stats["rows_inserted"] = total_rows
+            logger.info(f"Successfully loaded players data: core={core_count}, status={counts['status']}, contracts={counts['contracts']}, ratings={counts['ratings']}")
             self._record_file_completion(csv_path, 'success')
             return True
         except Exception as e:
@@ -81,171 +265,90 @@ class PlayersLoader(BaseLoader):
             self._record_file_completion(csv_path, 'failed', str(e))
             raise
 
+    def _load_in_own_transaction(self, load_table, frame: pd.DataFrame) -> int:
+        """Run one _load_*_table call on its own connection and commit it"""
+        with self.db.engine.begin() as conn:
+            conn.execute(text("SET LOCAL synchronous_commit = off"))
+            count = load_table(frame, conn)
+        return count
+
     def _prepare_core_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Prepare data for players_core table"""
-        core_columns = [
-            'player_id', 'first_name', 'last_name', 'nick_name', 'date_of_birth',
-            'city_of_birth_id', 'nation_id', 'second_nation_id', 'height', 'weight',
-            'bats', 'throws', 'person_type', 'language_ids0', 'language_ids1',
-            'historical_id', 'historical_team_id', 'college', 'acquired', 'acquired_date',
-            'draft_year', 'draft_round', 'draft_supplemental', 'draft_pick', 'draft_overall_pick',
-            'draft_eligible', 'hsc_status', 'redshirt', 'picked_in_draft', 'school',
-            'commit_school', 'draft_league_id', 'draft_team_id'
-        ]
-
-        core_df = df[core_columns].copy()
-
-        # Handle date conversions
-        core_df['date_of_birth'] = pd.to_datetime(core_df['date_of_birth'], errors='coerce')
-        core_df['acquired_date'] = pd.to_datetime(core_df['acquired_date'], errors='coerce')
-
-        # Add timestamps
-        core_df['created_at'] = pd.Timestamp.now()
-        core_df['updated_at'] = pd.Timestamp.now()
-
-        return core_df
+        # Dates are already coerced after the read; created_at/updated_at are left
+        # to the column defaults on insert
+        return df[list(self.CORE_COLUMNS)]
 
     def _prepare_status_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Prepare data for players_current_status table"""
-        status_columns = [
-            'player_id', 'team_id', 'league_id', 'position', 'role', 'uniform_number',
-            'age', 'retired', 'free_agent', 'hall_of_fame', 'inducted', 'turned_coach',
-            'last_league_id', 'last_team_id', 'organization_id', 'last_organization_id',
-            'experience', 'hidden', 'rust', 'local_pop', 'national_pop', 'draft_protected',
-            'on_loan', 'loan_league_id', 'loan_team_id'
-        ]
-
-        status_df = df[status_columns].copy()
-        status_df['season_year'] = self.current_season
-        status_df['last_updated'] = pd.Timestamp.now()
-
-        return status_df
+        # last_updated is left to the column default and season_year is bound in the upsert
+        return df[list(self.STATUS_COLUMNS)]
 
     def _prepare_contracts_data(self, df: pd.DataFrame) -> pd.DataFrame:
         """Prepare data for players_contracts table"""
-        contracts_columns = [
-            'player_id', 'best_contract_offer_id', 'morale', 'morale_mod',
-            'morale_player_performance', 'morale_team_performance', 'morale_team_transactions',
-            'morale_team_chemistry', 'morale_player_role', 'expectation'
-        ]
-
-        contracts_df = df[contracts_columns].copy()
-        contracts_df['season_year'] = self.current_season
-        contracts_df['team_id'] = df['team_id']  # Add team_id for context
-
-        return contracts_df
-
-    def _prepare_ratings_data(self, df: pd.DataFrame) -> List[Dict]:
-        """Prepare JSONB ratings data for players_ratings table"""
-        ratings_records = []
-
-        for _, row in df.iterrows():
-            player_id = row['player_id']
-
-            # Personality ratings
-            personality_data = {
-                'greed': row['personality_greed'],
-                'loyalty': row['personality_loyalty'],
-                'play_for_winner': row['personality_play_for_winner'],
-                'work_ethic': row['personality_work_ethic'],
-                'intelligence': row['personality_intelligence'],
-                'leader': row['personality_leader']
-            }
-            ratings_records.append({
-                'player_id': player_id,
-                'season_year': self.current_season,
-                'rating_type': 'personality',
-                'ratings': json.dumps(personality_data)
-            })
-
-            # Injury ratings
-            injury_data = {
-                'is_injured': row['injury_is_injured'],
-                'dtd_injury': row['injury_dtd_injury'],
-                'career_ending': row['injury_career_ending'],
-                'dl_left': row['injury_dl_left'],
-                'dl_playoff_round': row['injury_dl_playoff_round'],
-                'injury_left': row['injury_left'],
-                'dtd_injury_effect': row['dtd_injury_effect'],
-                'dtd_injury_effect_hit': row['dtd_injury_effect_hit'],
-                'dtd_injury_effect_throw': row['dtd_injury_effect_throw'],
-                'dtd_injury_effect_run': row['dtd_injury_effect_run'],
-                'injury_id': row['injury_id'],
-                'injury_id2': row['injury_id2'],
-                'injury_dtd_injury2': row['injury_dtd_injury2'],
-                'injury_left2': row['injury_left2'],
-                'dtd_injury_effect2': row['dtd_injury_effect2'],
-                'dtd_injury_effect_hit2': row['dtd_injury_effect_hit2'],
-                'dtd_injury_effect_throw2': row['dtd_injury_effect_throw2'],
-                'dtd_injury_effect_run2': row['dtd_injury_effect_run2'],
-                'prone_overall': row['prone_overall'],
-                'prone_leg': row['prone_leg'],
-                'prone_back': row['prone_back'],
-                'prone_arm': row['prone_arm']
-            }
-            ratings_records.append({
-                'player_id': player_id,
-                'season_year': self.current_season,
-                'rating_type': 'injury',
-                'ratings': json.dumps(injury_data)
-            })
-
-            # Fatigue ratings
-            fatigue_data = {
-                'pitches0': row['fatigue_pitches0'],
-                'pitches1': row['fatigue_pitches1'],
-                'pitches2': row['fatigue_pitches2'],
-                'pitches3': row['fatigue_pitches3'],
-                'pitches4': row['fatigue_pitches4'],
-                'pitches5': row['fatigue_pitches5'],
-                'fatigue_points': row['fatigue_points'],
-                'played_today': row['fatigue_played_today']
-            }
-            ratings_records.append({
-                'player_id': player_id,
-                'season_year': self.current_season,
-                'rating_type': 'fatigue',
-                'ratings': json.dumps(fatigue_data)
-            })
-
-            # Strategy ratings
-            strategy_data = {
-                'override_team': row['strategy_override_team'],
-                'stealing': row['strategy_stealing'],
-                'running': row['strategy_running'],
-                'bunt_for_hit': row['strategy_bunt_for_hit'],
-                'sac_bunt': row['strategy_sac_bunt'],
-                'hit_run': row['strategy_hit_run'],
-                'hook_start': row['strategy_hook_start'],
-                'hook_relief': row['strategy_hook_relief'],
-                'pitch_count': row['strategy_pitch_count'],
-                'pitch_around': row['strategy_pitch_around'],
-                'never_pinch_hit': row['strategy_never_pinch_hit'],
-                'defensive_sub': row['strategy_defensive_sub'],
-                'dtd_sit_min': row['strategy_dtd_sit_min'],
-                'dtd_allow_ph': row['strategy_dtd_allow_ph']
-            }
-            ratings_records.append({
-                'player_id': player_id,
-                'season_year': self.current_season,
-                'rating_type': 'strategy',
-                'ratings': json.dumps(strategy_data)
-            })
-
-        return ratings_records
-
-    def _load_core_table(self, core_df: pd.DataFrame, session) -> int:
+        # season_year is bound in the upsert rather than broadcast into a column
+        return df[list(self.CONTRACTS_COLUMNS)]
+
+    def _prepare_ratings_staging(self, df: pd.DataFrame) -> pd.DataFrame:
+        """Prepare the raw rating columns; the JSONB documents are built in SQL"""
+        return df[['player_id', *RATING_SOURCE_COLUMNS]]
+
+    def _copy_df_to_staging(self, df: pd.DataFrame, target_table: str, conn,
+                            like_target: bool = True) -> str:
+        """COPY a prepared frame into a TEMP staging table named after target_table
+
+        The staging table is shaped like target_table, or built from the frame's own
+        dtypes when like_target is False. Runs on the caller's connection, so the
+        staging table and the upsert that reads it share the players load transaction.
+        """
+        staging_table = f"staging_{target_table}"
+
+        # Integer columns with gaps parse as float; write them as integers so
+        # COPY accepts them into the SMALLINT/INTEGER staging columns
+        integral_floats = {
+            col: 'Int64' for col in df.columns
+            if df[col].dtype.kind == 'f' and (df[col].dropna() % 1 == 0).all()
+        }
+        if integral_floats:
+            df = df.astype(integral_floats)
+
+        # Stream CSV slices straight into COPY; unquoted empty fields are read back as NULL
+        buffer = DataFrameCSVStream(df)
+
+        with conn.connection.cursor() as cursor:
+            # ON COMMIT DROP: the staging table disappears with the load transaction
+            if like_target:
+                cursor.execute(f"CREATE TEMP TABLE {staging_table} (LIKE {target_table} INCLUDING DEFAULTS) ON COMMIT DROP")
+            else:
+                column_defs = ', '.join(f"{col} {self._staging_column_type(dtype)}" for col, dtype in df.dtypes.items())
+                cursor.execute(f"CREATE TEMP TABLE {staging_table} ({column_defs}) ON COMMIT DROP")
+            cursor.copy_expert(
+                f"COPY {staging_table} ({', '.join(df.columns)}) FROM STDIN WITH (FORMAT csv)", buffer
+            )
+        return staging_table
+
+    @staticmethod
+    def _staging_column_type(dtype) -> str:
+        """Map a frame dtype to the column type used for ad-hoc staging tables"""
+        if pd.api.types.is_bool_dtype(dtype):
+            return 'BOOLEAN'
+        if pd.api.types.is_integer_dtype(dtype):
+            return 'BIGINT'
+        if pd.api.types.is_float_dtype(dtype):
+            return 'DOUBLE PRECISION'
+        return 'TEXT'
+
+    def _load_core_table(self, core_df: pd.DataFrame, conn) -> int:
         """Load data into players_core table"""
         logger.info("Loading players_core table")
 
-        # Create temporary staging table
-        staging_table = "staging_players_core"
-        core_df.to_sql(staging_table, self.db.engine, if_exists='replace', index=False, method='multi')
+        # COPY into a connection-local staging table
+        staging_table = self._copy_df_to_staging(core_df, 'players_core', conn)
+        columns = ', '.join(core_df.columns)
 
         # Perform UPSERT from staging to target
         upsert_sql = text(f"""
-            INSERT INTO players_core 
-            SELECT * FROM {staging_table}
+            INSERT INTO players_core ({columns})
+            SELECT {columns} FROM {staging_table}
             ON CONFLICT (player_id) DO UPDATE SET
                 first_name = EXCLUDED.first_name,
                 last_name = EXCLUDED.last_name,
@@ -258,26 +361,24 @@ class PlayersLoader(BaseLoader):
                 weight = EXCLUDED.weight,
                 bats = EXCLUDED.bats,
                 throws = EXCLUDED.throws,
-                updated_at = CURRENT_TIMESTAMP;
-
-            DROP TABLE {staging_table};
+                updated_at = CURRENT_TIMESTAMP
         """)
 
-        session.execute(upsert_sql)
+        conn.execute(upsert_sql)
         return len(core_df)
 
-    def _load_status_table(self, status_df: pd.DataFrame, session) -> int:
+    def _load_status_table(self, status_df: pd.DataFrame, conn) -> int:
         """Load data into players_current_status table"""
         logger.info("Loading players_current_status table")
 
-        # Create temporary staging table
-        staging_table = "staging_players_current_status"
-        status_df.to_sql(staging_table, self.db.engine, if_exists='replace', index=False, method='multi')
+        # COPY into a connection-local staging table
+        staging_table = self._copy_df_to_staging(status_df, 'players_current_status', conn)
+        columns = ', '.join(status_df.columns)
 
         # Perform UPSERT from staging to target
         upsert_sql = text(f"""
-            INSERT INTO players_current_status 
-            SELECT * FROM {staging_table}
+            INSERT INTO players_current_status ({columns}, season_year)
+            SELECT {columns}, :season_year FROM {staging_table}
             ON CONFLICT (player_id) DO UPDATE SET
                 team_id = EXCLUDED.team_id,
                 league_id = EXCLUDED.league_id,
@@ -304,25 +405,24 @@ class PlayersLoader(BaseLoader):
                 loan_league_id = EXCLUDED.loan_league_id,
                 loan_team_id = EXCLUDED.loan_team_id,
                 season_year = EXCLUDED.season_year,
-                last_updated = CURRENT_TIMESTAMP;
-            DROP TABLE {staging_table};
+                last_updated = CURRENT_TIMESTAMP
         """)
 
-        session.execute(upsert_sql)
+        conn.execute(upsert_sql, {'season_year': self.current_season})
         return len(status_df)
 
-    def _load_contracts_table(self, contracts_df: pd.DataFrame, session) -> int:
+    def _load_contracts_table(self, contracts_df: pd.DataFrame, conn) -> int:
         """Load data into players_contracts table"""
         logger.info("Loading players_contracts table")
 
-        # Create temporary staging table
-        staging_table = "staging_players_contracts"
-        contracts_df.to_sql(staging_table, self.db.engine, if_exists='replace', index=False, method='multi')
+        # COPY into a connection-local staging table
+        staging_table = self._copy_df_to_staging(contracts_df, 'players_contracts', conn)
+        columns = ', '.join(contracts_df.columns)
 
         # Perform UPSERT from staging to target
         upsert_sql = text(f"""
-             INSERT INTO players_contracts 
-             SELECT * FROM {staging_table}
+             INSERT INTO players_contracts ({columns}, season_year)
+             SELECT {columns}, :season_year FROM {staging_table}
              ON CONFLICT (player_id, season_year) DO UPDATE SET
                  team_id = EXCLUDED.team_id,
                  best_contract_offer_id = EXCLUDED.best_contract_offer_id,
@@ -333,47 +433,26 @@ class PlayersLoader(BaseLoader):
                  morale_team_transactions = EXCLUDED.morale_team_transactions,
                  morale_team_chemistry = EXCLUDED.morale_team_chemistry,
                  morale_player_role = EXCLUDED.morale_player_role,
-                 expectation = EXCLUDED.expectation;
-
-             DROP TABLE {staging_table};
+                 expectation = EXCLUDED.expectation
          """)
 
-        session.execute(upsert_sql)
+        conn.execute(upsert_sql, {'season_year': self.current_season})
         return len(contracts_df)
 
-    def _load_ratings_table(self, ratings_df: pd.DataFrame, session) -> int:
+    def _load_ratings_table(self, ratings_df: pd.DataFrame, conn) -> int:
         """Load data into players_ratings table"""
         logger.info("Loading players_ratings table")
 
-        # Convert DataFrame to list of dicts if it's a DataFrame
-        if isinstance(ratings_df, pd.DataFrame):
-            ratings_records = ratings_df.to_dict('records')
-        else:
-            # It's already a list of dicts from _prepare_ratings_data
-            ratings_records = ratings_df
-
-        if not ratings_records:
+        if ratings_df.empty:
             logger.warning("No ratings data to load")
             return 0
 
-        # Insert directly without staging table due to JSONB complexity
-        import json
-        for record in ratings_records:
-            insert_sql = text("""
-                INSERT INTO players_ratings (player_id, season_year, rating_type, ratings)
-                VALUES (:player_id, :season_year, :rating_type, :ratings)
-                ON CONFLICT (player_id, season_year, rating_type) DO UPDATE SET
-                    ratings = EXCLUDED.ratings
-            """)
-
-            session.execute(insert_sql, {
-                'player_id': record['player_id'],
-                'season_year': record['season_year'],
-                'rating_type': record['rating_type'],
-                'ratings': json.dumps(record['ratings'])
-            })
-
-        return len(ratings_records)
+        # COPY the raw rating columns once; every rating type is built from the same staging rows
+        self._copy_df_to_staging(ratings_df, 'players_ratings_wide', conn, like_target=False)
+
+        # Let PostgreSQL assemble the JSONB documents in one set-based upsert
+        conn.execute(RATINGS_UPSERT_SQL, {'season_year': self.current_season})
+        return len(ratings_df) * len(RATING_GROUPS)
 
     def _get_current_season(self) -> int:
         """Get current season from leagues table"""
@@ -387,217 +466,113 @@ class PlayersLoader(BaseLoader):
             logger.warning(f"Could not detect season from leagues, using default 2024: {e}")
             return 2024
 
-    def _create_missing_nations(self, csv_path: Path):
-        """Create stub nation records for any nation_ids in players.csv that don't exist in nations table"""
-        logger.info("Checking for missing nations referenced in players.csv")
-
-        try:
-            # Read players.csv to get all nation_ids
-            df = pd.read_csv(csv_path)
-
-            # Collect all nation_id columns (birth nation and second nation)
-            nation_id_columns = ['nation_id', 'second_nation_id']
-            all_nation_ids = set()
-
-            for col in nation_id_columns:
-                if col in df.columns:
-                    nation_ids = set(df[col].dropna().unique())
-                    all_nation_ids.update(nation_ids)
+    def _collect_ids(self, df: pd.DataFrame, columns: List[str]) -> np.ndarray:
+        """Unique non-null integer IDs across the given columns"""
+        arrays = [df[col].dropna().to_numpy(dtype=np.int64) for col in columns if col in df.columns]
+        if not arrays:
+            return np.empty(0, dtype=np.int64)
+        return np.unique(np.concatenate(arrays))
+
+    def _find_missing_ids(self, ids: np.ndarray, table: str, id_column: str, conn) -> List[int]:
+        """IDs not present in table - the anti-join runs in Postgres instead of pulling the table"""
+        missing_sql = text(f"""
+            SELECT x FROM unnest(CAST(:ids AS bigint[])) AS t(x)
+            EXCEPT
+            SELECT {id_column} FROM {table}
+        """)
+        result = conn.execute(missing_sql, {'ids': ids.tolist()})
+        return sorted(row[0] for row in result)
 
-            # Convert to integers and exclude 0 (which is reserved for "Unknown")
-            all_nation_ids = {int(nid) for nid in all_nation_ids if int(nid) != 0}
+    def _create_missing_stubs(self, df: pd.DataFrame, conn, table: str, id_column: str,
+                              source_columns: List[str], stub_name: Callable[[int], Tuple[str, str]],
+                              defaults: Dict[str, str], abbr_column: str = 'abbr', skip_zero: bool = False):
+        """Create stub rows in table for any IDs in source_columns that it doesn't have yet
 
-            if not all_nation_ids:
-                logger.info("No nation_ids found in players.csv")
-                return
+        stub_name maps a missing ID to its (name, abbreviation); defaults gives the
+        SQL value for every other column inserted. Runs in a savepoint and never
+        raises, so a failure leaves the load to surface any FK violation itself.
+        """
+        entity = id_column[:-len('_id')]
+        logger.info(f"Checking for missing {table} referenced in players.csv")
 
-            logger.info(f"Found {len(all_nation_ids)} unique nation_ids in players.csv")
+        try:
+            # Savepoint so a failure here leaves the load transaction usable
+            with conn.begin_nested():
+                ids = self._collect_ids(df, source_columns)
+                if skip_zero:
+                    ids = ids[ids != 0]
 
-            # Get existing nation_ids from database
-            existing_nations_sql = text("SELECT nation_id FROM nations")
-            result = self.db.execute_sql(existing_nations_sql)
-            existing_nation_ids = {row[0] for row in result}
+                if not len(ids):
+                    logger.info(f"No {id_column}s found in players.csv")
+                    return
 
-            # Find missing nation_ids
-            missing_nation_ids = all_nation_ids - existing_nation_ids
+                logger.info(f"Found {len(ids)} unique {id_column}s in players.csv")
 
-            if not missing_nation_ids:
-                logger.info("All nation_ids already exist in nations table")
-                return
+                # The anti-join runs in Postgres instead of pulling the table
+                missing_ids = self._find_missing_ids(ids, table, id_column, conn)
 
-            logger.warning(f"Found {len(missing_nation_ids)} missing nation_ids: {sorted(missing_nation_ids)}")
-            logger.info("Creating stub nation records for orphaned nation references")
+                if not missing_ids:
+                    logger.info(f"All {id_column}s already exist in {table} table")
+                    return
 
-            # Create stub records for missing nations
-            for nation_id in sorted(missing_nation_ids):
-                name = f"Nation {nation_id}"
-                abbr = f"N{nation_id}"
+                logger.warning(f"Found {len(missing_ids)} missing {id_column}s: {missing_ids}")
+                logger.info(f"Creating stub {entity} records for missing {table}")
 
-                insert_sql = text("""
-                    INSERT INTO nations (
-                        nation_id, name, abbreviation, continent_id
+                # Create stub records for all missing IDs in a single statement
+                names, abbrs = zip(*(stub_name(missing_id) for missing_id in missing_ids))
+                insert_sql = text(f"""
+                    INSERT INTO {table} (
+                        {id_column}, name, {abbr_column}, {', '.join(defaults)}
                     )
-                    VALUES (
-                        :nation_id, :name, :abbr, 1
-                    )
-                    ON CONFLICT (nation_id) DO NOTHING
+                    SELECT t.id, t.name, t.abbr, {', '.join(defaults.values())}
+                    FROM unnest(CAST(:ids AS int[]), CAST(:names AS text[]), CAST(:abbrs AS text[])) AS t(id, name, abbr)
+                    ON CONFLICT ({id_column}) DO NOTHING
                 """)
 
-                self.db.execute_sql(insert_sql, {'nation_id': int(nation_id), 'name': name, 'abbr': abbr})
-                logger.info(f"Created stub nation record for nation_id={nation_id} ('{name}')")
-
-            logger.success(f"Successfully created {len(missing_nation_ids)} stub nation records")
+                conn.execute(insert_sql, {'ids': missing_ids, 'names': list(names), 'abbrs': list(abbrs)})
+                logger.success(f"Successfully created {len(missing_ids)} stub {entity} records")
 
         except Exception as e:
-            logger.error(f"Error creating missing nations: {e}")
+            logger.error(f"Error creating missing {table}: {e}")
             # Don't raise - allow load to continue and fail with FK violation if needed
 
-    def _create_missing_leagues(self, csv_path: Path):
+    def _create_missing_nations(self, df: pd.DataFrame, conn):
+        """Create stub nation records for any nation_ids in players.csv that don't exist in nations table"""
+        # Birth nation and second nation, excluding 0 (which is reserved for "Unknown")
+        self._create_missing_stubs(
+            df, conn, 'nations', 'nation_id', ['nation_id', 'second_nation_id'],
+            stub_name=lambda nation_id: (f"Nation {nation_id}", f"N{nation_id}"),
+            defaults={'continent_id': '1'},
+            abbr_column='abbreviation', skip_zero=True
+        )
+
+    def _create_missing_leagues(self, df: pd.DataFrame, conn):
         """Create stub league records for any league_ids in players.csv that don't exist in leagues table"""
-        logger.info("Checking for missing leagues referenced in players.csv")
-
-        try:
-            # Read players.csv to get all league_ids
-            df = pd.read_csv(csv_path)
-
-            # Collect all league_id columns
-            league_id_columns = ['league_id', 'last_league_id', 'loan_league_id']
-            all_league_ids = set()
-
-            for col in league_id_columns:
-                if col in df.columns:
-                    league_ids = set(df[col].dropna().unique())
-                    all_league_ids.update(league_ids)
-
-            # Convert to integers (keep ALL values including negatives - OOTP uses negative league_ids for special states)
-            all_league_ids = {int(lid) for lid in all_league_ids}
-
-            if not all_league_ids:
-                logger.info("No league_ids found in players.csv")
-                return
-
-            logger.info(f"Found {len(all_league_ids)} unique league_ids in players.csv")
-
-            # Get existing league_ids from database
-            existing_leagues_sql = text("SELECT league_id FROM leagues")
-            result = self.db.execute_sql(existing_leagues_sql)
-            existing_league_ids = {row[0] for row in result}
-
-            # Find missing league_ids
-            missing_league_ids = all_league_ids - existing_league_ids
-
-            if not missing_league_ids:
-                logger.info("All league_ids already exist in leagues table")
-                return
-
-            logger.warning(f"Found {len(missing_league_ids)} missing league_ids: {sorted(missing_league_ids)}")
-            logger.info("Creating stub league records for missing leagues")
-
-            # Create stub records for missing leagues
-            for league_id in sorted(missing_league_ids):
-                # Determine the league name based on league_id
-                if league_id == 0:
-                    name = "No League"
-                    abbr = "NONE"
-                else:
-                    name = f"SPECIAL_{league_id}"
-                    abbr = f"SP{league_id}"
-
-                insert_sql = text("""
-                    INSERT INTO leagues (
-                        league_id, name, abbr, nation_id, language_id, logo_file_name,
-                        parent_league_id, league_state, season_year, league_level,
-                        game_date, current_date_year
-                    )
-                    VALUES (
-                        :league_id, :name, :abbr, 0, NULL, NULL,
-                        NULL, 0, 0, 0,
-                        NULL, 0
-                    )
-                    ON CONFLICT (league_id) DO NOTHING
-                """)
-
-                self.db.execute_sql(insert_sql, {'league_id': int(league_id), 'name': name, 'abbr': abbr})
-                logger.info(f"Created stub league record for league_id={league_id} ('{name}')")
-
-            logger.success(f"Successfully created {len(missing_league_ids)} stub league records")
-
-        except Exception as e:
-            logger.error(f"Error creating missing leagues: {e}")
-            # Don't raise - allow load to continue and fail with FK violation if needed
+        # Keep ALL values including negatives - OOTP uses negative league_ids for special states.
+        # league_id 0 is "No League"; anything else is a special OOTP state
+        self._create_missing_stubs(
+            df, conn, 'leagues', 'league_id', ['league_id', 'last_league_id', 'loan_league_id'],
+            stub_name=lambda league_id: ("No League", "NONE") if league_id == 0
+            else (f"SPECIAL_{league_id}", f"SP{league_id}"),
+            defaults={
+                'nation_id': '0', 'language_id': 'NULL', 'logo_file_name': 'NULL',
+                'parent_league_id': 'NULL', 'league_state': '0', 'season_year': '0', 'league_level': '0',
+                'game_date': 'NULL', 'current_date_year': '0',
+            }
+        )
 
-    def _create_missing_teams(self, csv_path: Path):
+    def _create_missing_teams(self, df: pd.DataFrame, conn):
         """Create stub team records for any team_ids in players.csv that don't exist in teams table"""
-        logger.info("Checking for missing teams referenced in players.csv")
-
-        try:
-            # Read players.csv to get all team_ids
-            df = pd.read_csv(csv_path)
-
-            # Collect all team_id columns
-            team_id_columns = ['team_id', 'last_team_id', 'organization_id', 'last_organization_id']
-            all_team_ids = set()
-
-            for col in team_id_columns:
-                if col in df.columns:
-                    team_ids = set(df[col].dropna().unique())
-                    all_team_ids.update(team_ids)
-
-            # Convert to integers (keep ALL values including negatives - OOTP may use negative team_ids)
-            all_team_ids = {int(tid) for tid in all_team_ids}
-
-            if not all_team_ids:
-                logger.info("No team_ids found in players.csv")
-                return
-
-            logger.info(f"Found {len(all_team_ids)} unique team_ids in players.csv")
-
-            # Get existing team_ids from database
-            existing_teams_sql = text("SELECT team_id FROM teams")
-            result = self.db.execute_sql(existing_teams_sql)
-            existing_team_ids = {row[0] for row in result}
-
-            # Find missing team_ids
-            missing_team_ids = all_team_ids - existing_team_ids
-
-            if not missing_team_ids:
-                logger.info("All team_ids already exist in teams table")
-                return
-
-            logger.warning(f"Found {len(missing_team_ids)} missing team_ids: {sorted(missing_team_ids)}")
-            logger.info("Creating stub team records for missing teams")
-
-            # Create stub records for missing teams
-            for team_id in sorted(missing_team_ids):
-                # Determine the team name based on team_id
-                if team_id == 0:
-                    name = "Free Agents"
-                    abbr = "FA"
-                else:
-                    name = f"SPECIAL_{team_id}"
-                    abbr = f"SP{team_id}"
-
-                insert_sql = text("""
-                    INSERT INTO teams (
-                        team_id, name, abbr, nickname, logo_file_name, city_id,
-                        park_id, league_id, sub_league_id, division_id, nation_id,
-                        parent_team_id, level, prevent_any_moves, human_team, human_id,
-                        gender, allstar_team
-                    )
-                    VALUES (
-                        :team_id, :name, :abbr, NULL, NULL, NULL,
-                        NULL, NULL, NULL, NULL, 0,
-                        NULL, 0, 0, 0, NULL,
-                        0, 0
-                    )
-                    ON CONFLICT (team_id) DO NOTHING
-                """)
-
-                self.db.execute_sql(insert_sql, {'team_id': int(team_id), 'name': name, 'abbr': abbr})
-                logger.info(f"Created stub team record for team_id={team_id} ('{name}')")
-
-            logger.success(f"Successfully created {len(missing_team_ids)} stub team records")
-
-        except Exception as e:
-            logger.error(f"Error creating missing teams: {e}")
-            # Don't raise - allow load to continue and fail with FK violation if needed
\ No newline at end of file
+        # Keep ALL values including negatives - OOTP may use negative team_ids.
+        # team_id 0 is "Free Agents"; anything else is a special OOTP state
+        self._create_missing_stubs(
+            df, conn, 'teams', 'team_id', ['team_id', 'last_team_id', 'organization_id', 'last_organization_id'],
+            stub_name=lambda team_id: ("Free Agents", "FA") if team_id == 0
+            else (f"SPECIAL_{team_id}", f"SP{team_id}"),
+            defaults={
+                'nickname': 'NULL', 'logo_file_name': 'NULL', 'city_id': 'NULL',
+                'park_id': 'NULL', 'league_id': 'NULL', 'sub_league_id': 'NULL', 'division_id': 'NULL', 'nation_id': '0',
+                'parent_team_id': 'NULL', 'level': '0', 'prevent_any_moves': '0', 'human_team': '0', 'human_id': 'NULL',
+                'gender': '0', 'allstar_team': '0',
+            }
+        )
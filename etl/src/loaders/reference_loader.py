@@ -1,40 +1,79 @@
 """Loader for static reference tables"""
-from typing import List
+from typing import Dict, Iterator, List, Optional, Tuple
+import csv
 from pathlib import Path
+from types import MappingProxyType
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from graphlib import TopologicalSorter
 from loguru import logger
-from .base_loader import BaseLoader
-from ..utils.checksum import calculate_file_checksum
+from .base_loader import BaseLoader, HAS_PYARROW
+from ..utils.checksum import calculate_file_fingerprint
 from ..utils.message_filter import MessageFilter
+from ..utils.csv_preprocessor import CSVPreprocessor
 from sqlalchemy import text
-from typing import Optional, Dict
+import numpy as np
 import pandas as pd
 
 
+# Every trade_history column besides date/summary is an integer id, round or amount
+_TRADE_SIDE_INT_COLUMNS = [
+    col for side in (0, 1) for col in (
+        [f'team_id_{side}']
+        + [f'player_id_{side}_{i}' for i in range(10)]
+        + [f'draft_{kind}_{side}_{i}' for i in range(5) for kind in ('round', 'team')]
+        + [f'cash_{side}', f'iafa_cap_{side}']
+    )
+]
+
 
 class ReferenceLoader(BaseLoader):
     """Loader for static reference tables that rarely change"""
 
+    # Rows parsed and staged per read_csv chunk
+    CHUNK_SIZE = 50_000
+
+    # CSV size above which a full load drops secondary indexes and rebuilds them afterwards
+    INDEX_REBUILD_MIN_BYTES = 4 * 1024 * 1024
+
+    # filename -> CSV-side dedup columns; the config is static, so compute them once per file
+    _dedup_subset_cache: Dict[str, Optional[List[str]]] = {}
+
+    # filename -> stored checksum, filled once per run by load_metadata_snapshot()
+    _checksum_cache: Optional[Dict[str, str]] = None
+
+    # filename -> (file_size, mtime_ns) stored with that checksum, filled alongside _checksum_cache
+    _stat_cache: Optional[Dict[str, Tuple[Optional[int], Optional[int]]]] = None
+
+    # (filename, checksum, file_size, mtime_ns, load_strategy) rows waiting for flush_checksum_updates()
+    _pending_checksum_updates: Optional[List[Tuple[str, str, int, int, str]]] = None
+
     # Map CSV filenames to database tables and their keys
-    REFERENCE_TABLES = {
+    REFERENCE_TABLES = MappingProxyType({
         'continents.csv': {
             'table': 'continents',
             'primary_keys': ['continent_id'],
-            'load_order': 1
+            'load_order': 1,
+            'depends_on': []
         },
         'nations.csv': {
             'table': 'nations',
             'primary_keys': ['nation_id'],
-            'load_order': 2
+            'load_order': 2,
+            'depends_on': ['continents.csv'],
+            # nation_id=0 is referenced by parks (and stub leagues) but absent from the export
+            'placeholder_rows': [{'nation_id': 0, 'name': 'Unknown', 'abbreviation': 'UNK', 'continent_id': 1}]
         },
         'states.csv': {
             'table': 'states',
             'primary_keys': ['state_id', 'nation_id'],
-            'load_order': 3
+            'load_order': 3,
+            'depends_on': ['nations.csv']
         },
         'cities.csv': {
             'table': 'cities',
             'primary_keys': ['city_id'],
             'load_order': 4,
+            'depends_on': ['nations.csv'],
             'column_mapping': {
                 'city_id': 'city_id',
                 'nation_id': 'nation_id',
@@ -55,12 +94,14 @@ class ReferenceLoader(BaseLoader):
         'languages.csv': {
             'table': 'languages',
             'primary_keys': ['language_id'],
-            'load_order': 5
+            'load_order': 5,
+            'depends_on': []
         },
         'parks.csv': {
             'table': 'parks',
             'primary_keys': ['park_id'],
             'load_order': 6,
+            'depends_on': ['nations.csv'],
             'column_mapping': {
                 'park_id': 'park_id',
                 'name': 'name',
@@ -87,12 +128,19 @@ class ReferenceLoader(BaseLoader):
                 'd': 'd',
                 't': 't',
                 'hr': 'hr',
+            },
+            'dtypes': {
+                **dict.fromkeys(['park_id', 'nation_id', 'capacity'], 'Int32'),
+                **dict.fromkeys(['type', 'foul_ground', 'turf'], 'Int16'),
+                **{f'distances{i}': 'Int16' for i in range(7)},
+                **{f'wall_heights{i}': 'Int16' for i in range(7)},
             }
         },
           'leagues.csv': {
               'table': 'leagues',
               'primary_keys': ['league_id'],
               'load_order': 7,
+              'depends_on': ['nations.csv', 'languages.csv'],
               'column_mapping': {
                   'league_id': 'league_id',
                   'name': 'name',
@@ -109,12 +157,14 @@ class ReferenceLoader(BaseLoader):
               'calculated_fields': {
                   'current_date_year': 'EXTRACT(YEAR FROM current_date::date)',
                   'parent_league_id': 'NULLIF(parent_league_id, 0)'
-              }
+              },
+              'dtypes': {'league_state': 'Int16', 'league_level': 'Int16'}
         },
         'teams.csv': {
             'table': 'teams',
             'primary_keys': ['team_id'],
             'load_order': 8,
+            'depends_on': ['cities.csv', 'parks.csv', 'leagues.csv'],
             'calculated_fields': {
                 'parent_team_id': 'NULLIF(parent_team_id, 0)',
                 'city_id': 'NULLIF(city_id, 0)',
@@ -130,11 +180,13 @@ class ReferenceLoader(BaseLoader):
             'table': 'sub_leagues',
             'primary_keys': ['league_id', 'sub_league_id'],
             'load_order': 9,
+            'depends_on': ['leagues.csv'],
         },
         'divisions.csv': {
             'table': 'divisions',
             'primary_keys': ['league_id', 'sub_league_id', 'division_id'],
             'load_order': 10,
+            'depends_on': ['sub_leagues.csv'],
             'calculated_fields': {
                 'name': "CASE WHEN name = '' OR name IS NULL THEN 'No Division' ELSE name END"
             }
@@ -142,12 +194,14 @@ class ReferenceLoader(BaseLoader):
         'team_relations.csv': {
             'table': 'team_relations',
             'primary_keys': ['team_id'],
-            'load_order': 11
+            'load_order': 11,
+            'depends_on': ['teams.csv', 'divisions.csv']
         },
         'team_record.csv': {
             'table': 'team_record',
             'primary_keys': ['team_id'],
             'load_order': 12,
+            'depends_on': ['teams.csv'],
         },
         # League History Tables (moved league_history to load-stats due to player FKs)
         'league_history.csv': {
@@ -175,11 +229,13 @@ class ReferenceLoader(BaseLoader):
             'table': 'league_history_batting_stats',
             'primary_keys': ['year', 'team_id', 'game_id', 'league_id', 'level_id', 'split_id'],
             'load_order': 14,
+            'depends_on': ['leagues.csv', 'teams.csv'],
         },
         'league_history_pitching_stats.csv': {
             'table': 'league_history_pitching_stats',
             'primary_keys': ['year', 'team_id', 'game_id', 'level_id', 'split_id'],
             'load_order': 15,
+            'depends_on': ['leagues.csv', 'teams.csv'],
         },
         # Team history tables (moved team_history to load-stats due to player FKs)
         'team_history.csv': {
@@ -197,22 +253,26 @@ class ReferenceLoader(BaseLoader):
             'table': 'team_history_batting_stats',
             'primary_keys': ['team_id', 'year'],
             'load_order': 17,
+            'depends_on': ['leagues.csv', 'teams.csv'],
         },
         'team_history_pitching_stats.csv': {
             'table': 'team_history_pitching_stats',
             'primary_keys': ['team_id', 'year'],
             'load_order': 18,
+            'depends_on': ['leagues.csv', 'teams.csv'],
         },
         'team_history_record.csv': {
             'table': 'team_history_record',
             'primary_keys': ['team_id', 'year'],
             'load_order': 19,
+            'depends_on': ['leagues.csv', 'teams.csv'],
         },
         # Newspaper/transaction tables (no player FKs)
         'trade_history.csv': {
             'table': 'trade_history',
             'primary_keys': ['trade_id'],
             'load_order': 20,
+            'depends_on': ['teams.csv'],
             'load_strategy': 'incremental',  # Never delete historical trades
             'column_mapping': {
                 # Exclude trade_id - it's auto-generated SERIAL
@@ -265,19 +325,25 @@ class ReferenceLoader(BaseLoader):
                 'draft_team_1_4': 'draft_team_1_4',
                 'cash_1': 'cash_1',
                 'iafa_cap_1': 'iafa_cap_1'
-            }
+            },
+            'dtypes': dict.fromkeys(['message_id', *_TRADE_SIDE_INT_COLUMNS], 'Int32')
         },
         'messages.csv': {
             'table': 'messages',
             'primary_keys': ['message_id'],
             'load_order': 21,
+            'depends_on': [],
             'load_strategy': 'incremental',  # Never delete historical messages
             'apply_filters': True,  # Enable message filtering
             'calculated_fields': {
                 # Convert 0 and negative values to NULL (non-trade messages use 0, -1, -5, etc.)
                 # Note: trade_id contains OOTP internal IDs with no FK constraint - kept for reference only
                 'trade_id': 'CASE WHEN trade_id > 0 THEN trade_id ELSE NULL END'
-            }
+            },
+            # Low-cardinality codes - SMALLINT in the table
+            'dtypes': dict.fromkeys(
+                ['importance', 'message_type', 'hype', 'sender_type', 'deleted', 'notify'], 'Int16'
+            )
         },
         # Coaches and rosters (loaded manually after players in load-stats command)
         'coaches.csv': {
@@ -299,13 +365,23 @@ class ReferenceLoader(BaseLoader):
             'load_order': 101  # Manual load only
         }
 
-    }
+    })
+
+    # Automatically loaded CSVs in dependency order (load_order >= 99 is manual-load only)
+    _LOAD_ORDER = tuple(
+        csv_file for csv_file, table_config in sorted(REFERENCE_TABLES.items(), key=lambda item: item[1]['load_order'])
+        if table_config['load_order'] < 99
+    )
 
 
 
-    def __init__(self, csv_filename: str, batch_id: str = None):
+    def __init__(self, csv_filename: str, batch_id: str = None, checksum: Optional[str] = None):
         super().__init__(batch_id)
         self.csv_filename = csv_filename
+        self.checksum = checksum  # Precomputed file checksum, see precompute_checksums()
+        self._message_filter: Optional[MessageFilter] = None
+        # Set once the raw COPY path has put placeholder_rows into staging
+        self._placeholders_staged = False
 
         if csv_filename not in self.REFERENCE_TABLES:
             raise ValueError(f"Unknown reference table CSV: {csv_filename}")
@@ -318,6 +394,22 @@ class ReferenceLoader(BaseLoader):
         return self.config.get('column_mapping')
 
 
+    def _get_dedup_subset(self) -> Optional[List[str]]:
+        """Cached per CSV file - see BaseLoader._get_dedup_subset"""
+        if self.csv_filename not in self._dedup_subset_cache:
+            self._dedup_subset_cache[self.csv_filename] = super()._get_dedup_subset()
+        return self._dedup_subset_cache[self.csv_filename]
+
+    def _csv_read_options(self) -> Dict:
+        """Only read the mapped columns, with the config's dtypes instead of inference"""
+        options = {}
+        column_mapping = self.get_column_mapping()
+        if column_mapping:
+            options['usecols'] = list(column_mapping.keys())
+        if self.config.get('dtypes'):
+            options['dtype'] = self.config['dtypes']
+        return options
+
     def get_load_strategy(self) -> str:
         """Return load strategy from config, default to 'skip' for reference tables."""
         return self.config.get('load_strategy', 'skip')
@@ -351,14 +443,23 @@ class ReferenceLoader(BaseLoader):
         """Override to implement checksum comparison"""
         logger.info(f"Checking if {csv_path.name} has changed...")
 
-        # Calculate current file checksum
-        current_checksum = calculate_file_checksum(csv_path)
-
         # Get stored checksum from metadata
         stored_checksum = self._get_stored_checksum(csv_path.name)
 
+        # Same size and mtime as the last load - the file wasn't rewritten, no need to hash it
+        current_stat = self._stat_key(csv_path)
+        if stored_checksum and current_stat == self._get_stored_stat(csv_path.name):
+            logger.info(f"File {csv_path.name} unchanged (size and mtime match last load)")
+            self._record_file_completion(csv_path, 'skipped')
+            return True
+
+        # Calculate current file checksum unless it was precomputed
+        current_checksum = self.checksum or calculate_file_fingerprint(csv_path)
+
         if stored_checksum and current_checksum == stored_checksum:
             logger.info(f"File {csv_path.name} unchanged (checksum: {current_checksum[:8]}...")
+            # Touched but identical - remember the new mtime so the next run skips the hash
+            self._update_stored_metadata(csv_path.name, current_checksum, current_stat)
             self._record_file_completion(csv_path, 'skipped')
             return True
 
@@ -368,66 +469,40 @@ class ReferenceLoader(BaseLoader):
 
         if success:
             # Update stored checksum
-            self._update_stored_checksum(csv_path.name, current_checksum)
+            self._update_stored_metadata(csv_path.name, current_checksum, current_stat)
         return success
 
     def _handle_incremental_load(self, csv_path: Path) -> bool:
         """Handle incremental load with UPSERT - preserves historical records"""
         target_table = self.get_target_table()
         staging_table = f"staging_{target_table}"
-        column_mapping = self.get_column_mapping()
 
         logger.info(f"Performing incremental load for {target_table} (preserves all historical data)")
 
-        # Read CSV
+        # Primary keys as CSV column names, for de-duplication during preprocessing
+        primary_keys = self.get_primary_keys()
+        dedup_subset = self._get_dedup_subset()
+
+        # Stream the CSV into staging chunk by chunk so only one chunk is resident
         try:
-            df = pd.read_csv(csv_path)
+            row_count, chunk_count, sql_calculated_fields = self._stage_csv_chunks(
+                csv_path, staging_table, dedup_subset
+            )
         except pd.errors.ParserError as e:
             logger.warning(f"Malformed CSV detected, attempting to skip bad lines: {e}")
-            df = pd.read_csv(csv_path, on_bad_lines='skip', engine='python')
-            logger.info(f"Successfully loaded CSV with {len(df)} rows (skipped bad lines)")
-
-        # Apply message filtering if configured
-        if self.config.get('apply_filters') and self.csv_filename == 'messages.csv':
-            df = self._apply_message_filters(df)
-
-        # Apply CSV preprocessing
-        from ..utils.csv_preprocessor import CSVPreprocessor
-        primary_keys = self.get_primary_keys()
-
-        dedup_subset = None
-        if primary_keys and column_mapping:
-            reverse_mapping = {v: k for k, v in column_mapping.items()}
-            dedup_subset = [reverse_mapping.get(pk) for pk in primary_keys if reverse_mapping.get(pk)]
-            if not dedup_subset or len(dedup_subset) != len(primary_keys):
-                dedup_subset = None
-        elif primary_keys:
-            dedup_subset = primary_keys
-
-        df = CSVPreprocessor.preprocess(df, config={
-            'clean_quoted_strings': True,
-            'deduplicate': True,
-            'dedup_subset': dedup_subset
-        })
-
-        # Filter columns based on column mapping
-        if column_mapping:
-            csv_columns = list(column_mapping.keys())
-            df_to_load = df[csv_columns].copy()
-            df_to_load = df_to_load.rename(columns=column_mapping)
-        else:
-            df_to_load = df
-
-        # Create staging table
-        columns = self._infer_column_types(df_to_load)
-        self.staging_mgr.create_staging_from_csv_structure(target_table, columns)
-
-        # Load data into staging
-        row_count = self.staging_mgr.copy_csv_to_staging(str(csv_path), staging_table, df=df_to_load)
+            row_count, chunk_count, sql_calculated_fields = self._stage_csv_chunks(
+                csv_path, staging_table, dedup_subset, on_bad_lines='skip', engine='python'
+            )
+            logger.info(f"Successfully loaded CSV with {row_count} rows (skipped bad lines)")
         self.stats['rows_read'] = row_count
 
-        # Calculate derived fields
-        self._calculate_derived_fields(staging_table)
+        # Preprocessing only de-duplicates within a chunk - a key repeated across chunks
+        # would make ON CONFLICT DO UPDATE hit the same row twice
+        if chunk_count > 1 and dedup_subset:
+            self._dedupe_staging(staging_table, primary_keys)
+
+        # Calculate derived fields that could not be applied to the chunks
+        self._calculate_derived_fields(staging_table, sql_calculated_fields)
 
         # Perform UPSERT from staging to target
         upserted_count = self._upsert_from_staging(staging_table, target_table)
@@ -440,15 +515,118 @@ class ReferenceLoader(BaseLoader):
         logger.info(f"Incremental load complete: {upserted_count} rows upserted (no historical data removed)")
         return True
 
+    def _stage_csv_chunks(self, csv_path: Path, staging_table: str, dedup_subset: Optional[List[str]],
+                          **read_options) -> Tuple[int, int, Dict[str, str]]:
+        """COPY the CSV into a fresh staging table one chunk at a time
+
+        Returns (rows staged, chunks read, calculated fields left for the SQL pass).
+        The staging table is (re)created from the first chunk, so a retry with
+        different read options starts from scratch.
+        """
+        column_mapping = self.get_column_mapping() or {}
+        renames = {old: new for old, new in column_mapping.items() if old != new}
+        columns = None
+        sql_calculated_fields = self.get_calculated_fields()
+        row_count = 0
+        chunk_count = 0
+
+        read_options = {**self._csv_read_options(), **read_options}
+        for chunk in self._read_csv_chunks(csv_path, **read_options):
+            chunk_count += 1
+
+            # Apply message filtering if configured
+            if self.config.get('apply_filters') and self.csv_filename == 'messages.csv':
+                chunk = self._apply_message_filters(chunk)
+
+            chunk = CSVPreprocessor.preprocess(chunk, config={
+                'clean_quoted_strings': True,
+                'deduplicate': True,
+                'dedup_subset': dedup_subset
+            })
+
+            # usecols already limited the read to the mapped columns (COPY names them
+            # explicitly, so their order doesn't matter) - only renames are left, and an
+            # identity mapping like trade_history's needs no new frame at all
+            if renames:
+                chunk = chunk.rename(columns=renames, copy=False)
+
+            # Apply simple derived fields (NULLIF(col, 0) and friends) before the COPY
+            chunk, sql_calculated_fields = self._apply_frame_calculated_fields(chunk)
+
+            # Create staging table from the first chunk; a column that is still all-null
+            # there is staged as TEXT and cast by the upsert
+            if columns is None:
+                columns = {
+                    col: ('TEXT' if chunk[col].isna().all() else pg_type)
+                    for col, pg_type in self._infer_column_types(chunk).items()
+                }
+                self.staging_mgr.create_staging_from_csv_structure(self.get_target_table(), columns)
+
+            # The first chunk into the new staging table can be written frozen
+            row_count += self.staging_mgr.copy_df_chunk_to_staging(
+                self._align_chunk_dtypes(chunk, columns), staging_table, freeze=(row_count == 0)
+            )
+
+        return row_count, chunk_count, sql_calculated_fields
+
+    def _read_csv_chunks(self, csv_path: Path, **read_options) -> Iterator[pd.DataFrame]:
+        """Yield the CSV as DataFrame chunks
+
+        Uses pyarrow's multi-threaded streaming reader when it is installed -
+        pd.read_csv(engine='pyarrow') has no chunksize support. The python-engine
+        retry for malformed files always goes through pandas.
+        """
+        if not HAS_PYARROW or 'engine' in read_options:
+            yield from pd.read_csv(csv_path, chunksize=self.CHUNK_SIZE, **read_options)
+            return
+
+        import pyarrow as pa
+        from pyarrow import csv as pa_csv
+
+        dtypes = read_options.get('dtype') or {}
+        try:
+            reader = pa_csv.open_csv(
+                csv_path,
+                read_options=pa_csv.ReadOptions(block_size=1 << 22),
+                # Empty fields are NULL for every column, as pandas reads them
+                convert_options=pa_csv.ConvertOptions(
+                    include_columns=read_options.get('usecols'), strings_can_be_null=True
+                )
+            )
+            for batch in reader:
+                chunk = batch.to_pandas()
+                yield chunk.astype({col: dtype for col, dtype in dtypes.items() if col in chunk.columns})
+        except pa.ArrowInvalid as e:
+            # Surface malformed rows the way pandas does so the caller's retry kicks in
+            raise pd.errors.ParserError(str(e)) from e
+
+    @staticmethod
+    def _dedupe_staging_sql(staging_table: str, key_columns: List[str]) -> str:
+        key_match = ' AND '.join(f"a.{col} = b.{col}" for col in key_columns)
+        return f"""
+            DELETE FROM {staging_table} a
+            USING {staging_table} b
+            WHERE {key_match}
+              AND a.ctid > b.ctid
+        """
+
+    def _dedupe_staging(self, staging_table: str, key_columns: List[str]):
+        """Keep only the first copied row per key - COPY appends, so ctid follows file order"""
+        result = self.db.execute_sql(text(self._dedupe_staging_sql(staging_table, key_columns)))
+        if result.rowcount:
+            logger.info(f"Removed {result.rowcount} rows duplicated across chunks from {staging_table}")
+
     def _apply_message_filters(self, df: pd.DataFrame) -> pd.DataFrame:
         """Apply message filtering based on configuration"""
         try:
-            from config.etl_config import MESSAGE_FILTERS
+            # messages.csv is filtered chunk by chunk - build the filter once
+            if self._message_filter is None:
+                from config.etl_config import MESSAGE_FILTERS
 
-            message_filter = MessageFilter(MESSAGE_FILTERS)
-            logger.info(message_filter.get_filter_summary())
+                self._message_filter = MessageFilter(MESSAGE_FILTERS)
+                logger.info(self._message_filter.get_filter_summary())
 
-            filtered_df = message_filter.filter_messages(df)
+            filtered_df = self._message_filter.filter_messages(df)
             return filtered_df
         except ImportError:
             logger.warning("Could not import MESSAGE_FILTERS from config, skipping filters")
@@ -470,23 +648,140 @@ class ReferenceLoader(BaseLoader):
                 logger.error("sub_leagues.csv validation failed - skipping load")
                 return False
 
-        # Call parent's full load method
-        success = super()._handle_full_load(csv_path)
+        # Large files (the history tables) reload faster with secondary indexes built once
+        # afterwards. Tables other reference files depend on keep theirs: load_all runs
+        # those dependents concurrently and they join against this table
+        target_table = self.get_target_table()
+        index_defs = []
+        try:
+            if csv_path.stat().st_size >= self.INDEX_REBUILD_MIN_BYTES and not self._has_dependents():
+                index_defs = self._drop_secondary_indexes(target_table)
+
+            # Files that need no pandas-side work are copied into staging as-is
+            if self._can_copy_raw(csv_path):
+                try:
+                    success = self._copy_raw_full_load(csv_path)
+                except Exception as e:
+                    logger.warning(f"Raw COPY of {csv_path.name} failed, falling back to pandas load: {e}")
+                    success = super()._handle_full_load(csv_path)
+            else:
+                # Call parent's full load method
+                success = super()._handle_full_load(csv_path)
+        finally:
+            self._recreate_indexes(index_defs)
+
+        # The table was just truncated and refilled - refresh planner stats for the loads that follow
+        if success:
+            self.db.execute_sql(text(f"ANALYZE {target_table}"))
 
-        # Post-load operations
-        if success and self.csv_filename == 'nations.csv':
-            # Add nation_id=0 record for parks table foreign key
-            self._add_placeholder_nation()
+        # Post-load operations - the raw COPY path already staged the placeholder rows
+        if success and self.config.get('placeholder_rows') and not self._placeholders_staged:
+            self._insert_placeholder_rows()
 
         return success
 
+    def _has_dependents(self) -> bool:
+        """True when another reference file lists this one in its depends_on"""
+        return any(
+            self.csv_filename in table_config.get('depends_on', [])
+            for table_config in self.REFERENCE_TABLES.values()
+        )
+
+    def _can_copy_raw(self, csv_path: Path) -> bool:
+        """True when the CSV can go straight into staging without a pandas pass
+
+        Decided from the table config and the header alone: no column mapping,
+        filters or calculated fields, primary keys to dedupe on, and header
+        names usable as unquoted column names. Quoted-empty '' cells need no
+        check - the raw SELECT turns them into NULL like empty fields.
+        """
+        if (self.get_column_mapping() or self.config.get('apply_filters')
+                or self.get_calculated_fields() or not self.get_primary_keys()):
+            return False
+        if csv_path.stat().st_size == 0:
+            return False
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f), [])
+        return bool(header) and all(col.isidentifier() and col == col.lower() for col in header)
+
+    @staticmethod
+    def _raw_select_parts(columns: List[str], column_types: Dict[str, str]) -> List[str]:
+        """SELECT expressions typing the all-TEXT raw staging columns
+
+        Empty fields and quoted-empty '' cells both become NULL. That matches
+        the pandas path, which cleans '' to empty and then COPYs it as NULL;
+        the old to_sql path stored '' in text columns as an empty string.
+        """
+        parts = []
+        for col in columns:
+            value = f"NULLIF(NULLIF({col}, ''), '''''')"
+            if column_types[col] not in ('text', 'character varying'):
+                value = f"CAST({value} AS {column_types[col]})"
+            parts.append(value)
+        return parts
+
+    def _copy_raw_full_load(self, csv_path: Path) -> bool:
+        """Full load that streams the CSV file itself through COPY
+
+        Staging is all TEXT in file column order; typing happens in the
+        INSERT ... SELECT, and duplicate keys are removed in SQL keeping the
+        first row, the same as CSVPreprocessor does.
+        """
+        target_table = self.get_target_table()
+        staging_table = f"staging_{target_table}"
+
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f))
+        self.staging_mgr.create_staging_from_csv_structure(target_table, dict.fromkeys(header, 'TEXT'))
+
+        target_column_types = self._get_column_types(target_table)
+        common_columns = [col for col in header if col in target_column_types]
+        select_parts = self._raw_select_parts(common_columns, target_column_types)
+
+        raw_conn = self.db.engine.raw_connection()
+        try:
+            with raw_conn.cursor() as cursor, open(csv_path, 'rb') as f:
+                cursor.execute("SET LOCAL synchronous_commit = off")
+                cursor.execute(f"TRUNCATE {staging_table}")
+                cursor.copy_expert(
+                    f"COPY {staging_table} ({', '.join(header)}) FROM STDIN WITH (FORMAT csv, HEADER true, FREEZE true)",
+                    f)
+                row_count = cursor.rowcount
+                # Placeholder rows go in after the file's rows, so the dedupe keeps a CSV row
+                # with the same key; sent in the same round trip as the dedupe
+                placeholder_sql, placeholder_params = self._stage_placeholder_rows_sql(staging_table, header)
+                cursor.execute(
+                    placeholder_sql + self._dedupe_staging_sql(staging_table, self.get_primary_keys()),
+                    placeholder_params
+                )
+                with self._truncate_lock:
+                    cursor.execute(f"TRUNCATE TABLE {target_table} CASCADE")
+                    cursor.execute(f"""
+                        INSERT INTO {target_table} ({', '.join(common_columns)})
+                        SELECT {', '.join(select_parts)} FROM {staging_table}
+                    """)
+                    rows_inserted = cursor.rowcount
+                    raw_conn.commit()
+            self._placeholders_staged = bool(placeholder_sql)
+        except Exception:
+            raw_conn.rollback()
+            raise
+        finally:
+            raw_conn.close()
+
+        self.stats['rows_read'] = row_count
+        self.stats['rows_inserted'] = rows_inserted
+        logger.info(f"Copied {row_count} rows from {csv_path.name} straight into {staging_table}")
+
+        self.staging_mgr.drop_staging_table(staging_table)
+        self._record_file_completion(csv_path, 'success')
+        return True
+
     def _validate_sub_leagues(self, csv_path: Path) -> bool:
         """Validate that sub_leagues.csv has required data in name and abbr columns"""
         logger.info("Validating sub_leagues.csv data quality")
 
         try:
-            import pandas as pd
-
             df = pd.read_csv(csv_path)
 
             # Check for NULL/empty names
@@ -521,54 +816,49 @@ class ReferenceLoader(BaseLoader):
         logger.info("Checking for missing leagues referenced in teams.csv")
 
         try:
-            import pandas as pd
-
             # Read teams.csv to get all league_ids
-            df = pd.read_csv(csv_path)
+            df = pd.read_csv(csv_path, usecols=lambda col: col == 'league_id')
             if 'league_id' not in df.columns:
                 logger.warning("No league_id column in teams.csv")
                 return
 
             # Get unique league_ids from teams (excluding 0 and NULL)
-            team_league_ids = set(df['league_id'].dropna().unique())
-            team_league_ids.discard(0)
+            team_league_ids = np.unique(df['league_id'].dropna().to_numpy(dtype=np.int64))
+            team_league_ids = team_league_ids[team_league_ids != 0]
 
-            if not team_league_ids:
+            if not len(team_league_ids):
                 logger.info("No league_ids found in teams.csv")
                 return
 
-            # Get existing league_ids from database
-            existing_leagues_sql = text("SELECT league_id FROM leagues")
+            # Get existing league_ids from database as a single array value
+            existing_leagues_sql = text("SELECT coalesce(array_agg(league_id), '{}') FROM leagues")
             result = self.db.execute_sql(existing_leagues_sql)
-            existing_league_ids = {row[0] for row in result}
+            existing_league_ids = np.asarray(result.scalar(), dtype=np.int64)
 
-            # Find missing league_ids
-            missing_league_ids = team_league_ids - existing_league_ids
+            # Find missing league_ids (both sides are already de-duplicated)
+            missing_league_ids = np.setdiff1d(team_league_ids, existing_league_ids, assume_unique=True)
 
-            if not missing_league_ids:
+            if not len(missing_league_ids):
                 logger.info("All league_ids in teams.csv already exist in leagues table")
                 return
 
-            logger.warning(f"Found {len(missing_league_ids)} missing league_ids: {sorted(missing_league_ids)}")
+            logger.warning(f"Found {len(missing_league_ids)} missing league_ids: {missing_league_ids.tolist()}")
             logger.info("Creating stub league records for missing leagues")
 
-            # Create stub records for missing leagues
-            for league_id in sorted(missing_league_ids):
-                insert_sql = text("""
-                    INSERT INTO leagues (
-                        league_id, name, abbr, nation_id, language_id, logo_file_name,
-                        parent_league_id, league_state, season_year, league_level,
-                        game_date, current_date_year
-                    )
-                    VALUES (
-                        :league_id, 'SPECIAL', 'SPEC', 0, NULL, NULL,
-                        NULL, 0, 0, 0,
-                        NULL, 0
-                    )
-                    ON CONFLICT (league_id) DO NOTHING
-                """)
-                self.db.execute_sql(insert_sql, {'league_id': int(league_id)})
-                logger.info(f"Created stub league record for league_id={league_id}")
+            # Create stub records for missing leagues in a single statement
+            insert_sql = text("""
+                INSERT INTO leagues (
+                    league_id, name, abbr, nation_id, language_id, logo_file_name,
+                    parent_league_id, league_state, season_year, league_level,
+                    game_date, current_date_year
+                )
+                SELECT t.league_id, 'SPECIAL', 'SPEC', 0, NULL, NULL,
+                       NULL, 0, 0, 0,
+                       NULL, 0
+                FROM unnest(CAST(:league_ids AS int[])) AS t(league_id)
+                ON CONFLICT (league_id) DO NOTHING
+            """)
+            self.db.execute_sql(insert_sql, {'league_ids': missing_league_ids.tolist()})
 
             logger.success(f"Successfully created {len(missing_league_ids)} stub league records")
 
@@ -576,50 +866,237 @@ class ReferenceLoader(BaseLoader):
             logger.error(f"Error creating missing leagues: {e}")
             # Don't raise - let the load continue and fail with FK error if needed
 
-    def _add_placeholder_nation(self):
-        """Add nation_id=0 placeholder record"""
-        logger.info("Adding nation_id=0 placeholder record")
-        sql = text("""
-            INSERT INTO nations (nation_id, name, abbreviation, continent_id)
-            VALUES (0, 'Unknown', 'UNK', 1)
-            ON CONFLICT (nation_id) DO NOTHING
-        """)
-        self.db.execute_sql(sql)
-        logger.info("Nation placeholder record added")
+    def _placeholder_values(self, table: str) -> Tuple[str, Dict]:
+        """INSERT ... VALUES head for the config's placeholder_rows, with psycopg2 params"""
+        rows = self.config['placeholder_rows']
+        columns = list(rows[0])
+        params = {f"{col}_{i}": row[col] for i, row in enumerate(rows) for col in columns}
+        value_rows = ', '.join(
+            f"({', '.join(f'%({col}_{i})s' for col in columns)})" for i in range(len(rows))
+        )
+        return f"INSERT INTO {table} ({', '.join(columns)}) VALUES {value_rows}", params
+
+    def _stage_placeholder_rows_sql(self, staging_table: str, header: List[str]) -> Tuple[str, Dict]:
+        """placeholder_rows INSERT for the all-TEXT raw staging table
+
+        Returns ('', {}) when there are none, or when a placeholder column is not
+        in the file - the post-load insert covers those.
+        """
+        rows = self.config.get('placeholder_rows')
+        if not rows or any(col not in header for row in rows for col in row):
+            return '', {}
+        sql, params = self._placeholder_values(staging_table)
+        return sql + ';', {name: str(value) for name, value in params.items()}
+
+    def _insert_placeholder_rows(self):
+        """Insert the config's placeholder_rows into the target, keeping any loaded row"""
+        target_table = self.get_target_table()
+        sql, params = self._placeholder_values(target_table)
+        logger.info(f"Adding {len(self.config['placeholder_rows'])} placeholder row(s) to {target_table}")
+        self.db.execute_raw(
+            f"{sql} ON CONFLICT ({', '.join(self.get_primary_keys())}) DO NOTHING", params
+        )
 
 
     def _get_stored_checksum(self, filename: str) -> str:
-        """Get stored checksum from metadata table"""
-        sql = text("""
-        SELECT checksum
-        FROM etl_file_metadata
-        WHERE filename = :filename
-        """)
-
-        with self.db.get_session() as session:
-            result = session.execute(sql, {'filename': filename}).scalar()
-            return result
-
-
-    def _update_stored_checksum(self, filename: str, checksum: str):
-        """Update stored checksum in metadata table"""
-        sql = text(f"""INSERT INTO etl_file_metadata (filename, checksum, load_strategy, last_processed)
-        VALUES (:filename, :checksum, :strategy, CURRENT_TIMESTAMP)
+        """Get stored checksum from the metadata snapshot"""
+        if ReferenceLoader._checksum_cache is None:
+            ReferenceLoader.load_metadata_snapshot(self.db)
+        return ReferenceLoader._checksum_cache.get(filename)
+
+
+    @staticmethod
+    def _stat_key(path: Path) -> Tuple[int, int]:
+        """(size, mtime_ns) of a file - if both match the stored pair it has not been rewritten"""
+        stat = path.stat()
+        return stat.st_size, stat.st_mtime_ns
+
+    def _get_stored_stat(self, filename: str) -> Tuple[Optional[int], Optional[int]]:
+        """Get the file (size, mtime_ns) recorded with the stored checksum"""
+        if ReferenceLoader._stat_cache is None:
+            ReferenceLoader.load_metadata_snapshot(self.db)
+        return ReferenceLoader._stat_cache.get(filename, (None, None))
+
+    def _update_stored_metadata(self, filename: str, checksum: str, stat_key: Tuple[int, int]):
+        """Update stored checksum, file size and mtime in metadata table"""
+        sql = """INSERT INTO etl_file_metadata (filename, checksum, file_size, last_mtime_ns, load_strategy, last_processed)
+        VALUES (%(filename)s, %(checksum)s, %(file_size)s, %(mtime_ns)s, %(strategy)s, CURRENT_TIMESTAMP)
         ON CONFLICT (filename) DO UPDATE SET
         checksum = EXCLUDED.checksum,
-        last_processed = EXCLUDED.last_processed""")
-
-        self.db.execute_sql(sql, {
+        file_size = EXCLUDED.file_size,
+        last_mtime_ns = EXCLUDED.last_mtime_ns,
+        last_processed = EXCLUDED.last_processed"""
+
+        file_size, mtime_ns = stat_key
+        if ReferenceLoader._checksum_cache is not None:
+            ReferenceLoader._checksum_cache[filename] = checksum
+            ReferenceLoader._stat_cache[filename] = stat_key
+        if ReferenceLoader._pending_checksum_updates is not None:
+            # Written in one statement by flush_checksum_updates() at the end of the run
+            ReferenceLoader._pending_checksum_updates.append(
+                (filename, checksum, file_size, mtime_ns, self.get_load_strategy())
+            )
+            return
+
+        self.db.execute_raw(sql, {
             'filename': filename,
             'checksum': checksum,
+            'file_size': file_size,
+            'mtime_ns': mtime_ns,
             'strategy': self.get_load_strategy()
         })
 
 
+    @classmethod
+    def load_metadata_snapshot(cls, db) -> None:
+        """Fetch every stored checksum, size and mtime in one query
+
+        Loaders used on their own take the snapshot on first lookup; their
+        metadata writes still go straight to the table (and into the snapshot).
+        """
+        result = db.execute_sql(text(
+            "SELECT filename, checksum, file_size, last_mtime_ns FROM etl_file_metadata"
+        )).fetchall()
+        # _stat_cache first: a non-None _checksum_cache implies both are set
+        cls._stat_cache = {row[0]: (row[2], row[3]) for row in result}
+        cls._checksum_cache = {row[0]: row[1] for row in result}
+
+    @classmethod
+    def prime_checksum_cache(cls, db) -> None:
+        """Take a fresh metadata snapshot and batch this run's writes for flush_checksum_updates()"""
+        cls.load_metadata_snapshot(db)
+        cls._pending_checksum_updates = []
+
+    @classmethod
+    def stat_unchanged(cls, path: Path) -> bool:
+        """True when the primed metadata shows this file with a checksum and the same size and mtime"""
+        if cls._checksum_cache is None or not cls._checksum_cache.get(path.name):
+            return False
+        return cls._stat_key(path) == cls._stat_cache.get(path.name)
+
+    @classmethod
+    def flush_checksum_updates(cls, db) -> None:
+        """Write the checksums collected since prime_checksum_cache() in a single upsert"""
+        pending, cls._pending_checksum_updates = cls._pending_checksum_updates, None
+        if not pending:
+            return
+
+        filenames, checksums, sizes, mtimes, strategies = (list(values) for values in zip(*pending))
+        sql = text("""INSERT INTO etl_file_metadata (filename, checksum, file_size, last_mtime_ns, load_strategy, last_processed)
+        SELECT t.filename, t.checksum, t.file_size, t.mtime_ns, t.load_strategy, CURRENT_TIMESTAMP
+        FROM unnest(CAST(:filenames AS text[]), CAST(:checksums AS text[]), CAST(:sizes AS bigint[]),
+                    CAST(:mtimes AS bigint[]), CAST(:strategies AS text[]))
+             AS t(filename, checksum, file_size, mtime_ns, load_strategy)
+        ON CONFLICT (filename) DO UPDATE SET
+        checksum = EXCLUDED.checksum,
+        file_size = EXCLUDED.file_size,
+        last_mtime_ns = EXCLUDED.last_mtime_ns,
+        last_processed = EXCLUDED.last_processed""")
+        db.execute_sql(sql, {
+            'filenames': filenames, 'checksums': checksums, 'sizes': sizes, 'mtimes': mtimes,
+            'strategies': strategies
+        })
+        logger.info(f"Stored checksums for {len(pending)} files")
+
+    @classmethod
+    def precompute_checksums(cls, paths: List[Path], max_workers: int = 4) -> Dict[Path, str]:
+        """Fingerprint several files concurrently on threads
+
+        Each file is hashed with one update() over an mmap, and the hash runs with
+        the GIL released, so threads overlap as a process pool would without its
+        worker start-up or result pickling.
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return dict(zip(paths, executor.map(calculate_file_fingerprint, paths)))
+
+    @classmethod
+    def load_all(cls, csv_dir: Path, batch_id: str, db, force: bool = False,
+                 csv_files: Optional[List[str]] = None, max_workers: int = 4) -> Dict[Path, bool]:
+        """Load reference CSVs from csv_dir along the depends_on graph, returning {csv_path: success}
+
+        csv_files defaults to get_load_order(). A file starts as soon as the files it
+        depends on (among csv_files) have finished, so independent chains overlap
+        instead of waiting on a whole level. Stored checksums are read once up front,
+        the skip-strategy files that may have changed are hashed in parallel, and the
+        new checksums are written in one statement at the end. force loads everything
+        with the full strategy.
+        """
+        if csv_files is None:
+            csv_files = cls.get_load_order()
+
+        # One metadata read for the whole run instead of a lookup per file
+        cls.clear_run_caches()
+        cls.prime_checksum_cache(db)
+
+        # Hash the files that use the checksum skip check up front, in parallel - files
+        # whose size and mtime match the last load are skipped without hashing
+        checksums = {}
+        if not force:
+            skip_paths = [
+                csv_dir / csv_file for csv_file in csv_files
+                if (csv_dir / csv_file).exists()
+                and cls.REFERENCE_TABLES.get(csv_file, {}).get('load_strategy', 'skip') == 'skip'
+                and not cls.stat_unchanged(csv_dir / csv_file)
+            ]
+            checksums = cls.precompute_checksums(skip_paths)
+
+        results = {}
+        jobs = {}
+        for csv_file in csv_files:
+            csv_path = csv_dir / csv_file
+
+            if not csv_path.exists():
+                logger.warning(f"File {csv_path} not found.")
+                continue
+
+            try:
+                loader = cls(csv_path.name, batch_id, checksum=checksums.get(csv_path))
+            except ValueError as e:
+                logger.error(f"Error loading {csv_path}: {e}")
+                results[csv_path] = False
+                continue
+            if force:
+                # Temporarily override load strategy to full
+                loader.get_load_strategy = lambda: 'full'
+            jobs[csv_file] = (loader, csv_path)
+
+        # Dependencies outside csv_files are assumed loaded already
+        selected = set(csv_files)
+        sorter = TopologicalSorter({
+            csv_file: [dep for dep in cls.REFERENCE_TABLES.get(csv_file, {}).get('depends_on', []) if dep in selected]
+            for csv_file in csv_files
+        })
+        sorter.prepare()
+
+        running = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            while sorter.is_active():
+                for csv_file in sorter.get_ready():
+                    if csv_file not in jobs:
+                        # Missing or unknown file - nothing to wait for
+                        sorter.done(csv_file)
+                        continue
+                    loader, csv_path = jobs[csv_file]
+                    running[executor.submit(loader.load_csv, csv_path)] = csv_file
+                if not running:
+                    continue
+
+                finished, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    csv_file = running.pop(future)
+                    csv_path = jobs[csv_file][1]
+                    try:
+                        results[csv_path] = future.result()
+                    except Exception as e:
+                        logger.error(f"Load of {csv_path} failed: {e}")
+                        results[csv_path] = False
+                    sorter.done(csv_file)
+
+        # Checksums of the files loaded above are written in one statement
+        cls.flush_checksum_updates(db)
+        return results
+
     @classmethod
     def get_load_order(cls) -> List[str]:
         """Return CSV files in dependency order (excludes manual-load-only tables with load_order >= 99)"""
-        return sorted(
-            [k for k, v in cls.REFERENCE_TABLES.items() if v['load_order'] < 99],
-            key=lambda x: cls.REFERENCE_TABLES[x]['load_order']
-        )
+        return list(cls._LOAD_ORDER)
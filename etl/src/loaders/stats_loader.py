@@ -1,17 +1,15 @@
-from typing import Dict, List, Optional
+import csv
+from typing import Dict, Optional, Tuple
 from pathlib import Path
 import pandas as pd
-from .base_loader import BaseLoader
+from .base_loader import BaseLoader, HAS_PYARROW
 from loguru import logger
-from sqlalchemy import text
-from ..utils.batch import generate_batch_id
 
 class StatsLoader(BaseLoader):
     """Base loader for player statistics tables"""
 
-    def __init__(self, batch_id: str = None):
-        super().__init__(batch_id)
-        self._team_relations_cache = {} # Cache for sub_league lookups
+    # Staging row count above which secondary indexes are rebuilt instead of maintained per row
+    INDEX_REBUILD_THRESHOLD = 50_000
 
     def get_load_strategy(self) -> str:
         return 'incremental'
@@ -23,56 +21,100 @@ class StatsLoader(BaseLoader):
         """
         return True
 
-    def _populate_subleague_id(self, staging_table: str):
-        """Populate sub_league_id from team_relations"""
-        logger.info(f"Populating sub_league_id in {staging_table} from team_relations")
-        # Add sub_league_id column if not exists
-        add_column_sql = text(f""" ALTER TABLE {staging_table}
-        ADD COLUMN IF NOT EXISTS sub_league_id INTEGER
-        """)
-        self.db.execute_sql(add_column_sql)
+    def _upsert_with_deferred_indexes(self, staging_table: str, target_table: str, row_count: int) -> int:
+        """UPSERT from staging, dropping secondary indexes first when the batch is large"""
+        if row_count < self.INDEX_REBUILD_THRESHOLD:
+            return self._upsert_from_staging(staging_table, target_table)
 
-        # Populate sub_league_id
-        update_sql = text(f""" UPDATE {staging_table} s
-        SET sub_league_id = tr.sub_league_id
-        FROM team_relations tr
-        WHERE s.team_id = tr.team_id""")
+        index_defs = self._drop_secondary_indexes(target_table)
+        try:
+            return self._upsert_from_staging(staging_table, target_table)
+        finally:
+            self._recreate_indexes(index_defs)
 
-        self.db.execute_sql(update_sql)
-        logger.info(f"sub_league_id population complete in {staging_table}")
+    def _upsert_source_joins(self, staging_column_types: Dict[str, str]) -> Tuple[str, Dict[str, str]]:
+        """Look sub_league_id up from team_relations inside the upsert
+
+        The join replaces an UPDATE pass over staging and is the one mapping every
+        stats loader uses. One row per team keeps it from multiplying staging rows;
+        a team with several relations takes the first in primary-key order, so every
+        load resolves a team to the same sub-league.
+        """
+        if 'sub_league_id' in staging_column_types:
+            return '', {}
+        join_sql = """LEFT JOIN (
+                    SELECT DISTINCT ON (team_id) team_id, sub_league_id
+                    FROM team_relations
+                    ORDER BY team_id, league_id, sub_league_id, division_id
+                ) tr ON tr.team_id = s.team_id"""
+        return join_sql, {'sub_league_id': 'tr.sub_league_id'}
+
+    def _csv_read_options(self) -> Dict:
+        """Parse only the CSV columns that can reach the target table"""
+        target_column_types = self._get_target_column_types(self.get_target_table())
+        column_mapping = self.get_column_mapping() or {}
+        wanted = set(target_column_types) | set(column_mapping)
+        return {'usecols': lambda col: col in wanted}
+
+    def _read_stats_csv(self, csv_path: Path) -> pd.DataFrame:
+        """Read a whole stats CSV, limited to the columns _csv_read_options() keeps
+
+        Parses with pyarrow's multi-threaded reader when it is installed. That engine
+        takes usecols only as a list, so the filter is resolved against the header.
+        """
+        read_options = self._csv_read_options()
+        if not HAS_PYARROW:
+            return pd.read_csv(csv_path, low_memory=False, **read_options)
+
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f))
+        usecols = [col for col in header if read_options['usecols'](col)]
+        return pd.read_csv(csv_path, usecols=usecols, engine='pyarrow')
+
+    def _stream_copy_csv(self, csv_path: Path, staging_table: str, where: Optional[str] = None) -> int:
+        """COPY the CSV file straight into a fresh staging table, without pandas
+
+        Only the header is parsed in Python: it names the staging columns (through
+        the column mapping), and each column takes the target table's type, or TEXT
+        when the target has no such column. Integer columns are staged as NUMERIC
+        instead, so a count written as 3.0 still copies; the upsert casts them back.
+        """
+        column_mapping = self.get_column_mapping() or {}
+        with open(csv_path, newline='', encoding='utf-8') as f:
+            header = next(csv.reader(f))
+        columns = [column_mapping.get(col, col) for col in header]
+
+        target_column_types = self._get_target_column_types(self.get_target_table())
+        staging_columns = {}
+        for col in columns:
+            pg_type = target_column_types.get(col, 'text')
+            if pg_type in self.INTEGER_TYPES:
+                staging_columns[col] = 'NUMERIC'
+            elif pg_type in ('ARRAY', 'USER-DEFINED'):
+                staging_columns[col] = 'TEXT'
+            else:
+                staging_columns[col] = pg_type.upper()
+        self.staging_mgr.create_staging_from_csv_structure(self.get_target_table(), staging_columns)
+
+        # Fresh table, so the COPY can write frozen rows. Stats files are plain
+        # numeric rows with no quoted line breaks, so large ones may be split
+        return self.staging_mgr.copy_csv_file_to_staging(
+            csv_path, staging_table, columns, where=where, freeze=True, parallel=True
+        )
 
     def _handle_incremental_load(self, csv_path: Path) -> bool:
         """Stats-specific incremental load with sub_league population"""
         target_table = self.get_target_table()
         staging_table = f"staging_{target_table}"
 
-        # Standard column mapping and staging load
-        column_mapping = self.get_column_mapping()
-        df = pd.read_csv(csv_path)
-
-        # FILTER TO ONLY SPLIT_ID=1 (regular season totals)
-        df = df[df['split_id'] == 1]
-        logger.info(f"Filtered to split_id=1: {len(df)} rows remaining from {len(pd.read_csv(csv_path))} total")
-
-        if column_mapping:
-            df = df.rename(columns=column_mapping)
-
-        # Create staging table
-        columns = self._infer_column_types(df)
-        self.staging_mgr.create_staging_from_csv_structure(target_table, columns)
-
-        # Load to staging
-        row_count = self.staging_mgr.copy_csv_to_staging(str(csv_path), staging_table, df=df)
+        # Stream the file into staging, keeping ONLY SPLIT_ID=1 (regular season totals)
+        row_count = self._stream_copy_csv(csv_path, staging_table, where='split_id = 1')
+        logger.info(f"Filtered to split_id=1: {row_count} rows copied into {staging_table}")
         self.stats['rows_read'] = row_count
 
-        # Add subleague BEFORE calculating stats
-        self._populate_subleague_id(staging_table)
-
-        # Calculate basic rate stats
-        self._calculate_derived_fields(staging_table)
-
-        # UPSERT from staging
-        upserted = self._upsert_from_staging(staging_table, target_table)
+        # UPSERT from staging - rate stats and the team_relations lookup for
+        # sub_league_id are evaluated in the upsert's SELECT, one pass over staging
+        upserted = self._upsert_with_deferred_indexes(staging_table, target_table, row_count)
         self.stats['rows_inserted'] = upserted
 
         # Cleanup
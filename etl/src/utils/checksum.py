@@ -1,17 +1,26 @@
 """File Checksum Calculation Utilities"""
 import hashlib
+import mmap
 from pathlib import Path
 from loguru import logger
 
+try:
+    import xxhash  # Optional - non-cryptographic, much faster than SHA-256 for change detection
+except ImportError:
+    xxhash = None
+
 def calculate_file_checksum(file_path: Path, algorithm: str = 'sha256') -> str:
     """Calculate checksum of a file"""
     hash_func = hashlib.new(algorithm) # Create a new hash object
 
     try:
         with open(file_path, 'rb') as f:
-            # Read in chunks to handle large files
-            for chunk in iter(lambda: f.read(4096), b""):
-                hash_func.update(chunk)
+            # Hash the whole mapped file in one update() call instead of looping over
+            # small reads; the OS pages it in and OpenSSL uses its fastest SHA path.
+            # Empty files cannot be mapped and hash to the empty digest as-is.
+            if Path(file_path).stat().st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    hash_func.update(mapped)
 
         checksum = hash_func.hexdigest()
         logger.debug(f"Calculated {algorithm} checksum for {file_path.name}: {checksum[:16]}...")
@@ -20,3 +29,27 @@ def calculate_file_checksum(file_path: Path, algorithm: str = 'sha256') -> str:
         logger.error(f"Error calculating checksum for {file_path}: {e}")
         raise
 
+
+def calculate_file_fingerprint(file_path: Path) -> str:
+    """Fast change-detection hash of a file: xxh3_64 when xxhash is installed, else SHA-256
+
+    Only meant for "has this file changed" checks - a fingerprint stored by a run
+    with the other hash simply reads as changed once.
+    """
+    if xxhash is None:
+        return calculate_file_checksum(file_path)
+
+    hash_func = xxhash.xxh3_64()
+    try:
+        with open(file_path, 'rb') as f:
+            if Path(file_path).stat().st_size:
+                with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+                    hash_func.update(mapped)
+
+        fingerprint = hash_func.hexdigest()
+        logger.debug(f"Calculated xxh3_64 fingerprint for {file_path.name}: {fingerprint}")
+        return fingerprint
+    except Exception as e:
+        logger.error(f"Error calculating fingerprint for {file_path}: {e}")
+        raise
+
@@ -19,13 +19,21 @@ class CSVPreprocessor:
 
     @staticmethod
     def deduplicate_rows(df: pd.DataFrame, subset: Optional[list] = None) -> pd.DataFrame:
-        """Remove duplicate rows, keeping first occurrence"""
-        initial_count = len(df)
-        df_clean = df.drop_duplicates(subset=subset, keep='first')
-        removed = initial_count - len(df_clean)
-        if removed > 0:
-            logger.warning(f"Removed {removed} duplicate rows")
-        return df_clean
+        """Remove duplicate rows, keeping first occurrence
+
+        When there are no duplicates the input frame itself is returned, not a
+        copy, so callers should rebind the result (df = deduplicate_rows(df))
+        rather than keep modifying the frame they passed in. When rows are
+        removed the result is a new frame and the input is left unchanged.
+        """
+        # duplicated() is a single hash pass; most files have no duplicates, so return
+        # the frame untouched instead of building a filtered copy
+        duplicates = df.duplicated(subset=subset, keep='first')
+        removed = int(duplicates.sum())
+        if not removed:
+            return df
+        logger.warning(f"Removed {removed} duplicate rows")
+        return df[~duplicates]
 
     @staticmethod
     def fix_malformed_csv(csv_path: Path, expected_columns: int) -> pd.DataFrame:
@@ -23,10 +23,18 @@ class MessageFilter:
         self.min_importance = filter_config.get('min_importance')
         self.exclude_deleted = filter_config.get('exclude_deleted', True)
 
+        # Set lookups for the isin() masks
+        self._excluded_types = frozenset(self.exclude_message_types)
+        self._excluded_senders = frozenset(self.exclude_sender_ids)
+
     def filter_messages(self, df: pd.DataFrame) -> pd.DataFrame:
         """
         Apply all configured filters to messages DataFrame
 
+        The filters are combined into a single boolean mask, so the frame is
+        indexed (and copied) once instead of once per filter. Each filter logs
+        only the rows that the filters before it had not already removed.
+
         Args:
             df: DataFrame containing messages data
 
@@ -34,39 +42,42 @@ class MessageFilter:
             Filtered DataFrame with excluded messages removed
         """
         initial_count = len(df)
-        filtered_df = df.copy()
+        keep = pd.Series(True, index=df.index)
 
         # Filter by message_type
-        if self.exclude_message_types:
-            before = len(filtered_df)
-            filtered_df = filtered_df[~filtered_df['message_type'].isin(self.exclude_message_types)]
-            excluded = before - len(filtered_df)
-            if excluded > 0:
-                logger.info(f"Filtered {excluded} messages by message_type (excluded types: {self.exclude_message_types})")
+        if self._excluded_types:
+            excluded = df['message_type'].isin(self._excluded_types)
+            count = (excluded & keep).sum()
+            if count:
+                logger.info(f"Filtered {count} messages by message_type (excluded types: {self.exclude_message_types})")
+            keep &= ~excluded
 
         # Filter by sender_id
-        if self.exclude_sender_ids:
-            before = len(filtered_df)
-            filtered_df = filtered_df[~filtered_df['sender_id'].isin(self.exclude_sender_ids)]
-            excluded = before - len(filtered_df)
-            if excluded > 0:
-                logger.info(f"Filtered {excluded} messages by sender_id (excluded IDs: {self.exclude_sender_ids})")
+        if self._excluded_senders:
+            excluded = df['sender_id'].isin(self._excluded_senders)
+            count = (excluded & keep).sum()
+            if count:
+                logger.info(f"Filtered {count} messages by sender_id (excluded IDs: {self.exclude_sender_ids})")
+            keep &= ~excluded
 
         # Filter by importance threshold
         if self.min_importance is not None:
-            before = len(filtered_df)
-            filtered_df = filtered_df[filtered_df['importance'] >= self.min_importance]
-            excluded = before - len(filtered_df)
-            if excluded > 0:
-                logger.info(f"Filtered {excluded} messages below importance threshold {self.min_importance}")
+            # Missing importance never passes the threshold
+            important = (df['importance'] >= self.min_importance).fillna(False)
+            count = (~important & keep).sum()
+            if count:
+                logger.info(f"Filtered {count} messages below importance threshold {self.min_importance}")
+            keep &= important
 
         # Filter deleted messages
-        if self.exclude_deleted and 'deleted' in filtered_df.columns:
-            before = len(filtered_df)
-            filtered_df = filtered_df[filtered_df['deleted'] == 0]
-            excluded = before - len(filtered_df)
-            if excluded > 0:
-                logger.info(f"Filtered {excluded} deleted messages")
+        if self.exclude_deleted and 'deleted' in df.columns:
+            live = (df['deleted'] == 0).fillna(False)
+            count = (~live & keep).sum()
+            if count:
+                logger.info(f"Filtered {count} deleted messages")
+            keep &= live
+
+        filtered_df = df[keep]
 
         total_filtered = initial_count - len(filtered_df)
         if total_filtered > 0:
@@ -0,0 +1,35 @@
+"""
+Shared fixtures for the loader tests
+
+Loader constructors connect to the database, so tests build loaders with
+__new__ and hand them fakes for whatever the code under test touches.
+"""
+import pytest
+
+
+@pytest.fixture
+def make_loader():
+    """Factory for a loader built without __init__
+
+    make_loader(LoaderClass, db=..., staging_mgr=..., **attrs) sets db and
+    staging_mgr (None unless given), fresh stats counters, and a
+    _record_file_completion that appends each status to loader.recorded.
+    Any other keyword is set as an attribute, so methods can be stubbed too.
+    ReferenceLoader instances given a csv_filename get its config.
+    """
+    def factory(loader_cls, db=None, staging_mgr=None, **attrs):
+        loader = loader_cls.__new__(loader_cls)
+        loader.db = db
+        loader.staging_mgr = staging_mgr
+        loader.batch_id = 'test'
+        loader.stats = {'rows_read': 0, 'rows_inserted': 0, 'rows_updated': 0, 'errors': 0}
+        loader.recorded = []
+        loader._record_file_completion = lambda path, status, error=None: loader.recorded.append(status)
+        reference_tables = getattr(loader_cls, 'REFERENCE_TABLES', None)
+        if reference_tables is not None and 'csv_filename' in attrs:
+            loader.config = reference_tables.get(attrs['csv_filename'], {})
+        for name, value in attrs.items():
+            setattr(loader, name, value)
+        return loader
+
+    return factory
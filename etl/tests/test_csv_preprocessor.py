@@ -0,0 +1,26 @@
+"""
+Tests for CSV preprocessing
+"""
+import pandas as pd
+
+from src.utils.csv_preprocessor import CSVPreprocessor
+
+
+def test_deduplicate_without_duplicates_returns_the_input_frame():
+    df = pd.DataFrame({'player_id': [1, 2, 3], 'year': [2024, 2024, 2024]})
+
+    result = CSVPreprocessor.deduplicate_rows(df, subset=['player_id', 'year'])
+
+    # No copy is made when nothing is removed - the result aliases the input
+    assert result is df
+
+
+def test_deduplicate_with_duplicates_returns_a_new_frame():
+    df = pd.DataFrame({'player_id': [1, 2, 1], 'year': [2024, 2024, 2024], 'g': [10, 20, 30]})
+
+    result = CSVPreprocessor.deduplicate_rows(df, subset=['player_id', 'year'])
+
+    assert result is not df
+    assert result['g'].tolist() == [10, 20]
+    # The input is left as it was
+    assert len(df) == 3
@@ -0,0 +1,53 @@
+"""
+Tests for streaming a DataFrame to COPY as CSV
+
+Whatever sizes COPY reads with and however the frame is sliced, the stream
+must produce exactly what a single to_csv call would.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.database.staging import DataFrameCSVStream
+
+
+def make_frame():
+    return pd.DataFrame({
+        'player_id': pd.array([1, 2, None, 4, 5], dtype='Int64'),
+        'name': ['Ruth', 'Gehrig, Lou', 'say "hi"', None, 'multi\nline'],
+        'avg': [0.342, np.nan, 0.25, 0.0, 1.0],
+    })
+
+
+def read_all(stream, size):
+    parts = []
+    while True:
+        data = stream.read(size)
+        if not data:
+            return ''.join(parts)
+        assert len(data) <= size
+        parts.append(data)
+
+
+@pytest.mark.parametrize('chunk_rows', [1, 2, 50_000])
+def test_read_everything_matches_to_csv(chunk_rows):
+    df = make_frame()
+
+    assert DataFrameCSVStream(df, chunk_rows=chunk_rows).read() == df.to_csv(index=False, header=False)
+
+
+@pytest.mark.parametrize('size', [1, 3, 7, 8192])
+@pytest.mark.parametrize('chunk_rows', [1, 2, 50_000])
+def test_small_reads_match_to_csv(size, chunk_rows):
+    df = make_frame()
+
+    assert read_all(DataFrameCSVStream(df, chunk_rows=chunk_rows), size) == df.to_csv(index=False, header=False)
+
+
+def test_empty_frame_streams_nothing():
+    df = make_frame().iloc[0:0]
+    stream = DataFrameCSVStream(df)
+
+    assert df.to_csv(index=False, header=False) == ''
+    assert stream.read(10) == ''
+    assert stream.read() == ''
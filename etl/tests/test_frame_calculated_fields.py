@@ -0,0 +1,79 @@
+"""
+Tests for applying simple calculated fields to the frame before COPY
+
+Each supported shape must give the same result as Postgres would for the
+SQL expression, including NULL inputs; anything else is left for the SQL pass.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from src.loaders.batting_stats_loader import BattingStatsLoader
+
+
+@pytest.fixture
+def apply(make_loader):
+    def apply(fields, df):
+        loader = make_loader(BattingStatsLoader, get_calculated_fields=lambda: fields)
+        return loader._apply_frame_calculated_fields(df)
+    return apply
+
+
+def test_nullif_zero_on_integers_keeps_nulls_and_stays_integral(apply):
+    df = pd.DataFrame({'city_id': [0, 7, 0]})
+
+    result, remaining = apply({'city_id': 'NULLIF(city_id, 0)'}, df)
+
+    assert remaining == {}
+    assert str(result['city_id'].dtype) == 'Int64'
+    assert result['city_id'].isna().tolist() == [True, False, True]
+    assert result['city_id'][1] == 7
+
+
+def test_nullif_zero_propagates_existing_nulls(apply):
+    # NULLIF(NULL, 0) is NULL, for nullable integers and floats alike
+    df = pd.DataFrame({
+        'park_id': pd.array([0, None, 3], dtype='Int32'),
+        'nation_id': [0.0, np.nan, 2.0],
+    })
+
+    result, _ = apply({'park_id': 'nullif( park_id , 0 )', 'nation_id': 'NULLIF(nation_id, 0)'}, df)
+
+    assert result['park_id'].isna().tolist() == [True, True, False]
+    assert result['nation_id'].isna().tolist() == [True, True, False]
+
+
+def test_blank_default_replaces_empty_and_null_only(apply):
+    # CASE WHEN col = '' OR col IS NULL THEN 'X' ELSE col END - a NULL col makes
+    # the OR true, so NULL and '' both take the default
+    df = pd.DataFrame({'abbr': ['', None, 'BOS', ' ']})
+
+    result, remaining = apply(
+        {'abbr': "CASE WHEN abbr = '' OR abbr IS NULL THEN 'UNK' ELSE abbr END"}, df
+    )
+
+    assert remaining == {}
+    assert result['abbr'].tolist() == ['UNK', 'UNK', 'BOS', ' ']
+
+
+def test_other_expressions_are_left_for_sql(apply):
+    # Division guards and cross-column expressions are evaluated by Postgres, never in pandas
+    fields = {
+        'batting_average': 'CASE WHEN ab > 0 THEN ROUND(h::numeric / ab, 3) ELSE 0 END',
+        'league_id': 'NULLIF(parent_league_id, 0)',
+        'missing_col': 'NULLIF(missing_col, 0)',
+    }
+    df = pd.DataFrame({'batting_average': [0.0], 'league_id': [0], 'ab': [0], 'h': [0]})
+
+    result, remaining = apply(fields, df)
+
+    assert remaining == fields
+    pd.testing.assert_frame_equal(result, df)
+
+
+def test_input_frame_is_not_modified(apply):
+    df = pd.DataFrame({'city_id': [0, 1]})
+
+    apply({'city_id': 'NULLIF(city_id, 0)'}, df)
+
+    assert df['city_id'].tolist() == [0, 1]
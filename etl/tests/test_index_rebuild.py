@@ -0,0 +1,126 @@
+"""
+Tests for dropping and rebuilding secondary indexes around bulk loads
+
+The database is faked: it tracks which indexes exist and whether each is valid.
+"""
+import pytest
+
+from src.loaders.batting_stats_loader import BattingStatsLoader
+
+
+class FakeResult:
+    def __init__(self, rows):
+        self._rows = rows
+
+    def fetchall(self):
+        return self._rows
+
+
+class FakeIndexDB:
+    """Index catalog: name -> valid flag; CREATE statements in fail_on raise"""
+
+    def __init__(self, indexes, fail_on=(), fail_drop_on=()):
+        self.indexes = dict(indexes)
+        self.definitions = {name: f"CREATE INDEX {name} ON t USING btree (c)" for name in indexes}
+        self.fail_on = set(fail_on)
+        self.fail_drop_on = set(fail_drop_on)
+        self.statements = []
+
+    def execute_sql(self, sql, params=None):
+        sql = str(sql)
+        if 'pg_get_indexdef' in sql:
+            return FakeResult([(name, self.definitions[name]) for name in self.indexes])
+        if 'indisvalid' in sql:
+            return FakeResult([(n, self.indexes[n]) for n in params['names'] if n in self.indexes])
+        raise AssertionError(f"unexpected SQL: {sql}")
+
+    def execute_autocommit(self, sql, params=None):
+        self._run(str(sql))
+
+    def execute_raw(self, sql, params=None):
+        self._run(sql)
+        return 0
+
+    def _run(self, sql):
+        self.statements.append(sql)
+        name = sql.split()[-1] if sql.startswith('DROP') else sql.split()[2]
+        if sql.startswith('DROP'):
+            if name in self.fail_drop_on:
+                raise RuntimeError(f"cannot drop {name}")
+            self.indexes.pop(name, None)
+        else:
+            if name in self.fail_on:
+                raise RuntimeError(f"cannot build {name}")
+            if name in self.indexes:
+                raise RuntimeError(f"relation {name} already exists")
+            self.indexes[name] = True
+
+
+def test_drop_then_recreate_restores_indexes_from_their_definitions(make_loader):
+    fake_db = FakeIndexDB({'idx_a': True, 'idx_b': True})
+    loader = make_loader(BattingStatsLoader, db=fake_db)
+
+    index_defs = loader._drop_secondary_indexes('t')
+    assert fake_db.indexes == {}
+
+    loader._recreate_indexes(index_defs)
+    assert fake_db.indexes == {'idx_a': True, 'idx_b': True}
+    # Definitions are run verbatim - no CONCURRENTLY / IF NOT EXISTS rewrite
+    assert "CREATE INDEX idx_a ON t USING btree (c)" in fake_db.statements
+
+
+def test_recreate_replaces_invalid_index_and_keeps_valid_one(make_loader):
+    fake_db = FakeIndexDB({'idx_valid': True, 'idx_invalid': False})
+    loader = make_loader(BattingStatsLoader, db=fake_db)
+    index_defs = [(name, fake_db.definitions[name]) for name in ('idx_valid', 'idx_invalid')]
+
+    loader._recreate_indexes(index_defs)
+
+    assert fake_db.indexes == {'idx_valid': True, 'idx_invalid': True}
+    assert "DROP INDEX IF EXISTS idx_invalid" in fake_db.statements
+    assert not any('idx_valid' in sql for sql in fake_db.statements)
+
+
+def test_recreate_raises_when_an_index_cannot_be_rebuilt(make_loader):
+    fake_db = FakeIndexDB({'idx_a': True, 'idx_b': True}, fail_on={'idx_a'})
+    loader = make_loader(BattingStatsLoader, db=fake_db)
+    index_defs = loader._drop_secondary_indexes('t')
+
+    with pytest.raises(RuntimeError, match='idx_a'):
+        loader._recreate_indexes(index_defs)
+    # The other index is still rebuilt
+    assert fake_db.indexes == {'idx_b': True}
+
+
+def test_failed_drop_restores_indexes_already_dropped(make_loader):
+    fake_db = FakeIndexDB({'idx_a': True, 'idx_b': True}, fail_drop_on={'idx_b'})
+    loader = make_loader(BattingStatsLoader, db=fake_db)
+
+    with pytest.raises(RuntimeError, match='cannot drop idx_b'):
+        loader._drop_secondary_indexes('t')
+    assert fake_db.indexes == {'idx_a': True, 'idx_b': True}
+
+
+def test_indexes_come_back_when_the_upsert_fails(make_loader):
+    fake_db = FakeIndexDB({'idx_a': True})
+    loader = make_loader(BattingStatsLoader, db=fake_db)
+
+    def failing_upsert(staging_table, target_table):
+        assert fake_db.indexes == {}
+        raise RuntimeError("upsert failed")
+
+    loader._upsert_from_staging = failing_upsert
+    with pytest.raises(RuntimeError, match='upsert failed'):
+        loader._upsert_with_deferred_indexes('staging_t', 't', loader.INDEX_REBUILD_THRESHOLD)
+    assert fake_db.indexes == {'idx_a': True}
+
+
+def test_reference_tables_with_dependents_keep_their_indexes(make_loader):
+    from src.loaders.reference_loader import ReferenceLoader
+
+    def has_dependents(csv_filename):
+        return make_loader(ReferenceLoader, csv_filename=csv_filename)._has_dependents()
+
+    # teams.csv is joined by files loaded concurrently after it; history tables are leaves
+    assert has_dependents('teams.csv')
+    assert not has_dependents('trade_history.csv')
@@ -0,0 +1,45 @@
+"""
+Tests for the per-run table layout and upsert SQL caches shared by loaders
+"""
+from concurrent.futures import ThreadPoolExecutor
+
+from src.loaders.base_loader import BaseLoader
+from src.loaders.batting_stats_loader import BattingStatsLoader
+
+
+def make_batting_loader(make_loader, layouts, calls):
+    def get_column_types(table_name):
+        calls.append(table_name)
+        return dict(layouts[table_name])
+
+    return make_loader(BattingStatsLoader, _get_column_types=get_column_types)
+
+
+def test_target_layout_is_cached_until_the_run_caches_are_cleared(make_loader):
+    BaseLoader.clear_run_caches()
+    layouts = {'t': {'a': 'integer'}}
+    calls = []
+    loader = make_batting_loader(make_loader, layouts, calls)
+
+    assert loader._get_target_column_types('t') == {'a': 'integer'}
+    layouts['t'] = {'a': 'integer', 'b': 'text'}
+    assert loader._get_target_column_types('t') == {'a': 'integer'}
+    assert calls == ['t']
+
+    # A new run sees the migrated table
+    BaseLoader.clear_run_caches()
+    assert loader._get_target_column_types('t') == {'a': 'integer', 'b': 'text'}
+    assert calls == ['t', 't']
+    BaseLoader.clear_run_caches()
+
+
+def test_concurrent_lookups_share_one_cached_layout(make_loader):
+    BaseLoader.clear_run_caches()
+    calls = []
+    loader = make_batting_loader(make_loader, {'t': {'a': 'integer'}}, calls)
+
+    with ThreadPoolExecutor(max_workers=8) as executor:
+        results = list(executor.map(lambda _: loader._get_target_column_types('t'), range(32)))
+
+    assert all(result is results[0] for result in results)
+    BaseLoader.clear_run_caches()
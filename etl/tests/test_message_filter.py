@@ -0,0 +1,62 @@
+"""
+Tests for message filtering
+
+Rows are chosen so several filters match the same message and some
+columns hold NaN, which is where a combined mask can drift from
+filtering one step at a time.
+"""
+import numpy as np
+import pandas as pd
+import pytest
+from loguru import logger
+
+from src.utils.message_filter import MessageFilter
+
+
+@pytest.fixture
+def log_messages():
+    messages = []
+    sink_id = logger.add(lambda m: messages.append(m.record['message']), level='INFO')
+    yield messages
+    logger.remove(sink_id)
+
+
+def make_messages():
+    return pd.DataFrame({
+        'message_id':   [1, 2, 3, 4, 5, 6, 7],
+        'message_type': [1, 2, 2, np.nan, 3, 3, 3],
+        'sender_id':    [10, 99, 10, 10, 99, 10, 10],
+        'importance':   [5, 5, 0, 5, 5, np.nan, 5],
+        'deleted':      [0, 0, 1, 0, 0, 0, np.nan],
+    })
+
+
+def test_overlapping_and_nan_rows(log_messages):
+    message_filter = MessageFilter({
+        'exclude_message_types': [2],
+        'exclude_sender_ids': [99],
+        'min_importance': 1,
+    })
+
+    filtered = message_filter.filter_messages(make_messages())
+
+    # NaN message_type is not an excluded type; NaN importance or deleted never passes
+    assert filtered['message_id'].tolist() == [1, 4]
+    # Each filter counts only rows still kept by the filters before it,
+    # the same numbers as filtering one step at a time
+    assert log_messages == [
+        "Filtered 2 messages by message_type (excluded types: [2])",
+        "Filtered 1 messages by sender_id (excluded IDs: [99])",
+        "Filtered 1 messages below importance threshold 1",
+        "Filtered 1 deleted messages",
+        "Total messages filtered: 5 (7 -> 2)",
+    ]
+
+
+def test_no_filters_keep_every_row(log_messages):
+    df = make_messages().drop(columns='deleted')
+
+    filtered = MessageFilter({'exclude_deleted': False}).filter_messages(df)
+
+    assert filtered['message_id'].tolist() == df['message_id'].tolist()
+    assert log_messages == []
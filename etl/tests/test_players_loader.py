@@ -0,0 +1,185 @@
+"""
+Tests for the multi-table players load
+
+Run without a database: the engine is replaced by a fake that records
+whether each transaction committed or rolled back.
+"""
+from contextlib import contextmanager
+import threading
+
+import pandas as pd
+import pytest
+
+from src.loaders.players_loader import PlayersLoader
+
+
+class FakeConnection:
+    def __init__(self):
+        self.statements = []
+
+    def execute(self, statement, params=None):
+        self.statements.append(str(statement))
+
+
+class FakeEngine:
+    def __init__(self):
+        self.connections = []
+        self.outcomes = []
+
+    @contextmanager
+    def begin(self):
+        conn = FakeConnection()
+        self.connections.append(conn)
+        try:
+            yield conn
+        except Exception:
+            self.outcomes.append('rollback')
+            raise
+        self.outcomes.append('commit')
+
+
+class FakeDB:
+    def __init__(self):
+        self.engine = FakeEngine()
+
+
+@pytest.fixture
+def loader(make_loader):
+    """PlayersLoader on a fake engine, with the stub-row preflight stubbed out"""
+    no_stubs = lambda df, conn: None
+    return make_loader(
+        PlayersLoader, db=FakeDB(), current_season=2024,
+        _create_missing_nations=no_stubs, _create_missing_leagues=no_stubs, _create_missing_teams=no_stubs
+    )
+
+
+def write_players_csv(path):
+    rows = pd.DataFrame({col: [None, None] for col in PlayersLoader.CSV_COLUMNS})
+    rows['player_id'] = [1, 2]
+    rows['date_of_birth'] = ['1990-01-02', '0000-00-00']
+    rows.to_csv(path, index=False)
+
+
+def test_failed_dependent_load_is_recorded_and_raised(tmp_path, loader):
+    """Core commits first; a failing dependent table rolls back only its own transaction"""
+    csv_path = tmp_path / 'players.csv'
+    write_players_csv(csv_path)
+
+    loader._load_core_table = lambda df, conn: len(df)
+    loader._load_status_table = lambda df, conn: len(df)
+    loader._load_ratings_table = lambda df, conn: len(df)
+
+    def failing_contracts(df, conn):
+        raise RuntimeError("contracts COPY failed")
+
+    loader._load_contracts_table = failing_contracts
+
+    with pytest.raises(RuntimeError, match='contracts COPY failed'):
+        loader._handle_incremental_load(csv_path)
+
+    # Core committed before the dependents started; the file is left for the next run to retry
+    outcomes = loader.db.engine.outcomes
+    assert outcomes[0] == 'commit'
+    assert sorted(outcomes[1:]) == ['commit', 'commit', 'rollback']
+    assert loader.recorded == ['failed']
+
+
+def test_successful_load_commits_each_table(tmp_path, loader):
+    csv_path = tmp_path / 'players.csv'
+    write_players_csv(csv_path)
+
+    frames = {}
+    for table in ('core', 'status', 'contracts', 'ratings'):
+        def load(df, conn, table=table):
+            frames[table] = df
+            return len(df)
+        setattr(loader, f'_load_{table}_table', load)
+
+    assert loader._handle_incremental_load(csv_path)
+
+    # One transaction for core (with the stub rows), one per dependent table
+    assert loader.db.engine.outcomes == ['commit'] * 4
+    assert loader.recorded == ['success']
+    assert loader.stats['rows_inserted'] == 8
+    # Unparseable dates are loaded as NULL rather than failing the DATE COPY
+    assert frames['core']['date_of_birth'].isna().tolist() == [False, True]
+
+
+def test_dependent_tables_load_concurrently_on_their_own_connections(tmp_path, loader):
+    csv_path = tmp_path / 'players.csv'
+    write_players_csv(csv_path)
+
+    core_conns = []
+    loader._load_core_table = lambda df, conn: core_conns.append(conn) or len(df)
+
+    # All three dependents must be running at once to get past the barrier
+    barrier = threading.Barrier(3, timeout=5)
+    dependent_conns = {}
+    for table in ('status', 'contracts', 'ratings'):
+        def load(df, conn, table=table):
+            dependent_conns[table] = conn
+            barrier.wait()
+            return len(df)
+        setattr(loader, f'_load_{table}_table', load)
+
+    assert loader._handle_incremental_load(csv_path)
+
+    conns = list(dependent_conns.values())
+    assert len({id(conn) for conn in conns}) == 3
+    assert core_conns[0] not in conns
+    # Each dependent table ran in a transaction opened by _load_in_own_transaction
+    assert all('SET LOCAL synchronous_commit = off' in conn.statements for conn in conns)
+
+
+class StubConnection:
+    """Connection whose target table already holds `existing` IDs"""
+
+    def __init__(self, existing):
+        self.existing = set(existing)
+        self.inserts = []
+
+    @contextmanager
+    def begin_nested(self):
+        yield
+
+    def execute(self, statement, params=None):
+        sql = str(statement)
+        if 'EXCEPT' in sql:
+            return [(x,) for x in params['ids'] if x not in self.existing]
+        self.inserts.append((sql, params))
+
+
+def test_missing_stubs_insert_only_absent_ids(make_loader):
+    loader = make_loader(PlayersLoader)
+    df = pd.DataFrame({'team_id': [0, 5, 7, None], 'last_team_id': [7, 9, None, None]})
+    conn = StubConnection(existing={5})
+
+    loader._create_missing_teams(df, conn)
+
+    [(sql, params)] = conn.inserts
+    assert params == {'ids': [0, 7, 9], 'names': ['Free Agents', 'SPECIAL_7', 'SPECIAL_9'],
+                      'abbrs': ['FA', 'SP7', 'SP9']}
+    assert 'INSERT INTO teams' in sql and 'ON CONFLICT (team_id) DO NOTHING' in sql
+
+
+def test_missing_nation_stubs_skip_unknown_nation(make_loader):
+    loader = make_loader(PlayersLoader)
+    df = pd.DataFrame({'nation_id': [0, 3], 'second_nation_id': [None, 0]})
+    conn = StubConnection(existing=())
+
+    loader._create_missing_nations(df, conn)
+
+    [(sql, params)] = conn.inserts
+    assert params['ids'] == [3]
+    assert 'nation_id, name, abbreviation, continent_id' in sql
+
+
+def test_missing_stubs_error_does_not_raise(make_loader):
+    loader = make_loader(PlayersLoader)
+    conn = StubConnection(existing=())
+
+    def failing_execute(statement, params=None):
+        raise RuntimeError("permission denied")
+
+    conn.execute = failing_execute
+    loader._create_missing_leagues(pd.DataFrame({'league_id': [1]}), conn)
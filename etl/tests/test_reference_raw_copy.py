@@ -0,0 +1,38 @@
+"""
+Tests for the reference loader's raw COPY full-load path
+
+Eligibility and the SELECT that types the staged TEXT columns are checked
+without a database.
+"""
+from src.loaders.reference_loader import ReferenceLoader
+
+
+def test_quoted_empty_cells_do_not_block_raw_copy(tmp_path, make_loader):
+    csv_path = tmp_path / 'nations.csv'
+    csv_path.write_text("nation_id,name,abbreviation\n1,''," + "USA\n")
+
+    assert make_loader(ReferenceLoader, csv_filename='nations.csv')._can_copy_raw(csv_path)
+
+
+def test_raw_copy_is_decided_by_config_and_header(tmp_path, make_loader):
+    csv_path = tmp_path / 'cities.csv'
+    csv_path.write_text("city_id,name\n1,Boston\n")
+    # A column mapping needs the pandas path
+    assert not make_loader(ReferenceLoader, csv_filename='cities.csv')._can_copy_raw(csv_path)
+
+    loader = make_loader(ReferenceLoader, csv_filename='nations.csv')
+    csv_path.write_text("nation_id,Name\n1,Canada\n")
+    assert not loader._can_copy_raw(csv_path)
+    csv_path.write_text("")
+    assert not loader._can_copy_raw(csv_path)
+
+
+def test_raw_select_maps_empty_and_quoted_empty_to_null():
+    parts = ReferenceLoader._raw_select_parts(
+        ['name', 'nation_id'], {'name': 'text', 'nation_id': 'integer'}
+    )
+
+    assert parts == [
+        "NULLIF(NULLIF(name, ''), '''''')",
+        "CAST(NULLIF(NULLIF(nation_id, ''), '''''') AS integer)",
+    ]
@@ -0,0 +1,104 @@
+"""
+Tests for the reference loader's skip-if-unchanged check
+
+The metadata snapshot is filled in directly, so no database is needed;
+writes are collected in the pending-update batch.
+"""
+import os
+
+import pytest
+
+from src.loaders import reference_loader
+from src.loaders.reference_loader import ReferenceLoader
+
+
+@pytest.fixture
+def csv_path(tmp_path):
+    path = tmp_path / 'continents.csv'
+    path.write_text("continent_id,name\n1,Africa\n")
+    return path
+
+
+@pytest.fixture
+def hashes(monkeypatch):
+    """Records every file that gets fingerprinted"""
+    hashed = []
+
+    def fingerprint(path):
+        hashed.append(path)
+        return f"hash:{path.read_text()}"
+
+    monkeypatch.setattr(reference_loader, 'calculate_file_fingerprint', fingerprint)
+    return hashed
+
+
+@pytest.fixture
+def loader(monkeypatch, csv_path, make_loader):
+    monkeypatch.setattr(ReferenceLoader, '_checksum_cache', {})
+    monkeypatch.setattr(ReferenceLoader, '_stat_cache', {})
+    monkeypatch.setattr(ReferenceLoader, '_pending_checksum_updates', [])
+
+    loader = make_loader(ReferenceLoader, csv_filename=csv_path.name, checksum=None, full_loads=[])
+    loader._handle_full_load = lambda path: loader.full_loads.append(path) or True
+    return loader
+
+
+def store(csv_path, checksum, stat_key):
+    ReferenceLoader._checksum_cache[csv_path.name] = checksum
+    ReferenceLoader._stat_cache[csv_path.name] = stat_key
+
+
+def test_same_stat_skips_without_hashing(loader, csv_path, hashes):
+    store(csv_path, 'hash:old', ReferenceLoader._stat_key(csv_path))
+
+    assert ReferenceLoader.stat_unchanged(csv_path)
+    assert loader._handle_skip_strategy(csv_path)
+    assert hashes == []
+    assert loader.full_loads == []
+    assert loader.recorded == ['skipped']
+    assert ReferenceLoader._pending_checksum_updates == []
+
+
+def test_touched_file_with_same_hash_skips_and_records_new_stat(loader, csv_path, hashes):
+    old_stat = ReferenceLoader._stat_key(csv_path)
+    store(csv_path, f"hash:{csv_path.read_text()}", old_stat)
+    os.utime(csv_path, ns=(old_stat[1] + 10**9, old_stat[1] + 10**9))
+    new_stat = ReferenceLoader._stat_key(csv_path)
+
+    assert not ReferenceLoader.stat_unchanged(csv_path)
+    assert loader._handle_skip_strategy(csv_path)
+    assert hashes == [csv_path]
+    assert loader.full_loads == []
+    assert loader.recorded == ['skipped']
+    # The new mtime is stored, so the next run skips the hash
+    assert ReferenceLoader._stat_cache[csv_path.name] == new_stat
+    assert ReferenceLoader._pending_checksum_updates == [
+        (csv_path.name, f"hash:{csv_path.read_text()}", *new_stat, 'skip')
+    ]
+
+
+def test_changed_content_reloads(loader, csv_path, hashes):
+    store(csv_path, 'hash:old', (1, 1))
+    csv_path.write_text("continent_id,name\n1,Africa\n2,Asia\n")
+
+    assert loader._handle_skip_strategy(csv_path)
+    assert loader.full_loads == [csv_path]
+    assert ReferenceLoader._checksum_cache[csv_path.name] == f"hash:{csv_path.read_text()}"
+    assert ReferenceLoader._stat_cache[csv_path.name] == ReferenceLoader._stat_key(csv_path)
+
+
+def test_missing_stored_stat_falls_back_to_hash(loader, csv_path, hashes):
+    # Rows written before file_size/last_mtime_ns existed have NULL in both
+    store(csv_path, f"hash:{csv_path.read_text()}", (None, None))
+
+    assert not ReferenceLoader.stat_unchanged(csv_path)
+    assert loader._handle_skip_strategy(csv_path)
+    assert hashes == [csv_path]
+    assert loader.full_loads == []
+    assert loader.recorded == ['skipped']
+
+
+def test_new_file_without_checksum_loads(loader, csv_path, hashes):
+    assert not ReferenceLoader.stat_unchanged(csv_path)
+    assert loader._handle_skip_strategy(csv_path)
+    assert loader.full_loads == [csv_path]
@@ -0,0 +1,92 @@
+"""
+Tests for splitting large CSV files into segments for parallel COPY
+
+The split is pure file logic; the COPY itself is faked where needed.
+"""
+import pytest
+
+from src.database.staging import FileSegmentStream, StagingTableManager
+
+
+def write(tmp_path, content: bytes):
+    path = tmp_path / 'stats.csv'
+    path.write_bytes(content)
+    return path
+
+
+def segment_bytes(path, bounds):
+    with open(path, 'rb') as f:
+        return [FileSegmentStream(f, start, end).read() for start, end in bounds]
+
+
+def test_empty_file_has_no_segments(tmp_path):
+    path = write(tmp_path, b'')
+    assert StagingTableManager._csv_segment_bounds(path, 4) == []
+
+
+def test_header_only_file_has_no_segments(tmp_path):
+    assert StagingTableManager._csv_segment_bounds(write(tmp_path, b'a,b\n'), 4) == []
+    assert StagingTableManager._csv_segment_bounds(write(tmp_path, b'a,b'), 4) == []
+
+
+def test_fewer_lines_than_segments(tmp_path):
+    path = write(tmp_path, b'a,b\n1,2\n3,4\n')
+    bounds = StagingTableManager._csv_segment_bounds(path, 8)
+
+    assert len(bounds) <= 2
+    assert b''.join(segment_bytes(path, bounds)) == b'1,2\n3,4\n'
+
+
+def test_segments_hold_whole_lines_without_trailing_newline(tmp_path):
+    rows = [f'{i},{i * 10}'.encode() for i in range(100)]
+    path = write(tmp_path, b'a,b\n' + b'\n'.join(rows))
+    bounds = StagingTableManager._csv_segment_bounds(path, 4)
+
+    assert len(bounds) == 4
+    segments = segment_bytes(path, bounds)
+    assert b''.join(segments) == b'\n'.join(rows)
+    # Every segment but the last ends on a line boundary
+    assert all(segment.endswith(b'\n') for segment in segments[:-1])
+    assert [start for start, _ in bounds[1:]] == [end for _, end in bounds[:-1]]
+
+
+def test_file_segment_stream_reads_in_small_pieces(tmp_path):
+    path = write(tmp_path, b'0123456789')
+    with open(path, 'rb') as f:
+        stream = FileSegmentStream(f, 2, 7)
+        pieces = [stream.read(2) for _ in range(4)]
+    assert pieces == [b'23', b'45', b'6', b'']
+
+
+def test_quoted_fields_disable_the_split(tmp_path):
+    assert StagingTableManager._csv_has_quoted_fields(write(tmp_path, b'"a","b"\n1,"x\ny"\n'))
+    # A quoted header alone does not matter - it is skipped, not copied
+    assert not StagingTableManager._csv_has_quoted_fields(write(tmp_path, b'"a","b"\n1,2\n'))
+    assert not StagingTableManager._csv_has_quoted_fields(write(tmp_path, b''))
+
+
+class FakeDB:
+    def __init__(self):
+        self.statements = []
+
+    def execute_raw(self, sql, params=None):
+        self.statements.append(sql)
+        return 0
+
+
+def test_failed_segment_truncates_staging(tmp_path):
+    rows = b'\n'.join(f'{i},{i}'.encode() for i in range(50))
+    path = write(tmp_path, b'a,b\n' + rows + b'\n')
+    manager = StagingTableManager.__new__(StagingTableManager)
+    manager.db = FakeDB()
+    manager.PARALLEL_COPY_SEGMENTS = 4
+
+    def copy_segment(csv_path, start, end, copy_sql):
+        if start > 100:
+            raise RuntimeError("segment failed")
+        return 1
+
+    manager._copy_csv_segment = copy_segment
+    with pytest.raises(RuntimeError, match='segment failed'):
+        manager._copy_csv_file_segments(path, 'staging_t', ['a', 'b'])
+    assert manager.db.statements == ['TRUNCATE staging_t']
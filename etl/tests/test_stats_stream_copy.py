@@ -0,0 +1,118 @@
+"""
+Tests for streaming a career stats CSV into staging with COPY
+
+The real StagingTableManager runs against a fake connection that records
+the SQL it is sent and the bytes COPY reads from the file.
+"""
+from contextlib import contextmanager
+
+from src.database.staging import StagingTableManager
+from src.loaders.batting_stats_loader import BattingStatsLoader
+
+TARGET_TYPES = {
+    'player_id': 'integer', 'year': 'smallint', 'team_id': 'integer', 'split_id': 'smallint',
+    'stint': 'smallint', 'ab': 'smallint', 'h': 'smallint', 'war': 'double precision',
+    'sub_league_id': 'integer', 'batting_average': 'numeric',
+}
+
+
+class FakeCursor:
+    def __init__(self, db):
+        self.db = db
+        self.rowcount = 0
+
+    def execute(self, sql, params=None):
+        self.db.statements.append(sql)
+
+    def copy_expert(self, sql, f):
+        self.db.statements.append(sql)
+        self.db.copied.append(f.read())
+        self.rowcount = 2
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        return False
+
+
+class FakeRawConnection:
+    def __init__(self, db):
+        self.db = db
+
+    def cursor(self):
+        return FakeCursor(self.db)
+
+    def commit(self):
+        pass
+
+    def rollback(self):
+        pass
+
+    def close(self):
+        pass
+
+
+class FakeDB:
+    def __init__(self):
+        self.statements = []
+        self.copied = []
+        self.engine = self
+
+    def raw_connection(self):
+        return FakeRawConnection(self)
+
+    def execute_sql(self, sql, params=None):
+        self.statements.append(str(sql))
+
+    def execute_raw(self, sql, params=None):
+        self.statements.append(sql)
+        return 0
+
+
+def make_batting_loader(make_loader, fake_db):
+    staging_mgr = StagingTableManager.__new__(StagingTableManager)
+    staging_mgr.db = fake_db
+    return make_loader(BattingStatsLoader, db=fake_db, staging_mgr=staging_mgr,
+                       _get_target_column_types=lambda table: TARGET_TYPES)
+
+
+def test_float_formatted_counts_are_staged_as_numeric(tmp_path, make_loader):
+    csv_path = tmp_path / 'players_career_batting_stats.csv'
+    csv_path.write_text(
+        "player_id,year,team_id,split_id,stint,ab,h,war,league_id\n"
+        "1,2024,10,1,1,3.0,1,0.5,100\n"
+        "2,2024,10,2,1,4,2.0,1.5,100\n"
+    )
+    fake_db = FakeDB()
+    loader = make_batting_loader(make_loader, fake_db)
+
+    assert loader._stream_copy_csv(csv_path, 'staging_t', where='split_id = 1') == 2
+
+    create_sql = next(sql for sql in fake_db.statements if 'CREATE UNLOGGED TABLE' in sql)
+    # Integer target columns take NUMERIC so "3.0" is accepted; others keep their type
+    assert 'ab NUMERIC' in create_sql and 'split_id NUMERIC' in create_sql
+    assert 'war DOUBLE PRECISION' in create_sql
+    assert 'league_id TEXT' in create_sql
+
+    copy_sql = next(sql for sql in fake_db.statements if sql.startswith('COPY'))
+    assert copy_sql == (
+        "COPY staging_t (player_id, year, team_id, split_id, stint, ab, h, war, league_id) "
+        "FROM STDIN WITH (FORMAT csv, FREEZE true) WHERE split_id = 1"
+    )
+    # The header is skipped and the rows go to Postgres exactly as written
+    assert fake_db.copied == [b"1,2024,10,1,1,3.0,1,0.5,100\n2,2024,10,2,1,4,2.0,1.5,100\n"]
+
+
+def test_upsert_casts_numeric_staging_back_to_integer_targets(make_loader):
+    loader = make_batting_loader(make_loader, FakeDB())
+    staging_types = {col: 'numeric' for col in ('player_id', 'year', 'team_id', 'split_id', 'stint', 'ab', 'h')}
+    staging_types['war'] = 'double precision'
+
+    sql = loader._build_upsert_sql('staging_t', 'players_career_batting_stats', staging_types)
+
+    assert 's.ab::SMALLINT AS ab' in sql
+    assert 's.player_id::INTEGER AS player_id' in sql
+    assert 's.war AS war' in sql
+    # Rate stats still read the staged counts directly
+    assert 'ROUND(h::numeric / ab, 3)' in sql
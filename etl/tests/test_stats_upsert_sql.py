@@ -0,0 +1,32 @@
+"""
+Tests for the upsert SQL built by the career stats loaders
+"""
+from src.loaders.batting_stats_loader import BattingStatsLoader
+from src.loaders.pitching_stats_loader import PitchingStatsLoader
+
+KEYS = {'player_id': 'integer', 'year': 'integer', 'team_id': 'integer', 'split_id': 'integer', 'stint': 'integer'}
+
+
+def build_sql(make_loader, loader_cls, target_table):
+    target = {**KEYS, 'sub_league_id': 'integer'}
+    loader = make_loader(loader_cls, _get_target_column_types=lambda table: target)
+    return loader._build_upsert_sql(f'staging_{target_table}', target_table, dict(KEYS))
+
+
+def test_batting_and_pitching_resolve_sub_league_id_the_same_way(make_loader):
+    batting = build_sql(make_loader, BattingStatsLoader, 'players_career_batting_stats')
+    pitching = build_sql(make_loader, PitchingStatsLoader, 'players_career_pitching_stats')
+
+    join = "ORDER BY team_id, league_id, sub_league_id, division_id"
+    for sql in (batting, pitching):
+        assert "tr.sub_league_id AS sub_league_id" in sql
+        assert join in sql
+
+
+def test_staged_sub_league_id_skips_the_join(make_loader):
+    target = {**KEYS, 'sub_league_id': 'integer'}
+    loader = make_loader(BattingStatsLoader, _get_target_column_types=lambda table: target)
+    sql = loader._build_upsert_sql('staging_x', 'players_career_batting_stats', dict(target))
+
+    assert "team_relations" not in sql
+    assert "s.sub_league_id AS sub_league_id" in sql